@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import BattleStatus, BattleRoom, BattleResult
+from config.admin import LargeTableAdminMixin
+from .cache import invalidate_lobby
+from .models import BattleStatus, BattleRoom, BattleResult, BattleParticipant
 
 
 @admin.register(BattleStatus)
@@ -9,16 +11,33 @@ class BattleStatusAdmin(admin.ModelAdmin):
     search_fields = ('name',)
 
 
+class BattleParticipantInline(admin.TabularInline):
+    """다인 방 참가자 (BattleRoom 수정 화면)"""
+    model = BattleParticipant
+    extra = 0
+    autocomplete_fields = ('user',)
+    readonly_fields = ('joined_at',)
+
+
 @admin.register(BattleRoom)
-class BattleRoomAdmin(admin.ModelAdmin):
+class BattleRoomAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     """대결방 Admin 설정"""
     list_display = ('id', 'title', 'is_cote', 'host', 'guest', 'status', 'is_private',)
     list_filter = ('is_cote', 'status', 'is_private',)
-    search_fields = ('title', 'host__email',)
+    list_select_related = ('host', 'guest', 'status')
+    search_fields = ('id', 'host__email', 'guest__email')
+    search_id_fields = ('id',)
+    search_user_fields = ('host', 'guest')
+    # battleroom_title_idx 로 제목 접두사 검색 (@ 가 있으면 이메일 앞부분)
+    search_text_fields = ('title__startswith',)
+    search_help_text = '방 번호, 제목 앞부분 또는 호스트/게스트 이메일 앞부분(@ 포함)'
     fieldsets = (
         ('기본 정보', {
             'fields': ('title', 'is_cote', 'host', 'guest', 'status')
         }),
+        ('다인 방', {
+            'fields': ('capacity', 'deadline')
+        }),
         ('비공개 설정', {
             'fields': ('is_private', 'private_password')
         }),
@@ -26,15 +45,27 @@ class BattleRoomAdmin(admin.ModelAdmin):
             'fields': ('problems',)
         }),
     )
-    filter_horizontal = ('problems',)
+    # 사용자/문제 전체를 select 로 그리지 않도록 검색형 위젯 사용
+    autocomplete_fields = ('host', 'guest', 'problems')
+    inlines = (BattleParticipantInline,)
+
+    def save_related(self, request, form, formsets, change):
+        """문제 연결 변경을 로비 목록에 반영"""
+        super().save_related(request, form, formsets, change)
+        invalidate_lobby()
 
 
 @admin.register(BattleResult)
-class BattleResultAdmin(admin.ModelAdmin):
+class BattleResultAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     """대결 결과 Admin 설정"""
-    list_display = ('id', 'room', 'user', 'remaining_time_percent', 'accuracy_percent', 'total_score', 'result', 'submitted_at')
+    list_display = ('id', 'room', 'user', 'remaining_time_percent', 'accuracy_percent', 'total_score', 'result', 'rank', 'submitted_at')
     list_filter = ('result', 'submitted_at')
-    search_fields = ('room__title', 'user__email')
+    # room 표시(__str__)에 호스트 이메일이 포함됨
+    list_select_related = ('room__host', 'user')
+    search_fields = ('id', 'room__id', 'user__email')
+    search_id_fields = ('id', 'room_id')
+    search_user_fields = ('user',)
+    search_text_fields = ('room__title__startswith',)
+    search_help_text = '결과 번호/방 번호, 방 제목 앞부분 또는 사용자 이메일 앞부분(@ 포함)'
     readonly_fields = ('submitted_at',)
-
-
+    autocomplete_fields = ('room', 'user')
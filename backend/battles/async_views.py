@@ -0,0 +1,202 @@
+"""
+ASGI 모드용 비동기 폴링 뷰 (settings.ASYNC_VIEWS = True 일 때 battles/urls.py 에서 사용)
+
+대결 화면은 2~3초마다 방 상세/결과를, 로비는 방 목록을 폴링합니다.
+동기 DRF 뷰는 요청 하나가 워커 하나를 붙잡지만, 이 뷰들은 Django 비동기 ORM으로
+이벤트 루프에서 처리되어 워커 하나가 많은 폴링 연결을 동시에 감당합니다.
+
+- GET 만 비동기로 처리하고, 같은 URL의 POST/DELETE 는 기존 DRF 뷰로 넘김
+  (로비 목록은 응답 캐시/ETag 를 공유하도록 GET 도 DRF 뷰로 넘김)
+- 응답 본문/상태 코드는 기존 DRF 뷰와 동일
+"""
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from config.db_router import use_primary
+from config.metrics import BATTLE_POLLS
+from .models import BattleRoom, BattleResult
+from .serializers import (
+    BattleRoomDetailSerializer,
+    BattleResultSerializer,
+)
+from . import views
+from .spectate import SpectatorLimit, hub
+
+
+_renderer = JSONRenderer()
+_authentication = JWTAuthentication()
+
+_sync_room_list_create = sync_to_async(views.BattleRoomListCreateView.as_view())
+_sync_room_retrieve_destroy = sync_to_async(views.BattleRoomRetrieveDestroyView.as_view())
+_sync_get_battle_result = sync_to_async(views.get_battle_result)
+
+
+def json_response(data, status_code=status.HTTP_200_OK, allow='GET', headers=None):
+    """DRF Response 와 같은 형식의 JSON 응답"""
+    response = HttpResponse(
+        _renderer.render(data),
+        content_type='application/json',
+        status=status_code,
+        headers=headers,
+    )
+    response['Allow'] = allow
+    response['Vary'] = 'Accept'
+    return response
+
+
+def error_response(exc, allow='GET'):
+    """DRF 기본 exception_handler 와 같은 형식의 오류 응답"""
+    data = exc.detail if isinstance(exc.detail, dict) else {'detail': exc.detail}
+    headers = None
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        headers = {'WWW-Authenticate': _authentication.authenticate_header(None)}
+    return json_response(data, exc.status_code, allow=allow, headers=headers)
+
+
+def not_found(model):
+    return exceptions.NotFound(f'No {model._meta.object_name} matches the given query.')
+
+
+async def authenticate(request):
+    """JWT 인증 (IsAuthenticated 와 동일하게 인증 실패 시 예외)"""
+    result = await sync_to_async(_authentication.authenticate)(request)
+    if result is None:
+        raise exceptions.NotAuthenticated()
+    return result[0]
+
+
+@csrf_exempt
+async def room_list_create(request):
+    """
+    GET/POST /api/battles/rooms/ - BattleRoomListCreateView 로 처리
+    로비 GET 은 동기 뷰의 버전 캐시/ETag(LOBBY_CACHE)를 그대로 써야 하므로
+    비동기 ORM 으로 따로 조회하지 않음 (캐시 적중이나 304 면 DB 조회 없음)
+    """
+    return await _sync_room_list_create(request)
+
+
+@csrf_exempt
+async def room_retrieve_destroy(request, id):
+    """
+    GET /api/battles/rooms/{id}/ - 대결방 상세 (비동기)
+    DELETE 는 BattleRoomRetrieveDestroyView 로 처리
+    """
+    if request.method != 'GET':
+        return await _sync_room_retrieve_destroy(request, id=id)
+
+    allow = 'GET, DELETE, HEAD, OPTIONS'
+    BATTLE_POLLS.labels('room-detail').inc()
+    room = await BattleRoom.objects.select_related(
+        'host', 'status'
+    ).prefetch_related('problems').filter(id=id).afirst()
+    if room is None:
+        return error_response(not_found(BattleRoom), allow=allow)
+    if room.is_group:
+        # 다인 방은 참가자 목록을 serializer 에서 조회
+        data = await sync_to_async(lambda: BattleRoomDetailSerializer(room).data)()
+        return json_response(data, allow=allow)
+    return json_response(BattleRoomDetailSerializer(room).data, allow=allow)
+
+
+@use_primary  # 조회 중 승패를 저장하므로 복제본이 아닌 primary 에서 읽음
+@csrf_exempt
+async def get_battle_result(request, room_id):
+    """GET /api/battles/rooms/{room_id}/result/ - 대결 결과 조회 (비동기)"""
+    if request.method != 'GET':
+        return await _sync_get_battle_result(request, room_id=room_id)
+
+    allow = 'GET, OPTIONS'
+    try:
+        user = await authenticate(request)
+    except exceptions.APIException as exc:
+        return error_response(exc, allow=allow)
+
+    room = await BattleRoom.objects.filter(id=room_id).only('id', 'host_id', 'guest_id', 'capacity').afirst()
+    if room is not None and room.is_group:
+        # 다인 방 순위 확정은 잠금/트랜잭션을 쓰는 동기 뷰에서 처리 (폴링 횟수도 거기서 셈)
+        return await _sync_get_battle_result(request, room_id=room_id)
+    BATTLE_POLLS.labels('result').inc()
+    if room is None:
+        return error_response(not_found(BattleRoom), allow=allow)
+
+    # 참가자 확인
+    if user.id not in (room.host_id, room.guest_id):
+        return json_response(
+            {'error': '이 대결방의 참가자가 아닙니다.'},
+            status.HTTP_403_FORBIDDEN, allow=allow,
+        )
+
+    # 내 결과와 상대방 결과를 한 번에 조회
+    opponent_id = room.guest_id if user.id == room.host_id else room.host_id
+    results = {
+        result.user_id: result
+        async for result in BattleResult.objects.select_related('user').filter(room_id=room.id)
+    }
+    my_result = results.get(user.id)
+    opponent_result = results.get(opponent_id) if opponent_id else None
+
+    # 승패 판단 로직 (한 사람만 제출한 경우)
+    if my_result and not opponent_result:
+        my_result.result = 'win'
+        await my_result.asave()
+    elif not my_result and opponent_result:
+        opponent_result.result = 'win'
+        await opponent_result.asave()
+    elif not my_result and not opponent_result:
+        return json_response({
+            'message': '아직 결과가 제출되지 않았습니다.',
+            'my_result': None,
+            'opponent_result': None,
+            'is_complete': False,
+            'result': 'draw'
+        }, allow=allow)
+
+    # 둘 다 제출한 경우 승패 판단
+    if my_result and opponent_result and (not my_result.result or not opponent_result.result):
+        views.decide_result(my_result, opponent_result)
+        await my_result.asave()
+        await opponent_result.asave()
+
+    response_data = {
+        'my_result': BattleResultSerializer(my_result).data if my_result else None,
+        'opponent_result': BattleResultSerializer(opponent_result).data if opponent_result else None,
+        'is_complete': my_result is not None and opponent_result is not None
+    }
+    if my_result and opponent_result:
+        response_data['my_result_status'] = my_result.result
+        response_data['opponent_result_status'] = opponent_result.result
+
+    return json_response(response_data, allow=allow)
+
+
+@csrf_exempt
+async def watch_room(request, room_id):
+    """
+    GET /api/battles/rooms/{room_id}/watch/ - 관전 SSE 스트림 (비동기)
+    event: state 로 방 상태 전체를, 방이 종료되면 event: end 를 보냄 (battles/spectate.py)
+    """
+    allow = 'GET, OPTIONS'
+    if request.method != 'GET':
+        return error_response(exceptions.MethodNotAllowed(request.method), allow=allow)
+    if not await BattleRoom.objects.filter(id=room_id, is_private=False).aexists():
+        return json_response(
+            {'error': '관전할 수 있는 대결방이 없습니다.'},
+            status.HTTP_404_NOT_FOUND, allow=allow,
+        )
+    try:
+        feed, subscriber = hub.subscribe(room_id)
+    except SpectatorLimit:
+        return json_response(
+            {'error': '관전자 수가 가득 찼습니다. 잠시 후 다시 시도해 주세요.'},
+            status.HTTP_503_SERVICE_UNAVAILABLE, allow=allow,
+            headers={'Retry-After': '10'},
+        )
+    response = StreamingHttpResponse(hub.stream(feed, subscriber), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # 프록시(nginx 등)가 이벤트를 모아 두지 않도록
+    response['X-Accel-Buffering'] = 'no'
+    return response
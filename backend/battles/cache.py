@@ -0,0 +1,18 @@
+from django.db import transaction
+
+from config.caching import bump_version
+
+
+# 로비 목록 캐시 namespace / 시간 (초)
+# 방/문제가 바뀌면 signals.py 에서 버전을 올려 즉시 무효화하므로 TTL 은 안전장치
+LOBBY_CACHE = 'battles:lobby'
+LOBBY_CACHE_TIMEOUT = 10
+
+
+def invalidate_lobby():
+    """
+    로비 목록 캐시와 ETag 무효화 (트랜잭션 안이면 커밋 후)
+    커밋 전에 버전을 올리면 동시 GET 이 커밋 전 행을 새 버전으로 캐시해
+    다음 변경까지 오래된 목록과 304 를 돌려주므로 항상 커밋 뒤에 올림
+    """
+    transaction.on_commit(lambda: bump_version(LOBBY_CACHE))
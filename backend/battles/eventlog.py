@@ -0,0 +1,153 @@
+"""
+대결 이벤트 로그 (문항별 답안/시간, 연결 끊김 등)
+
+이벤트마다 행을 쓰지 않고 프로세스 메모리에 방별로 모았다가 묶음(BattleEventChunk) 하나로 저장합니다.
+- 이벤트 하나는 고정 길이 18바이트 레코드 (RECORD), 묶음은 레코드를 이어 붙여 zlib 압축
+- 저장 시점: 방 하나가 EVENT_LOG_FLUSH_EVENTS 개 이상 / 가장 오래된 이벤트가 EVENT_LOG_FLUSH_SECONDS 초 이상 /
+  대결 종료(battle_finished) / 프로세스 종료 - 버퍼에 있는 모든 방을 bulk_create 한 번으로 저장
+- 묶음은 추가만 하고 수정하지 않음 (워커 프로세스마다 따로 묶음을 만듦)
+
+    event_buffer.append(room.id, user.id, 'answer', problem_id=3, correct=True, value=5230)
+    for event in iter_events(room.id):   # 묶음을 하나씩 풀면서 시각순으로 생성
+        ...
+
+프로세스가 비정상 종료되면 아직 저장하지 않은 이벤트는 잃을 수 있습니다 (분석용 기록).
+"""
+import atexit
+import heapq
+import logging
+import struct
+import threading
+import time
+import zlib
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.db import DatabaseError
+
+from .models import BattleEventChunk, BattleRoom
+
+
+logger = logging.getLogger(__name__)
+
+# 묶음 시작 기준 ms (uint32), 사용자 id (uint32), 종류 (uint8), 문제 id (uint32, 없으면 0),
+# 정답 여부 (uint8), 값 (int32, answer 는 풀이 시간 ms, submit 은 점수)
+RECORD = struct.Struct('<IIBIBi')
+
+EVENT_KINDS = {
+    'join': 1,
+    'answer': 2,
+    'disconnect': 3,
+    'reconnect': 4,
+    'submit': 5,
+}
+_kind_names = {code: name for name, code in EVENT_KINDS.items()}
+
+BattleEvent = namedtuple('BattleEvent', 'at user_id kind problem_id correct value')
+
+
+def encode(records):
+    """(ms, user_id, kind, problem_id, correct, value) 목록 -> 압축된 묶음 바이트"""
+    packed = bytearray(RECORD.size * len(records))
+    for index, record in enumerate(records):
+        RECORD.pack_into(packed, index * RECORD.size, *record)
+    return zlib.compress(bytes(packed), 1)
+
+
+def decode(chunk):
+    """묶음 하나의 이벤트를 순서대로 생성 (레코드 단위로 풀어 냄)"""
+    started_at = chunk.started_at
+    for offset_ms, user_id, kind, problem_id, correct, value in RECORD.iter_unpack(zlib.decompress(chunk.data)):
+        yield BattleEvent(
+            started_at + timedelta(milliseconds=offset_ms),
+            user_id, _kind_names.get(kind, kind), problem_id or None, bool(correct), value,
+        )
+
+
+def iter_events(room_id):
+    """
+    방의 모든 이벤트를 시각순으로 생성
+    프로세스별 묶음은 시간이 겹칠 수 있으므로 묶음별 생성기를 병합 (묶음 전체를 미리 풀지 않음)
+    """
+    chunks = BattleEventChunk.objects.filter(room_id=room_id).order_by('started_at', 'id')
+    return heapq.merge(*(decode(chunk) for chunk in chunks.iterator()), key=lambda event: event.at)
+
+
+class _RoomBuffer:
+    __slots__ = ('started_at', 'started', 'records')
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.monotonic()
+        self.records = []
+
+
+class EventBuffer:
+    """방별 이벤트 버퍼 (프로세스당 하나, 스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rooms = {}
+
+    def append(self, room_id, user_id, kind, problem_id=None, correct=False, value=0):
+        with self.lock:
+            buffer = self.rooms.get(room_id)
+            if buffer is None:
+                buffer = self.rooms[room_id] = _RoomBuffer()
+            offset_ms = int((time.monotonic() - buffer.started) * 1000)
+            buffer.records.append((offset_ms, user_id, EVENT_KINDS[kind], problem_id or 0, int(correct), value))
+            due = (
+                len(buffer.records) >= settings.EVENT_LOG_FLUSH_EVENTS
+                or offset_ms >= settings.EVENT_LOG_FLUSH_SECONDS * 1000
+            )
+        if due:
+            self.flush()
+
+    def take(self, room_id=None):
+        """버퍼에서 꺼낸 BattleEventChunk 목록 (room_id 가 없으면 전체)"""
+        with self.lock:
+            if room_id is None:
+                taken, self.rooms = self.rooms, {}
+            else:
+                buffer = self.rooms.pop(room_id, None)
+                taken = {room_id: buffer} if buffer else {}
+        return [
+            BattleEventChunk(
+                room_id=room_id, started_at=buffer.started_at,
+                event_count=len(buffer.records), data=encode(buffer.records),
+            )
+            for room_id, buffer in taken.items()
+        ]
+
+    def flush(self, room_id=None):
+        """
+        버퍼의 이벤트를 묶음으로 저장 (INSERT 1회), 반환: 저장한 이벤트 수
+        room_id 를 주면 그 방만 (호출하는 쪽에서 방이 있는 것을 확인한 경우)
+        """
+        chunks = self.take(room_id)
+        if not chunks:
+            return 0
+        if room_id is None:
+            # 이벤트를 모으는 동안 삭제된 방은 제외
+            existing = set(BattleRoom.objects.filter(
+                pk__in=[chunk.room_id for chunk in chunks]
+            ).values_list('pk', flat=True))
+            chunks = [chunk for chunk in chunks if chunk.room_id in existing]
+        BattleEventChunk.objects.bulk_create(chunks)
+        return sum(chunk.event_count for chunk in chunks)
+
+    def clear(self):
+        with self.lock:
+            self.rooms = {}
+
+
+event_buffer = EventBuffer()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        event_buffer.flush()
+    except DatabaseError:
+        logger.exception('종료 시 대결 이벤트 로그 저장 실패')
@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import Client
+
+from config.middleware import brotli
+
+
+DEFAULT_URLS = ('/api/battles/rooms/', '/api/problems/', '/api/battles/statuses/')
+
+
+class Command(BaseCommand):
+    """
+    응답 압축 / 조건부 요청 효과 측정 (현재 DB 데이터 기준, 서버 없이 프로세스 안에서 요청)
+    python manage.py bench_compression [--url /api/problems/ ...] [--repeat 20]
+
+    - 인코딩별(identity/gzip/br) 전송 바이트와 요청당 처리 시간
+    - ETag 로 재검증했을 때(304) 전송 바이트
+    """
+    help = '주요 JSON 응답의 압축 전후 크기와 304 재검증 효과를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', action='append', help='측정할 경로 (여러 번 지정 가능)')
+        parser.add_argument('--repeat', type=int, default=20, help='경로/인코딩별 반복 횟수')
+
+    def handle(self, *args, **options):
+        encodings = ['identity', 'gzip'] + (['br'] if brotli is not None else [])
+        if brotli is None:
+            self.stdout.write('brotli 미설치: gzip 만 측정')
+        client = Client()
+
+        self.stdout.write(f'{"경로":<28}{"인코딩":<10}{"바이트":>10}{"비율":>8}{"ms/요청":>10}')
+        for url in options['url'] or DEFAULT_URLS:
+            raw_size = None
+            for encoding in encodings:
+                start = time.perf_counter()
+                for _ in range(options['repeat']):
+                    response = client.get(url, HTTP_ACCEPT_ENCODING=encoding)
+                elapsed = (time.perf_counter() - start) / options['repeat']
+                size = len(response.content)
+                raw_size = raw_size or size
+                self.stdout.write(
+                    f'{url:<28}{response.get("Content-Encoding", encoding):<10}'
+                    f'{size:>10}{size / raw_size:>8.1%}{elapsed * 1000:>10.2f}'
+                )
+
+            etag = response.get('ETag')
+            if etag:
+                start = time.perf_counter()
+                for _ in range(options['repeat']):
+                    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+                elapsed = (time.perf_counter() - start) / options['repeat']
+                self.stdout.write(
+                    f'{url:<28}{response.status_code:<10}'
+                    f'{len(response.content):>10}{len(response.content) / raw_size:>8.1%}'
+                    f'{elapsed * 1000:>10.2f}'
+                )
@@ -0,0 +1,97 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from battles.models import BattleRoom
+from .loadtest import percentile
+
+
+class Command(BaseCommand):
+    """
+    DB 연결 획득 비용 벤치마크 (동시 요청 폭주 상황)
+    DB_POOL=0 python manage.py bench_db_connections --threads 50 --requests 20
+    DB_POOL=1 python manage.py bench_db_connections --threads 50 --requests 20
+
+    - 스레드마다 요청 처리 흐름을 흉내냄: 연결 획득 -> 로비 목록 쿼리 -> 요청 종료 처리
+      (요청 종료 시 Django 와 같이 close_old_connections 호출: CONN_MAX_AGE=0 이면 연결 종료,
+      풀 사용 시 풀에 반납)
+    - ASGI 모드처럼 요청 스레드가 바뀌어 영구 연결을 재사용하지 못하는 경우를 보려면
+      DJANGO_ASYNC_VIEWS=1 (CONN_MAX_AGE=0) 로 실행
+    """
+    help = '동시 요청 폭주 시 요청 경로에서 DB 연결 획득에 드는 시간을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=50, help='동시 요청 스레드 수')
+        parser.add_argument('--requests', type=int, default=20, help='스레드별 요청 수')
+        parser.add_argument('--database', default='default', help='대상 DB alias')
+
+    def handle(self, *args, **options):
+        alias = options['database']
+        settings_dict = connections[alias].settings_dict
+        pooled = bool(settings_dict.get('OPTIONS', {}).get('pool'))
+        mode = 'pool' if pooled else f'CONN_MAX_AGE={settings_dict["CONN_MAX_AGE"]}'
+        self.stdout.write(
+            f'{connections[alias].vendor} / {mode} / '
+            f'스레드 {options["threads"]}개 x 요청 {options["requests"]}회'
+        )
+
+        connect_times, query_times, errors = [], [], []
+        lock = threading.Lock()
+        barrier = threading.Barrier(options['threads'])
+
+        def worker():
+            connection = connections[alias]
+            barrier.wait()  # 모든 스레드가 동시에 시작 (폭주)
+            for _ in range(options['requests']):
+                try:
+                    start = time.perf_counter()
+                    connection.ensure_connection()
+                    connected = time.perf_counter()
+                    list(BattleRoom.objects.using(alias).filter(status__name='대기')[:20])
+                    finished = time.perf_counter()
+                except Exception as exc:
+                    with lock:
+                        errors.append(repr(exc))
+                else:
+                    with lock:
+                        connect_times.append(connected - start)
+                        query_times.append(finished - connected)
+                finally:
+                    close_old_connections()
+            connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(options['threads'])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(f'{"":<10}{"p50":>10}{"p95":>10}{"p99":>10}{"max":>10}  (ms)')
+        for name, values in (('connect', connect_times), ('query', query_times)):
+            values.sort()
+            row = ''.join(
+                f'{percentile(values, p) * 1000:>10.2f}' for p in (50, 95, 99, 100)
+            )
+            self.stdout.write(f'{name:<10}{row}')
+        total = len(connect_times)
+        self.stdout.write(
+            f'\n요청 {total}회, 오류 {len(errors)}회, {elapsed:.2f}초 '
+            f'({total / elapsed:.1f} req/s), 연결 획득 합계 {sum(connect_times):.2f}초'
+        )
+        if errors:
+            self.stdout.write(self.style.WARNING(f'첫 오류: {errors[0]}'))
+
+        if pooled:
+            pool = connections[alias].pool
+            stats = pool.get_stats()
+            self.stdout.write(
+                f'풀: 크기 {stats.get("pool_size")} (최대 {stats.get("pool_max")}), '
+                f'대기 요청 {stats.get("requests_queued", 0)}회, '
+                f'대기 합계 {stats.get("requests_wait_ms", 0)}ms, '
+                f'새 연결 {stats.get("connections_num", 0)}회'
+            )
+            connections[alias].close_pool()
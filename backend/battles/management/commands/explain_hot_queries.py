@@ -0,0 +1,113 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from battles.models import BattleStatus, BattleRoom, BattleResult
+from problems.models import Type, Subject, Problem
+from users.models import Profile
+
+
+# 실행 계획에서 테이블 전체 스캔을 나타내는 줄
+# - SQLite: "SCAN 대결방" (인덱스 없이 전체 스캔)
+#   "SCAN ... USING INDEX" 는 ORDER BY + LIMIT 를 인덱스 순서로 읽는 경우라 제외
+# - PostgreSQL: "Seq Scan on 대결방"
+SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (?!.*\bUSING\b.*\bINDEX\b)(?P<table>\S+)'),
+    'postgresql': re.compile(r'\bSeq Scan on (?P<table>\S+)'),
+}
+
+# 예시 id (실행 계획만 확인하므로 실제 행이 없어도 됨)
+SAMPLE_ID = 1
+
+
+def hot_queries():
+    """
+    (이름, 쿼리셋) 목록
+    각 뷰가 요청마다 실행하는 쿼리와 같은 조건으로 구성
+    """
+    return [
+        # battles/views.py
+        ('battles.status_by_name', BattleStatus.objects.filter(name='대기')[:1]),
+        ('battles.room_list', BattleRoom.objects.select_related(
+            'host', 'status'
+        ).filter(status__name='대기')),
+        ('battles.room_list.problems', Problem.objects.filter(
+            battle_rooms__in=[SAMPLE_ID, SAMPLE_ID + 1]
+        ).values('battle_rooms', 'id', 'title', 'description')),
+        ('battles.room_create.waiting_conflict', BattleRoom.objects.filter(
+            host_id=SAMPLE_ID, is_waiting=True
+        ).values('id')[:1]),
+        ('battles.room_detail', BattleRoom.objects.select_related(
+            'host', 'status'
+        ).filter(id=SAMPLE_ID)),
+        ('battles.result_by_room_user', BattleResult.objects.filter(
+            room_id=SAMPLE_ID, user_id=SAMPLE_ID
+        )[:1]),
+        ('battles.results_by_room', BattleResult.objects.select_related(
+            'user'
+        ).filter(room_id=SAMPLE_ID)),
+        # problems/views.py
+        ('problems.type_by_name', Type.objects.filter(name='미니')[:1]),
+        ('problems.subject_by_name', Subject.objects.filter(name='자료구조')[:1]),
+        ('problems.list_filtered', Problem.objects.select_related(
+            'type', 'subject'
+        ).filter(type_id=SAMPLE_ID, subject_id=SAMPLE_ID)),
+        # users/views.py, users/cache.py
+        ('users.search', Profile.objects.filter(
+            nickname_key__startswith='nick'
+        ).order_by('nickname_key')[:10]),
+        ('users.profile_cards', Profile.objects.select_related(
+            'activate_title'
+        ).filter(user_id__in=[SAMPLE_ID, SAMPLE_ID + 1])),
+    ]
+
+
+def find_scans(vendor, plan):
+    """실행 계획 문자열에서 전체 스캔되는 테이블 이름 목록"""
+    pattern = SCAN_PATTERNS.get(vendor)
+    if pattern is None:
+        return []
+    return [match.group('table').strip('"') for match in pattern.finditer(plan)]
+
+
+class Command(BaseCommand):
+    """
+    주요 뷰 쿼리의 실행 계획 점검
+    python manage.py explain_hot_queries [--verbose] [--fail-on-scan]
+
+    - SQLite: EXPLAIN QUERY PLAN, PostgreSQL: EXPLAIN 결과에서 테이블 전체 스캔을 찾아 표시
+    - 운영 DB에 가까운 데이터에서 실행해야 플래너 판단이 의미 있음 (PostgreSQL 은 ANALYZE 이후)
+    """
+    help = '주요 뷰가 실행하는 쿼리의 실행 계획에서 전체 테이블 스캔을 찾습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='점검할 DB alias')
+        parser.add_argument('--verbose', action='store_true', help='전체 실행 계획 출력')
+        parser.add_argument(
+            '--fail-on-scan', action='store_true',
+            help='전체 스캔이 있으면 오류로 종료 (CI 용)'
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        vendor = connection.vendor
+        if vendor not in SCAN_PATTERNS:
+            raise CommandError(f'{vendor} 는 지원하지 않습니다. (sqlite, postgresql 만 지원)')
+
+        flagged = []
+        for name, queryset in hot_queries():
+            plan = queryset.using(options['database']).explain()
+            scans = find_scans(vendor, plan)
+            if scans:
+                flagged.append(name)
+                self.stdout.write(self.style.WARNING(f'SCAN  {name}: {", ".join(scans)}'))
+            else:
+                self.stdout.write(f'OK    {name}')
+            if options['verbose'] or scans:
+                for line in plan.splitlines():
+                    self.stdout.write(f'        {line}')
+
+        self.stdout.write(f'\n{len(flagged)}/{len(hot_queries())}개 쿼리에서 전체 스캔 발견')
+        if flagged and options['fail_on_scan']:
+            raise CommandError(f'전체 스캔 쿼리: {", ".join(flagged)}')
@@ -0,0 +1,174 @@
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def percentile(sorted_values, percent):
+    """정렬된 값에서 nearest-rank 방식 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LoadTestClient:
+    """동시 요청 수를 제한하고 엔드포인트별 지연 시간을 기록하는 HTTP 클라이언트"""
+
+    def __init__(self, client, semaphore):
+        self.client = client
+        self.semaphore = semaphore
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def request(self, name, method, url, token=None, expected=(200,), **kwargs):
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        async with self.semaphore:
+            start = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, headers=headers, **kwargs)
+            except Exception:
+                self.errors[name] += 1
+                raise
+            finally:
+                self.latencies[name].append(time.perf_counter() - start)
+        if response.status_code not in expected:
+            self.errors[name] += 1
+            raise RuntimeError(f'{name}: HTTP {response.status_code} {response.text[:200]}')
+        return response.json() if response.content else None
+
+
+class Command(BaseCommand):
+    """
+    동시 대결 부하 테스트
+    python manage.py loadtest --url http://127.0.0.1:8000 --pairs 50 --concurrency 20
+
+    - 사용자 쌍마다: 회원가입 -> 로그인 -> 방 생성 -> 입장 -> 폴링 -> 결과 제출 -> 결과 조회
+    - 엔드포인트별 p50/p95/p99 지연 시간과 초당 요청 수 출력
+    - 대상 서버 DB에 '대기', '진행' 대결상태가 있어야 함
+    - 모든 요청이 이 머신의 IP 하나에서 나가므로 입장 IP 제한(THROTTLE_BUCKETS 'join-room')에
+      걸리지 않도록 대상 서버를 THROTTLE_EXEMPT_NETWORKS={이 머신 IP}/32 로 실행
+    - httpx 필요 (pip install -r requirements-dev.txt)
+    """
+    help = '가상 사용자 쌍으로 대결 흐름 전체에 부하를 발생시킵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='대상 서버 주소')
+        parser.add_argument('--pairs', type=int, default=10, help='동시 대결 수 (사용자 쌍 수)')
+        parser.add_argument('--concurrency', type=int, default=20, help='최대 동시 요청 수')
+        parser.add_argument('--polls', type=int, default=5, help='참가자별 대결방 폴링 횟수')
+        parser.add_argument('--poll-interval', type=float, default=0.5, help='폴링 간격 (초)')
+        parser.add_argument('--timeout', type=float, default=30.0, help='요청 타임아웃 (초)')
+
+    def handle(self, *args, **options):
+        try:
+            import httpx
+        except ImportError:
+            raise CommandError('httpx가 필요합니다: pip install -r requirements-dev.txt')
+
+        stats, elapsed, failures = asyncio.run(self.run(httpx, options))
+        self.report(stats, elapsed, failures, options['pairs'])
+
+    async def run(self, httpx, options):
+        semaphore = asyncio.Semaphore(max(1, options['concurrency']))
+        limits = httpx.Limits(max_connections=max(1, options['concurrency']))
+        async with httpx.AsyncClient(
+            base_url=options['url'].rstrip('/'),
+            timeout=options['timeout'],
+            limits=limits,
+        ) as client:
+            stats = LoadTestClient(client, semaphore)
+
+            statuses = await stats.request('statuses', 'GET', '/api/battles/statuses/')
+            names = {item['name'] for item in statuses}
+            if not {'대기', '진행'} <= names:
+                raise CommandError("대상 서버에 '대기', '진행' 대결상태가 없습니다.")
+
+            run_id = uuid.uuid4().hex[:8]
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(self.battle(stats, run_id, index, options) for index in range(options['pairs'])),
+                return_exceptions=True,
+            )
+            elapsed = time.perf_counter() - start
+
+        failures = [result for result in results if isinstance(result, Exception)]
+        return stats, elapsed, failures
+
+    async def battle(self, stats, run_id, index, options):
+        """사용자 한 쌍의 대결 흐름"""
+        host, guest = await asyncio.gather(
+            self.sign_up(stats, f'lt{run_id}h{index}'),
+            self.sign_up(stats, f'lt{run_id}g{index}'),
+        )
+
+        room = await stats.request(
+            'rooms:create', 'POST', '/api/battles/rooms/', token=host,
+            json={'title': f'loadtest {run_id} #{index}', 'is_cote': False, 'is_private': False},
+            expected=(201,),
+        )
+        room_id = room.get('id')
+        if room_id is None:
+            # 생성 응답에 id가 없으면 프론트엔드(LobbyPage)처럼 로비 목록에서 찾음
+            rooms = await stats.request('rooms:list', 'GET', '/api/battles/rooms/')
+            room_id = max(item['id'] for item in rooms if item['title'] == room['title'])
+        room_url = f'/api/battles/rooms/{room_id}/'
+
+        await stats.request('rooms:join', 'POST', room_url + 'join/', token=guest, json={})
+
+        await asyncio.gather(*(
+            self.play(stats, room_url, token, options) for token in (host, guest)
+        ))
+
+    async def sign_up(self, stats, name):
+        email = f'{name}@korea.ac.kr'
+        password = uuid.uuid4().hex
+        await stats.request(
+            'users:signup', 'POST', '/api/users/signup/',
+            json={'email': email, 'password': password, 'nickname': name},
+            expected=(201,),
+        )
+        tokens = await stats.request(
+            'users:login', 'POST', '/api/users/login/',
+            json={'email': email, 'password': password},
+        )
+        return tokens['access']
+
+    async def play(self, stats, room_url, token, options):
+        """참가자 한 명: 폴링 -> 결과 제출 -> 결과 조회"""
+        for _ in range(options['polls']):
+            await stats.request('rooms:detail', 'GET', room_url)
+            await asyncio.sleep(options['poll_interval'])
+
+        await stats.request(
+            'rooms:submit-result', 'POST', room_url + 'submit-result/', token=token,
+            json={
+                'remaining_time_percent': random.randint(0, 100),
+                'accuracy_percent': random.randint(0, 100),
+            },
+        )
+        await stats.request('rooms:result', 'GET', room_url + 'result/', token=token)
+
+    def report(self, stats, elapsed, failures, pairs):
+        total = sum(len(values) for values in stats.latencies.values())
+        self.stdout.write(
+            f'\n대결 {pairs}개 중 {pairs - len(failures)}개 완료, '
+            f'{elapsed:.2f}초, 전체 {total}건 ({total / elapsed:.1f} req/s)\n'
+        )
+        header = f"{'endpoint':<22}{'count':>7}{'errors':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for name in sorted(stats.latencies):
+            values = sorted(stats.latencies[name])
+            self.stdout.write(
+                f'{name:<22}{len(values):>7}{stats.errors[name]:>8}{len(values) / elapsed:>9.1f}'
+                f'{percentile(values, 50) * 1000:>10.1f}'
+                f'{percentile(values, 95) * 1000:>10.1f}'
+                f'{percentile(values, 99) * 1000:>10.1f}'
+            )
+
+        for failure in failures[:5]:
+            self.stderr.write(f'실패: {failure}')
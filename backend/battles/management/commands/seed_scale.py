@@ -0,0 +1,303 @@
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from battles.cache import invalidate_lobby
+from battles.models import BattleResult, BattleRoom, BattleStatus
+from problems.cache import invalidate_problem_list
+from problems.models import Problem, Subject, Type
+from users.models import Club, Profile, TechStack, Title, User
+
+
+SEED_EMAIL_DOMAIN = 'korea.ac.kr'
+SEED_PASSWORD = 'seed-password'
+
+TYPES = ('미니', '코테')
+SUBJECTS = ('자료구조', '알고리즘', '운영체제', '네트워크', '데이터베이스', '컴퓨터구조', '파이썬', '자바')
+TITLES = tuple(f'칭호 {i}' for i in range(1, 21))
+TECH_STACKS = (
+    'Python', 'Django', 'Java', 'Spring', 'JavaScript', 'TypeScript', 'React', 'Vue',
+    'Node.js', 'Go', 'Rust', 'C', 'C++', 'Kotlin', 'Swift', 'Flutter', 'PostgreSQL',
+    'MySQL', 'Redis', 'Docker', 'Kubernetes', 'AWS', 'Linux', 'PyTorch', 'TensorFlow',
+)
+CLUBS = tuple(f'동아리 {i}' for i in range(1, 16))
+# (레이팅 하한, 티어)
+TIERS = ((2200, 'Diamond'), (1800, 'Platinum'), (1400, 'Gold'), (1000, 'Silver'), (0, 'Bronze'))
+
+# 대결방 상태 비율 (나머지는 '종료')
+WAITING_RATIO = 0.01
+PLAYING_RATIO = 0.02
+
+
+def tier_for(rating):
+    return next(name for floor, name in TIERS if rating >= floor)
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class Command(BaseCommand):
+    """
+    벤치마크/인덱스 검토용 대규모 합성 데이터 생성 (빈 DB 에서 실행)
+    python manage.py seed_scale --users 100000 --problems 50000 --battles 1000000
+
+    - 같은 --seed 면 같은 데이터 (사용자 이메일 seed{n}@korea.ac.kr, 비밀번호 공통)
+    - 모델 행은 bulk_create(batch_size), M2M 은 through 테이블에 여러 행 INSERT 를 직접 실행
+    - '대기' 방은 호스트마다 최대 1개, '종료' 방은 두 참가자의 결과까지 생성
+    - 전체를 한 트랜잭션으로 저장 (중간에 실패하면 아무것도 남지 않음)
+    """
+    help = '사용자/프로필/문제/대결방/결과 대규모 합성 데이터를 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='사용자(프로필) 수')
+        parser.add_argument('--problems', type=int, default=1000, help='문제 수')
+        parser.add_argument('--battles', type=int, default=10000, help='대결방 수')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create / INSERT batch 크기')
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드 (같으면 같은 데이터)')
+
+    def handle(self, *args, **options):
+        if options['users'] < 2 and options['battles']:
+            raise CommandError('대결방을 만들려면 사용자가 2명 이상 필요합니다.')
+        if options['problems'] < 1 and options['battles']:
+            raise CommandError('대결방을 만들려면 문제가 1개 이상 필요합니다.')
+        if User.objects.filter(email=self.email(0)).exists():
+            raise CommandError('이미 seed 데이터가 있습니다. 빈 DB 에서 실행하세요.')
+
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            lookups = self.create_lookups()
+            user_ids = self.create_users(options['users'], lookups)
+            problem_ids = self.create_problems(options['problems'], lookups)
+            self.create_battles(options['battles'], user_ids, problem_ids, lookups)
+
+        # bulk_create 는 시그널을 보내지 않으므로 캐시를 직접 무효화
+        invalidate_lobby()
+        invalidate_problem_list()
+        self.stdout.write(self.style.SUCCESS(f'완료 ({time.perf_counter() - started:.1f}초)'))
+
+    def email(self, index):
+        return f'seed{index}@{SEED_EMAIL_DOMAIN}'
+
+    def report(self, name, rows, started):
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'{name}: {rows}행, {elapsed:.1f}초 ({rows / max(elapsed, 1e-9):,.0f}행/초)')
+
+    # ---------- 기준 데이터 ----------
+
+    def create_lookups(self):
+        """상태/종류/과목/칭호/기술스택/동아리 (이름으로 재사용)"""
+        def ids(model, names):
+            existing = dict(model.objects.filter(name__in=names).values_list('name', 'id'))
+            model.objects.bulk_create([model(name=name) for name in names if name not in existing])
+            return dict(model.objects.filter(name__in=names).values_list('name', 'id'))
+
+        return {
+            'status': ids(BattleStatus, ('대기', '진행', '종료')),
+            'type': list(ids(Type, TYPES).values()),
+            'subject': list(ids(Subject, SUBJECTS).values()),
+            'title': list(ids(Title, TITLES).values()),
+            'tech_stack': list(ids(TechStack, TECH_STACKS).values()),
+            'club': list(ids(Club, CLUBS).values()),
+        }
+
+    # ---------- 사용자 / 프로필 ----------
+
+    def create_users(self, count, lookups):
+        started = time.perf_counter()
+        # 해시 계산은 느리므로 한 번만 (모든 seed 사용자가 같은 비밀번호)
+        password = make_password(SEED_PASSWORD)
+        user_ids = []
+        for chunk in _chunks(range(count), self.batch_size):
+            users = User.objects.bulk_create(
+                [User(email=self.email(index), password=password) for index in chunk],
+                batch_size=self.batch_size,
+            )
+            user_ids.extend(self.pks(User, users, 'email'))
+        self.report('사용자', len(user_ids), started)
+
+        started = time.perf_counter()
+        rng = self.random
+        titles, stacks, clubs = [], [], []
+        profile_count = 0
+        for chunk in _chunks(list(enumerate(user_ids)), self.batch_size):
+            profiles = []
+            owned = []
+            for index, user_id in chunk:
+                rating = max(0, int(rng.gauss(1200, 350)))
+                profile_titles = rng.sample(lookups['title'], rng.randint(0, 3))
+                owned.append(profile_titles)
+                profiles.append(Profile(
+                    user_id=user_id,
+                    student_id=rng.randint(2015, 2025) * 1000000 + rng.randint(0, 999999),
+                    nickname=f'seed{index}',
+                    # bulk_create 는 save() 를 거치지 않으므로 nickname_key 를 직접 설정
+                    nickname_key=f'seed{index}',
+                    rating=rating,
+                    tier=tier_for(rating),
+                    activate_title_id=profile_titles[0] if profile_titles else None,
+                ))
+            profiles = Profile.objects.bulk_create(profiles, batch_size=self.batch_size)
+            profile_ids = self.pks(Profile, profiles, 'nickname_key')
+            for profile_id, profile_titles in zip(profile_ids, owned):
+                titles.extend((profile_id, title_id) for title_id in profile_titles)
+                stacks.extend(
+                    (profile_id, stack_id)
+                    for stack_id in rng.sample(lookups['tech_stack'], rng.randint(1, 4))
+                )
+                clubs.extend(
+                    (profile_id, club_id)
+                    for club_id in rng.sample(lookups['club'], rng.randint(0, 2))
+                )
+            profile_count += len(profiles)
+            # M2M 행은 batch 단위로 바로 저장해 메모리를 제한
+            for field, rows in (('titles', titles), ('tech_stacks', stacks), ('clubs', clubs)):
+                self.insert_m2m(Profile, field, rows)
+                rows.clear()
+        self.report('프로필 (칭호/기술스택/동아리 포함)', profile_count, started)
+        return user_ids
+
+    # ---------- 문제 ----------
+
+    def create_problems(self, count, lookups):
+        started = time.perf_counter()
+        rng = self.random
+        problem_ids = []
+        for chunk in _chunks(range(count), self.batch_size):
+            problems = Problem.objects.bulk_create([
+                Problem(
+                    title=f'문제 {index}',
+                    description=f'문제 {index} 설명 ' + '본문 ' * rng.randint(10, 60),
+                    type_id=rng.choice(lookups['type']),
+                    subject_id=rng.choice(lookups['subject']),
+                    correct_answer=str(rng.randint(1, 5)),
+                )
+                for index in chunk
+            ], batch_size=self.batch_size)
+            problem_ids.extend(self.pks(Problem, problems, 'title'))
+        self.report('문제', len(problem_ids), started)
+        return problem_ids
+
+    # ---------- 대결방 / 결과 ----------
+
+    def create_battles(self, count, user_ids, problem_ids, lookups):
+        started = time.perf_counter()
+        rng = self.random
+        status_ids = lookups['status']
+        waiting_hosts = set()
+        room_count = result_count = 0
+
+        for chunk in _chunks(range(count), self.batch_size):
+            rooms = []
+            for index in chunk:
+                host_id, guest_id = rng.sample(user_ids, 2)
+                roll = rng.random()
+                if roll < WAITING_RATIO and host_id not in waiting_hosts:
+                    # '대기' 방은 호스트마다 1개, 아직 게스트 없음
+                    waiting_hosts.add(host_id)
+                    status, guest_id = '대기', None
+                elif roll < WAITING_RATIO + PLAYING_RATIO:
+                    status = '진행'
+                else:
+                    status = '종료'
+                is_private = rng.random() < 0.1
+                rooms.append(BattleRoom(
+                    title=f'대결방 {index}',
+                    is_cote=rng.random() < 0.3,
+                    host_id=host_id,
+                    guest_id=guest_id,
+                    status_id=status_ids[status],
+                    # bulk_create 는 save() 를 거치지 않으므로 is_waiting 을 직접 설정
+                    is_waiting=status == '대기',
+                    is_private=is_private,
+                    private_password=f'{rng.randint(0, 9999):04d}' if is_private else None,
+                ))
+            rooms = BattleRoom.objects.bulk_create(rooms, batch_size=self.batch_size)
+            room_ids = self.pks(BattleRoom, rooms, 'title')
+
+            room_problems = []
+            results = []
+            for room_id, room in zip(room_ids, rooms):
+                room_problems.extend(
+                    (room_id, problem_id)
+                    for problem_id in rng.sample(problem_ids, min(len(problem_ids), rng.randint(3, 5)))
+                )
+                if room.status_id == status_ids['종료']:
+                    results.extend(self.results_for(room_id, room.host_id, room.guest_id))
+            self.insert_m2m(BattleRoom, 'problems', room_problems)
+            BattleResult.objects.bulk_create(results, batch_size=self.batch_size)
+            room_count += len(rooms)
+            result_count += len(results)
+            self.stdout.write(f'  대결방 {room_count}/{count}')
+
+        self.report('대결방 (문제 포함)', room_count, started)
+        self.stdout.write(f'대결 결과: {result_count}행')
+
+    def results_for(self, room_id, host_id, guest_id):
+        """두 참가자의 결과 (점수 = 남은 시간 % + 정답률 %)"""
+        rng = self.random
+        results = []
+        for user_id in (host_id, guest_id):
+            remaining = rng.randint(0, 100)
+            accuracy = rng.randint(0, 100)
+            results.append(BattleResult(
+                room_id=room_id,
+                user_id=user_id,
+                remaining_time_percent=remaining,
+                accuracy_percent=accuracy,
+                total_score=remaining + accuracy,
+            ))
+        host, guest = results
+        if host.total_score == guest.total_score:
+            host.result = guest.result = 'draw'
+        else:
+            winner, loser = (host, guest) if host.total_score > guest.total_score else (guest, host)
+            winner.result, loser.result = 'win', 'lose'
+        return results
+
+    # ---------- 저장 도구 ----------
+
+    def pks(self, model, objects, unique_field):
+        """bulk_create 결과의 pk (pk 를 돌려주지 않는 DB 에서는 고유 필드로 다시 조회)"""
+        if all(obj.pk is not None for obj in objects):
+            return [obj.pk for obj in objects]
+        values = [getattr(obj, unique_field) for obj in objects]
+        ids = dict(
+            model.objects.filter(**{f'{unique_field}__in': values})
+            .values_list(unique_field, 'id')
+        )
+        return [ids[value] for value in values]
+
+    def insert_m2m(self, model, field_name, rows):
+        """
+        M2M through 테이블에 (왼쪽 id, 오른쪽 id) 행을 여러 행 INSERT 로 직접 저장
+        (through 모델 bulk_create 보다 객체 생성 비용이 없음)
+        """
+        if not rows:
+            return
+        field = model._meta.get_field(field_name)
+        through = field.remote_field.through
+        quote = connection.ops.quote_name
+        columns = (
+            through._meta.get_field(field.m2m_field_name()).column,
+            through._meta.get_field(field.m2m_reverse_field_name()).column,
+        )
+        # SQLite 등 쿼리 파라미터 개수 제한 대비
+        max_params = connection.features.max_query_params
+        batch_size = min(self.batch_size, max_params // 2) if max_params else self.batch_size
+        prefix = 'INSERT INTO {} ({}, {}) VALUES '.format(
+            quote(through._meta.db_table), quote(columns[0]), quote(columns[1])
+        )
+        with connection.cursor() as cursor:
+            for chunk in _chunks(rows, batch_size):
+                cursor.execute(
+                    prefix + ', '.join(['(%s, %s)'] * len(chunk)),
+                    [value for row in chunk for value in row],
+                )
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('battles', '0005_battleroom_guest_battleresult'),
+        ('problems', '0002_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='battlestatus',
+            name='name',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='battleroom',
+            index=models.Index(fields=['host', 'status'], name='battleroom_host_status_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('battles', '0007_group_rooms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BattleEventChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField()),
+                ('event_count', models.PositiveIntegerField()),
+                ('data', models.BinaryField()),
+                ('room', models.ForeignKey(db_column='room_id', on_delete=django.db.models.deletion.CASCADE, related_name='event_chunks', to='battles.battleroom')),
+            ],
+            options={
+                'db_table': '대결이벤트',
+                'indexes': [models.Index(fields=['room', 'started_at'], name='battleevent_room_started_idx')],
+            },
+        ),
+    ]
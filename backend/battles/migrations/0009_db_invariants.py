@@ -0,0 +1,65 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:48
+
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def fill_is_waiting(apps, schema_editor):
+    """
+    기존 '대기' 방의 is_waiting 채우기
+    이전의 동시 생성으로 '대기' 방이 여러 개인 호스트는 가장 최근 방만 남기고
+    나머지는 '종료' 로 변경 (그대로 두면 그 방의 첫 save() 가 유니크 제약 위반)
+    """
+    BattleRoom = apps.get_model('battles', 'BattleRoom')
+    BattleStatus = apps.get_model('battles', 'BattleStatus')
+    waiting = BattleRoom.objects.filter(status__name='대기')
+    latest = waiting.values('host').annotate(latest=Max('id')).values('latest')
+    BattleRoom.objects.filter(pk__in=latest).update(is_waiting=True)
+
+    duplicates = waiting.filter(is_waiting=False)
+    finished = BattleStatus.objects.filter(name='종료').first()
+    if finished is None and duplicates.exists():
+        finished = BattleStatus.objects.create(name='종료')
+    if finished is not None:
+        duplicates.update(status=finished)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('battles', '0008_event_log'),
+        ('problems', '0002_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='battleroom',
+            name='battleroom_host_status_idx',
+        ),
+        migrations.AddField(
+            model_name='battleroom',
+            name='is_waiting',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(fill_is_waiting, migrations.RunPython.noop),
+        # 점수 범위는 제출 serializer 가 검증해 왔으므로 기존 행은 모두 만족
+        migrations.AddConstraint(
+            model_name='battleresult',
+            constraint=models.CheckConstraint(condition=models.Q(('remaining_time_percent__gte', 0), ('remaining_time_percent__lte', 100)), name='battleresult_remaining_time_percent_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='battleresult',
+            constraint=models.CheckConstraint(condition=models.Q(('accuracy_percent__gte', 0), ('accuracy_percent__lte', 100)), name='battleresult_accuracy_percent_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='battleresult',
+            constraint=models.CheckConstraint(condition=models.Q(('total_score', django.db.models.expressions.CombinedExpression(models.F('remaining_time_percent'), '+', models.F('accuracy_percent')))), name='battleresult_total_score_sum'),
+        ),
+        migrations.AddConstraint(
+            model_name='battleroom',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_waiting', True)), fields=('host',), name='battleroom_one_waiting_per_host'),
+        ),
+    ]
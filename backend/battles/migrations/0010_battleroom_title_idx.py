@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-19 15:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('battles', '0009_db_invariants'),
+        ('problems', '0002_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='battleroom',
+            index=models.Index(fields=['title'], name='battleroom_title_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -5,7 +5,8 @@ from problems.models import Problem
 
 class BattleStatus(models.Model):
     """대결상태 모델"""
-    name = models.CharField(max_length=100)
+    # 뷰에서 name='대기' 등 이름으로 조회
+    name = models.CharField(max_length=100, db_index=True)
     
     class Meta:
         db_table = '대결상태'
@@ -41,6 +42,13 @@ class BattleRoom(models.Model):
     )
     is_private = models.BooleanField(default=False)
     private_password = models.CharField(max_length=4, null=True, blank=True)
+    # 정원: 2명이면 기존 1대1 (host/guest), 3명 이상이면 참가자는 BattleParticipant
+    capacity = models.PositiveSmallIntegerField(default=2)
+    # 다인 방 결과 제출 기한 (시작 시 설정, 지나면 제출한 사람끼리 순위 확정)
+    deadline = models.DateTimeField(null=True, blank=True)
+    # status 가 '대기' 인지 (save 시 자동 설정, 호스트당 '대기' 방 하나 제약용)
+    # 상태는 별도 테이블이라 제약 조건에서 이름으로 조회할 수 없으므로 따로 저장
+    is_waiting = models.BooleanField(default=False, editable=False)
     
     # 대결방과 문제의 Many-to-Many 관계
     problems = models.ManyToManyField(
@@ -51,10 +59,58 @@ class BattleRoom(models.Model):
     
     class Meta:
         db_table = '대결방'
+        constraints = [
+            # 호스트당 '대기' 방은 하나 (방 생성 뷰는 INSERT 실패로 확인, 기존 방 조회에도 사용)
+            models.UniqueConstraint(
+                fields=['host'],
+                condition=models.Q(is_waiting=True),
+                name='battleroom_one_waiting_per_host',
+            ),
+        ]
+        indexes = [
+            # admin 제목 접두사 검색 (LIKE 'x%' 는 PostgreSQL 에서 pattern_ops 인덱스만 사용)
+            models.Index(fields=['title'], name='battleroom_title_idx', opclasses=['varchar_pattern_ops']),
+        ]
     
+    def save(self, *args, **kwargs):
+        """is_waiting을 status와 항상 동기화"""
+        self.is_waiting = self.status.name == '대기'
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'status' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'is_waiting'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.title} (호스트: {self.host})"
 
+    @property
+    def is_group(self):
+        return self.capacity > 2
+
+
+class BattleParticipant(models.Model):
+    """다인 대결방 참가자 모델 (호스트 포함)"""
+    room = models.ForeignKey(
+        BattleRoom,
+        on_delete=models.CASCADE,
+        related_name='participants',
+        db_column='room_id'
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='battle_participations',
+        db_column='user_id'
+    )
+    joined_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = '대결참가자'
+        unique_together = [['room', 'user']]
+
+    def __str__(self):
+        return f"{self.room} - {self.user}"
+
 
 class BattleResult(models.Model):
     """대결 결과 모델"""
@@ -90,13 +146,52 @@ class BattleResult(models.Model):
         blank=True,
         help_text="승패 결과"
     )
+    # 다인 방 최종 순위 (동점은 같은 순위, 확정 전에는 null)
+    rank = models.PositiveSmallIntegerField(null=True, blank=True)
     submitted_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         db_table = '대결결과'
         unique_together = [['room', 'user']]  # 한 방에서 한 사용자는 하나의 결과만
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(remaining_time_percent__gte=0, remaining_time_percent__lte=100),
+                name='battleresult_remaining_time_percent_range',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(accuracy_percent__gte=0, accuracy_percent__lte=100),
+                name='battleresult_accuracy_percent_range',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(total_score=models.F('remaining_time_percent') + models.F('accuracy_percent')),
+                name='battleresult_total_score_sum',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.room} - {self.user}: {self.result}"
 
 
+class BattleEventChunk(models.Model):
+    """대결 이벤트 로그 묶음 (battles/eventlog.py 형식, 추가만 함)"""
+    room = models.ForeignKey(
+        BattleRoom,
+        on_delete=models.CASCADE,
+        related_name='event_chunks',
+        db_column='room_id'
+    )
+    # 묶음의 첫 이벤트 시각 (각 이벤트 시각은 이 기준 ms)
+    started_at = models.DateTimeField()
+    event_count = models.PositiveIntegerField()
+    # 고정 길이 레코드를 이어 붙여 zlib 압축한 바이트
+    data = models.BinaryField()
+
+    class Meta:
+        db_table = '대결이벤트'
+        indexes = [
+            # 재생 시 방의 묶음을 시각순으로 조회
+            models.Index(fields=['room', 'started_at'], name='battleevent_room_started_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.room_id} @ {self.started_at} ({self.event_count}건)"
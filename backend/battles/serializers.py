@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from users.models import User
 from problems.models import Problem
-from .models import BattleStatus, BattleRoom, BattleResult
+from django.conf import settings
+from .eventlog import EVENT_KINDS
+from .models import BattleStatus, BattleRoom, BattleResult, BattleParticipant
 
 
 class BattleStatusSerializer(serializers.ModelSerializer):
@@ -35,7 +37,7 @@ class BattleRoomListSerializer(serializers.ModelSerializer):
         model = BattleRoom
         fields = (
             'id', 'title', 'is_cote', 'host', 'status',
-            'is_private', 'problems'
+            'is_private', 'capacity', 'problems'
         )
 
 
@@ -44,13 +46,25 @@ class BattleRoomDetailSerializer(serializers.ModelSerializer):
     host = UserSimpleSerializer(read_only=True)
     status = BattleStatusSerializer(read_only=True)
     problems = ProblemSimpleSerializer(many=True, read_only=True)
+    participants = serializers.SerializerMethodField()
     
     class Meta:
         model = BattleRoom
         fields = (
             'id', 'title', 'is_cote', 'host', 'status',
-            'is_private', 'private_password', 'problems'
+            'is_private', 'private_password', 'capacity', 'deadline',
+            'participants', 'problems'
         )
+    
+    def get_participants(self, obj):
+        """다인 방 참가자 목록 (1대1 방은 host/guest 로 충분하므로 조회하지 않음)"""
+        if not obj.is_group:
+            return []
+        users = [
+            participant.user for participant in
+            BattleParticipant.objects.filter(room=obj).select_related('user').order_by('joined_at', 'id')
+        ]
+        return UserSimpleSerializer(users, many=True).data
 
 
 class BattleRoomCreateSerializer(serializers.ModelSerializer):
@@ -65,10 +79,18 @@ class BattleRoomCreateSerializer(serializers.ModelSerializer):
         model = BattleRoom
         fields = (
             'title', 'is_cote', 'is_private',
-            'private_password', 'problems'
+            'private_password', 'capacity', 'problems'
         )
         # status는 자동으로 '대기'로 설정됨
     
+    def validate_capacity(self, value):
+        """정원은 2명(1대1) ~ GROUP_BATTLE_MAX_CAPACITY"""
+        if not 2 <= value <= settings.GROUP_BATTLE_MAX_CAPACITY:
+            raise serializers.ValidationError(
+                f'정원은 2~{settings.GROUP_BATTLE_MAX_CAPACITY}명이어야 합니다.'
+            )
+        return value
+    
     def validate(self, data):
         """비공개 방인 경우 비밀번호 필수 및 4자리 숫자 검증"""
         private_password = data.get('private_password')
@@ -141,7 +163,21 @@ class BattleResultSerializer(serializers.ModelSerializer):
         model = BattleResult
         fields = (
             'id', 'user', 'remaining_time_percent', 'accuracy_percent',
-            'total_score', 'result', 'submitted_at'
+            'total_score', 'result', 'rank', 'submitted_at'
         )
 
 
+class BattleEventSerializer(serializers.Serializer):
+    """대결 이벤트 하나 (battles/eventlog.py 레코드 범위로 제한)"""
+    kind = serializers.ChoiceField(choices=list(EVENT_KINDS))
+    problem = serializers.IntegerField(min_value=1, max_value=2**32 - 1, required=False)
+    correct = serializers.BooleanField(default=False)
+    value = serializers.IntegerField(
+        min_value=-2**31, max_value=2**31 - 1, default=0,
+        help_text="answer 는 풀이 시간(ms), submit 은 점수"
+    )
+
+
+class BattleEventBatchSerializer(serializers.Serializer):
+    """대결 이벤트 일괄 전송용 Serializer"""
+    events = BattleEventSerializer(many=True, allow_empty=False, max_length=settings.EVENT_LOG_MAX_BATCH)
@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from problems.models import Problem
+from .cache import invalidate_lobby
+from .eventlog import event_buffer
+from .models import BattleRoom
+
+
+# 참가자 결과가 모두 제출되어 승패가 정해졌을 때 (room=BattleRoom, 다인 방은 순위 확정 시)
+# 토너먼트 등 다른 앱이 대결 종료에 이어지는 처리를 할 때 사용
+battle_finished = Signal()
+
+
+# 로비 목록에 보이는 방/문제가 바뀌면 무효화
+# (뷰뿐 아니라 관리자 페이지 수정, 사용자 삭제에 따른 CASCADE 삭제도 포함)
+# 방-문제 연결(M2M)은 m2m_changed 수신기가 있으면 Django 가 추가 조회를 하므로
+# 연결을 바꾸는 곳(방 생성 뷰, 관리자 페이지)에서 직접 invalidate_lobby 호출
+
+@receiver(post_save, sender=BattleRoom)
+@receiver(post_delete, sender=BattleRoom)
+@receiver(post_save, sender=Problem)
+@receiver(post_delete, sender=Problem)
+def on_lobby_changed(sender, **kwargs):
+    invalidate_lobby()
+
+
+# 대결이 끝나면 이 프로세스에 모아 둔 방의 이벤트 로그를 바로 저장
+@receiver(battle_finished)
+def flush_event_log(sender, room, **kwargs):
+    event_buffer.flush(room.id)
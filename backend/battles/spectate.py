@@ -0,0 +1,268 @@
+"""
+대결 관전 (읽기 전용)
+
+관전자가 많아도 DB 조회는 방마다, 프로세스마다 한 번씩만 합니다.
+- room_snapshot: 방 상태/참가자/결과를 한 번에 조회 (인원수와 무관하게 쿼리 3회 이하)
+- ASGI 모드 (SpectatorHub): 방마다 RoomFeed 하나가 SPECTATE_INTERVAL 초마다 스냅숏을 조회하고,
+  바뀌었을 때만 한 번 직렬화한 같은 SSE bytes 를 모든 구독자 큐에 넣음
+  - 구독자 큐는 SPECTATE_QUEUE_SIZE 개까지, 느린 관전자는 밀린 중간 상태를 버리고 최신 상태만 받음
+    (스냅숏은 전체 상태라 중간 상태를 건너뛰어도 됨, 구독자당 메모리 상한)
+  - 방당 SPECTATE_MAX_VIEWERS, 프로세스당 SPECTATE_MAX_TOTAL 명까지
+  - 마지막 관전자가 나가면 조회 중단, 방이 '종료' 되면 마지막 상태와 end 이벤트를 보내고 스트림 종료
+- WSGI 모드 (SnapshotCache): 스트림 대신 SPECTATE_INTERVAL 초 동안 같은 스냅숏 bytes 를 재사용
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from config.metrics import SPECTATORS, SPECTATE_SNAPSHOTS, SPECTATE_SKIPPED
+from .models import BattleParticipant, BattleRoom
+from .standings import standings
+
+
+logger = logging.getLogger(__name__)
+
+# 오래 조회되지 않은 방의 스냅숏을 정리하는 기준 (WSGI 모드 캐시 크기)
+MAX_CACHED_ROOMS = 1024
+
+HEARTBEAT_MESSAGE = b': keepalive\n\n'
+END_MESSAGE = b'event: end\ndata: {}\n\n'
+
+
+class SpectatorLimit(Exception):
+    """관전자 수 한도 초과 (뷰에서 503)"""
+
+
+def room_snapshot(room_id):
+    """관전 화면에 필요한 방 상태 (방이 없거나 비공개 방이면 None)"""
+    room = BattleRoom.objects.select_related('host', 'guest', 'status').filter(
+        pk=room_id, is_private=False
+    ).first()
+    if room is None:
+        return None
+    SPECTATE_SNAPSHOTS.inc()
+    if room.is_group:
+        players = [
+            participant.user for participant in
+            BattleParticipant.objects.filter(room=room).select_related('user').order_by('joined_at', 'id')
+        ]
+    else:
+        players = [user for user in (room.host, room.guest) if user is not None]
+    return {
+        'id': room.id,
+        'title': room.title,
+        'is_cote': room.is_cote,
+        'status': room.status.name,
+        'capacity': room.capacity,
+        'deadline': room.deadline,
+        'players': [{'id': user.id, 'email': user.email} for user in players],
+        'results': [
+            {
+                'user': result.user_id,
+                'total_score': result.total_score,
+                'result': result.result,
+                'rank': result.rank,
+            }
+            for result in standings(room_id)
+        ],
+    }
+
+
+def encode_snapshot(snapshot):
+    return json.dumps(snapshot, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+
+
+def is_finished(snapshot):
+    return snapshot is None or snapshot['status'] == '종료'
+
+
+# ---------- WSGI (polling) ----------
+
+class SnapshotCache:
+    """방별 최근 스냅숏 bytes (SPECTATE_INTERVAL 초 동안 재사용, 방마다 한 스레드만 조회)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.room_locks = {}
+        self.entries = {}
+
+    def get(self, room_id):
+        entry = self.entries.get(room_id)
+        if entry and time.monotonic() - entry[0] < settings.SPECTATE_INTERVAL:
+            return entry[1]
+        with self.lock:
+            room_lock = self.room_locks.setdefault(room_id, threading.Lock())
+        with room_lock:
+            # 기다리는 동안 다른 스레드가 갱신했으면 그 값을 사용
+            entry = self.entries.get(room_id)
+            if entry and time.monotonic() - entry[0] < settings.SPECTATE_INTERVAL:
+                return entry[1]
+            snapshot = room_snapshot(room_id)
+            data = None if snapshot is None else encode_snapshot(snapshot)
+            self.entries[room_id] = (time.monotonic(), data)
+        if len(self.entries) > MAX_CACHED_ROOMS:
+            self.prune()
+        return data
+
+    def prune(self):
+        """만료된 스냅숏과 잠금 정리"""
+        now = time.monotonic()
+        with self.lock:
+            for room_id, (fetched, _) in list(self.entries.items()):
+                if now - fetched >= settings.SPECTATE_INTERVAL:
+                    self.entries.pop(room_id, None)
+                    self.room_locks.pop(room_id, None)
+
+
+snapshot_cache = SnapshotCache()
+
+
+# ---------- ASGI (stream) ----------
+
+class Subscriber:
+    __slots__ = ('queue',)
+
+    def __init__(self):
+        self.queue = asyncio.Queue(settings.SPECTATE_QUEUE_SIZE)
+
+    def offer(self, message):
+        """큐가 가득 차면 가장 오래된 메시지를 버리고 추가 (await 하지 않음)"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            SPECTATE_SKIPPED.inc()
+        self.queue.put_nowait(message)
+
+
+class RoomFeed:
+    """방 하나의 upstream (조회 1회 -> 직렬화 1회 -> 구독자 전원에게 같은 bytes)"""
+
+    def __init__(self, room_id):
+        self.room_id = room_id
+        self.subscribers = set()
+        # 마지막으로 보낸 SSE 메시지 (새 구독자에게 바로 전달)
+        self.message = None
+        self.finished = False
+        self.task = None
+
+    def broadcast(self, message):
+        for subscriber in self.subscribers:
+            subscriber.offer(message)
+
+    async def run(self):
+        try:
+            await self.poll()
+        except Exception:
+            # 조회 실패 시 관전자가 하트비트만 받으며 남지 않도록 스트림 종료
+            logger.exception('관전 스냅숏 조회 실패 (room=%s)', self.room_id)
+            self.finished = True
+            self.broadcast(END_MESSAGE)
+
+    async def poll(self):
+        while self.subscribers:
+            snapshot = await sync_to_async(room_snapshot)(self.room_id)
+            message = b''
+            if snapshot is not None:
+                message = b'event: state\ndata: ' + encode_snapshot(snapshot) + b'\n\n'
+                if message == self.message:
+                    message = b''
+                else:
+                    self.message = message
+            if is_finished(snapshot):
+                # 마지막 상태와 end 를 한 메시지로 (느린 관전자도 최종 상태는 받음)
+                self.finished = True
+                self.broadcast(message + END_MESSAGE)
+                return
+            if message:
+                self.broadcast(message)
+            await asyncio.sleep(settings.SPECTATE_INTERVAL)
+
+
+class SpectatorHub:
+    """프로세스의 방별 RoomFeed 관리 (이벤트 루프 스레드에서만 사용)"""
+
+    def __init__(self):
+        self.feeds = {}
+        self.viewers = 0
+
+    def subscribe(self, room_id):
+        feed = self.feeds.get(room_id)
+        if self.viewers >= settings.SPECTATE_MAX_TOTAL or (
+            feed is not None and len(feed.subscribers) >= settings.SPECTATE_MAX_VIEWERS
+        ):
+            raise SpectatorLimit()
+        if feed is None or feed.finished:
+            feed = self.feeds[room_id] = RoomFeed(room_id)
+        subscriber = Subscriber()
+        if feed.message is not None:
+            subscriber.offer(feed.message)
+        feed.subscribers.add(subscriber)
+        if feed.task is None:
+            feed.task = asyncio.get_running_loop().create_task(feed.run())
+        self.viewers += 1
+        SPECTATORS.inc()
+        return feed, subscriber
+
+    def unsubscribe(self, feed, subscriber):
+        feed.subscribers.discard(subscriber)
+        self.viewers -= 1
+        SPECTATORS.dec()
+        if not feed.subscribers:
+            feed.task.cancel()
+            if self.feeds.get(feed.room_id) is feed:
+                del self.feeds[feed.room_id]
+
+    def stream(self, feed, subscriber):
+        return SpectatorStream(self, feed, subscriber)
+
+
+class SpectatorStream:
+    """
+    관전자 한 명의 SSE 스트림 (StreamingHttpResponse 본문)
+    응답이 끝나거나 연결이 끊기면 Django 가 close() 를 호출하므로 거기서 구독 해제
+    """
+
+    def __init__(self, hub, feed, subscriber):
+        self.hub = hub
+        self.feed = feed
+        self.subscriber = subscriber
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed:
+            raise StopAsyncIteration
+        try:
+            message = await asyncio.wait_for(
+                self.subscriber.queue.get(), timeout=settings.SPECTATE_HEARTBEAT
+            )
+        except asyncio.TimeoutError:
+            return HEARTBEAT_MESSAGE
+        if message.endswith(END_MESSAGE):
+            self.close()
+        return message
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.hub.unsubscribe(self.feed, self.subscriber)
+        elif not self.loop.is_closed():
+            # Django 는 response.close() 를 별도 스레드에서 호출함
+            self.loop.call_soon_threadsafe(self.hub.unsubscribe, self.feed, self.subscriber)
+
+
+hub = SpectatorHub()
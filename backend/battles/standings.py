@@ -0,0 +1,122 @@
+"""
+다인 대결방 (capacity 3명 이상) 참가/순위 확정
+
+- 참가자는 BattleParticipant (호스트 포함), 정원이 차면 '진행' 으로 바뀌고 제출 기한(deadline) 설정
+- 모든 참가자가 제출했거나 기한이 지나면 순위 확정
+  RANK() OVER (ORDER BY total_score DESC) 한 번으로 순위를 계산하고 한 번에 저장하므로
+  인원수와 무관하게 쿼리 수가 일정합니다.
+- 1등은 'win' (전원 동점이면 'draw'), 나머지는 'lose'
+- 기한이 지난 뒤의 확정은 결과 조회/제출 요청에서 이루어집니다.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, Exists, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, Rank
+from django.db.models.expressions import Window
+from django.utils import timezone
+
+from .cache import invalidate_lobby
+from .models import BattleParticipant, BattleResult, BattleRoom, BattleStatus
+from .signals import battle_finished
+
+
+def count_of(model, **filters):
+    """방별 행 수 서브쿼리 (없으면 0)"""
+    return Coalesce(Subquery(
+        model.objects.filter(room=OuterRef('pk'), **filters).order_by()
+        .values('room').annotate(count=Count('pk')).values('count')
+    ), Value(0))
+
+
+def result_deadline():
+    """지금 시작한 방의 결과 제출 기한"""
+    return timezone.now() + timedelta(seconds=settings.GROUP_BATTLE_SECONDS)
+
+
+def join_group_room(room_id, user):
+    """
+    정원 안에서 참가 (방 행 잠금으로 동시 입장 시 정원 초과 방지)
+    이미 참가한 사람의 재입장 외에는 '대기' 방에만 참가 가능 (시작/종료된 방이 다시 '진행' 이 되지 않도록)
+    반환: (참가 여부, 오류 메시지)
+    """
+    with transaction.atomic():
+        room = BattleRoom.objects.select_for_update().annotate(
+            participant_count=count_of(BattleParticipant),
+            joined=Exists(BattleParticipant.objects.filter(room=OuterRef('pk'), user=user)),
+        ).get(pk=room_id)
+        if room.joined:
+            return True, None
+        if not room.is_waiting:
+            return False, '이미 시작했거나 종료된 대결방입니다.'
+        if room.participant_count >= room.capacity:
+            return False, '이 방은 이미 가득 찼습니다.'
+
+        BattleParticipant.objects.create(room=room, user=user)
+        if room.participant_count + 1 == room.capacity:
+            playing_status = BattleStatus.objects.filter(name='진행').first()
+            if playing_status:
+                room.status = playing_status
+                room.deadline = result_deadline()
+                room.save(update_fields=['status', 'deadline'])
+    return True, None
+
+
+def finalize_room(room_id):
+    """
+    전원 제출 또는 기한 경과 시 순위 확정 (여러 번 호출해도 안전)
+    반환: 확정 여부 (이미 확정된 경우 포함)
+    """
+    with transaction.atomic():
+        room = BattleRoom.objects.select_for_update().annotate(
+            participant_count=count_of(BattleParticipant),
+            submitted_count=count_of(BattleResult),
+            ranked_count=count_of(BattleResult, rank__isnull=False),
+            is_finished=Exists(BattleStatus.objects.filter(pk=OuterRef('status_id'), name='종료')),
+        ).get(pk=room_id)
+        # 이미 종료된 방 (제출 없이 기한이 지난 방 포함)은 다시 닫지 않음 (로비 무효화 반복 방지)
+        if room.ranked_count or room.is_finished:
+            return True
+        expired = room.deadline is not None and room.deadline <= timezone.now()
+        if room.submitted_count < room.participant_count and not expired:
+            return False
+        if not room.submitted_count:
+            # 아무도 제출하지 않고 기한이 지남: 순위 없이 종료
+            close_room(room)
+            return True
+
+        results = list(
+            BattleResult.objects.filter(room_id=room_id)
+            .annotate(standing=Window(Rank(), order_by=F('total_score').desc()))
+            .only('id', 'total_score')
+        )
+        all_tied = len(results) > 1 and all(result.standing == 1 for result in results)
+        for result in results:
+            result.rank = result.standing
+            if result.standing != 1:
+                result.result = 'lose'
+            else:
+                result.result = 'draw' if all_tied else 'win'
+        BattleResult.objects.bulk_update(results, ['rank', 'result'])
+        close_room(room)
+    battle_finished.send(sender=BattleRoom, room=room)
+    return True
+
+
+def close_room(room):
+    """방을 '종료' 로 변경 (UPDATE 는 post_save 가 없으므로 로비 캐시는 직접 무효화)"""
+    finished_status = BattleStatus.objects.filter(name='종료').values('pk')[:1]
+    BattleRoom.objects.filter(pk=room.pk).update(
+        status=Coalesce(Subquery(finished_status), F('status')),
+        # save() 를 거치지 않으므로 is_waiting 도 함께 변경 ('종료' 상태가 없으면 그대로)
+        is_waiting=Case(When(Exists(finished_status), then=Value(False)), default=F('is_waiting')),
+    )
+    invalidate_lobby()
+
+
+def standings(room_id):
+    """방의 결과 목록 (확정 후에는 순위순, 그 전에는 점수순)"""
+    return BattleResult.objects.filter(room_id=room_id).select_related('user').order_by(
+        F('rank').asc(nulls_last=True), '-total_score', 'submitted_at'
+    )
@@ -1,3 +1,967 @@
-from django.test import TestCase
+import importlib
+import json
+from collections.abc import Iterator
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Q
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from prometheus_client import REGISTRY
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.db_router import reads_from_replica
+from config.testing import QueryBudgetMixin, QuietRequestLogMixin
+from problems.models import Type, Subject, Problem
+from users.models import Profile, User
+from . import async_views, eventlog, spectate, views
+from .eventlog import event_buffer
+from .standings import finalize_room
+from .models import BattleStatus, BattleRoom, BattleResult, BattleParticipant, BattleEventChunk
+
+
+# 방마다 연결할 문제 수
+PROBLEMS_PER_ROOM = 3
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class BattleQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """대결 API 쿼리 수/응답 크기 회귀 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.waiting = BattleStatus.objects.create(name='대기')
+        cls.playing = BattleStatus.objects.create(name='진행')
+        cls.finished = BattleStatus.objects.create(name='종료')
+        cls.host = User.objects.create_user(email='host@korea.ac.kr', password='pw')
+        cls.guest = User.objects.create_user(email='guest@korea.ac.kr', password='pw')
+
+        problem_type = Type.objects.create(name='미니')
+        subject = Subject.objects.create(name='자료구조')
+        cls.problems = Problem.objects.bulk_create([
+            Problem(
+                title=f'문제 {i}',
+                description='다음 중 스택의 특징으로 옳은 것은?',
+                type=problem_type,
+                subject=subject,
+                correct_answer='1',
+            )
+            for i in range(PROBLEMS_PER_ROOM)
+        ])
+
+    def seed_rooms(self, rows):
+        """다른 호스트들의 '대기' 방을 rows개까지 생성 (방마다 문제 연결)"""
+        start = BattleRoom.objects.filter(title__startswith='room').count()
+        hosts = User.objects.bulk_create([
+            User(email=f'roomhost{i}@korea.ac.kr') for i in range(start, rows)
+        ])
+        rooms = BattleRoom.objects.bulk_create([
+            BattleRoom(title=f'room {i}', host=host, status=self.waiting, is_waiting=True)
+            for i, host in enumerate(hosts, start=start)
+        ])
+        Through = BattleRoom.problems.through
+        Through.objects.bulk_create([
+            Through(battleroom_id=room.id, problem_id=problem.id)
+            for room in rooms for problem in self.problems
+        ])
+
+    def create_room(self, rows, **kwargs):
+        """rows 규모 데이터와 함께 self.host 의 새 방 생성"""
+        self.seed_rooms(rows)
+        # 이전 규모에서 만든 방은 종료 처리 (호스트당 '대기' 방 1개)
+        BattleRoom.objects.filter(host=self.host, status=self.waiting).update(status=self.finished, is_waiting=False)
+        room = BattleRoom.objects.create(
+            title=f'my room {rows}', host=self.host,
+            status=kwargs.pop('status', self.waiting), **kwargs
+        )
+        room.problems.set(self.problems)
+        return room
+
+    # ---------- Reference Data ----------
+
+    def test_status_list(self):
+        def seed(rows):
+            BattleStatus.objects.bulk_create([
+                BattleStatus(name=f'상태 {i}')
+                for i in range(BattleStatus.objects.count(), rows)
+            ])
+
+        self.assertQueryBudget(
+            'get', '/api/battles/statuses/', seed=seed,
+            max_queries=1, max_bytes=lambda rows: 100 + 40 * rows,
+        )
+
+    # ---------- BattleRoom ----------
+
+    def test_room_list_fast_path(self):
+        self.seed_rooms(10)
+        self.create_room(10, is_private=True, private_password='1234')
+        BattleRoom.objects.create(title='빈 방', host=self.guest, status=self.waiting)
+        # 문제를 id 역순으로 연결해도 두 경로 모두 id 순
+        reversed_room = BattleRoom.objects.create(
+            title='역순 방', host=User.objects.create(email='reversed@korea.ac.kr'), status=self.waiting
+        )
+        for problem in reversed(self.problems):
+            reversed_room.problems.add(problem)
+        for view_class, path in (
+            (views.BattleStatusListView, '/api/battles/statuses/'),
+            (views.BattleRoomListCreateView, '/api/battles/rooms/'),
+        ):
+            with self.subTest(path=path):
+                self.assertFastPathParity(view_class, path)
+
+    def test_room_list(self):
+        self.assertQueryBudget(
+            'get', '/api/battles/rooms/', seed=self.seed_rooms,
+            max_queries=2, max_bytes=lambda rows: 10 + 600 * rows,
+        )
+
+    @override_settings(CACHE_SHARED=True)
+    def test_room_list_cache_invalidation(self):
+        self.seed_rooms(3)
+        client = self.client_for()
+        self.assertEqual(len(client.get('/api/battles/rooms/').json()), 3)
+        with self.assertNumQueries(0):
+            client.get('/api/battles/rooms/')
+
+        # 커밋 전에는 버전을 올리지 않음 (동시 GET 이 커밋 전 목록을 새 버전으로 캐시하지 않도록)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client_for(self.host).post('/api/battles/rooms/', {
+                'title': 'new room', 'is_cote': False, 'is_private': False, 'problems': [],
+            }, format='json')
+        self.assertEqual(len(client.get('/api/battles/rooms/').json()), 3)
+        # 커밋 후 즉시 목록에 반영
+        for callback in callbacks:
+            callback()
+        self.assertEqual(len(client.get('/api/battles/rooms/').json()), 4)
+
+    @override_settings(CACHE_SHARED=True)
+    def test_room_list_etag(self):
+        self.seed_rooms(3)
+        client = self.client_for()
+        response = client.get('/api/battles/rooms/')
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+
+        # 변경이 없으면 DB 조회 없이 304
+        with self.assertNumQueries(0):
+            response = client.get('/api/battles/rooms/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        # 방이 바뀌면 ETag 도 바뀜
+        with self.captureOnCommitCallbacks(execute=True):
+            BattleRoom.objects.filter(title='room 0').first().delete()
+        response = client.get('/api/battles/rooms/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_room_list_without_shared_cache(self):
+        # 워커별 캐시면 다른 워커의 무효화를 볼 수 없으므로 ETag/응답 캐시를 쓰지 않음
+        self.seed_rooms(3)
+        client = self.client_for()
+        response = client.get('/api/battles/rooms/')
+        self.assertNotIn('ETag', response)
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        BattleRoom.objects.filter(title='room 0').update(title='renamed')
+        self.assertIn('renamed', client.get('/api/battles/rooms/').content.decode())
+
+    def test_room_create(self):
+        def seed(rows):
+            self.seed_rooms(rows)
+            BattleRoom.objects.filter(host=self.host).delete()
+            return {'data': {
+                'title': f'new room {rows}',
+                'is_cote': False,
+                'is_private': False,
+                'problems': [problem.id for problem in self.problems],
+            }}
+
+        self.assertQueryBudget(
+            'post', '/api/battles/rooms/', seed=seed, user=self.host,
+            max_queries=9, max_bytes=200, expected_status=201,
+        )
+
+    def test_room_detail(self):
+        def seed(rows):
+            room = self.create_room(rows)
+            return {'url': f'/api/battles/rooms/{room.id}/'}
+
+        self.assertQueryBudget(
+            'get', None, seed=seed,
+            max_queries=2, max_bytes=600,
+        )
+
+    def test_room_delete(self):
+        def seed(rows):
+            room = self.create_room(rows)
+            return {'url': f'/api/battles/rooms/{room.id}/'}
+
+        # 토너먼트 경기 연결 해제(SET_NULL) UPDATE, 다인 방 참가자/이벤트 로그 DELETE 각 1회 포함
+        self.assertQueryBudget(
+            'delete', None, seed=seed, user=self.host,
+            max_queries=10, max_bytes=0, expected_status=204,
+        )
+
+    def test_verify_password(self):
+        def seed(rows):
+            room = self.create_room(rows, is_private=True, private_password='1234')
+            return {'url': f'/api/battles/rooms/{room.id}/verify-password/'}
+
+        self.assertQueryBudget(
+            'post', None, seed=seed, data={'password': '1234'},
+            max_queries=1, max_bytes=50,
+        )
+
+    def test_join_room(self):
+        def seed(rows):
+            room = self.create_room(rows)
+            return {'url': f'/api/battles/rooms/{room.id}/join/'}
+
+        self.assertQueryBudget(
+            'post', None, seed=seed, user=self.guest, data={},
+            max_queries=5, max_bytes=100,
+        )
+
+    def test_room_status_update(self):
+        def seed(rows):
+            room = self.create_room(rows)
+            return {'url': f'/api/battles/rooms/{room.id}/status/'}
+
+        self.assertQueryBudget(
+            'patch', None, seed=seed, user=self.host,
+            data={'status': self.playing.id},
+            max_queries=6, max_bytes=50,
+        )
+
+    def test_submit_result(self):
+        def seed(rows):
+            room = self.create_room(rows, guest=self.guest, status=self.playing)
+            BattleResult.objects.create(
+                room=room, user=self.guest,
+                remaining_time_percent=50, accuracy_percent=50, total_score=100
+            )
+            return {'url': f'/api/battles/rooms/{room.id}/submit-result/'}
+
+        self.assertQueryBudget(
+            'post', None, seed=seed, user=self.host,
+            data={'remaining_time_percent': 80, 'accuracy_percent': 90},
+            # battle_finished 수신: 토너먼트 경기방 확인, 이벤트 로그 저장 각 1회 포함
+            max_queries=8, max_bytes=1000,
+        )
+
+    def test_get_result(self):
+        def seed(rows):
+            room = self.create_room(rows, guest=self.guest, status=self.playing)
+            BattleResult.objects.bulk_create([
+                BattleResult(
+                    room=room, user=user,
+                    remaining_time_percent=score // 2, accuracy_percent=score // 2, total_score=score
+                )
+                for user, score in ((self.host, 120), (self.guest, 100))
+            ])
+            return {'url': f'/api/battles/rooms/{room.id}/result/'}
+
+        self.assertQueryBudget(
+            'get', None, seed=seed, user=self.host,
+            max_queries=10, max_bytes=1000,
+        )
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class ConstraintTests(QueryBudgetMixin, TestCase):
+    """DB 제약으로 확인하는 규칙 (호스트당 '대기' 방 하나, 결과 중복 제출/점수 범위)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.waiting = BattleStatus.objects.create(name='대기')
+        cls.playing = BattleStatus.objects.create(name='진행')
+        cls.host = User.objects.create_user(email='host@korea.ac.kr', password='pw')
+        cls.guest = User.objects.create_user(email='guest@korea.ac.kr', password='pw')
+
+    def create_room(self):
+        return self.client_for(self.host).post('/api/battles/rooms/', {'title': '방'}, format='json')
+
+    def set_status(self, room, battle_status):
+        return self.client_for(self.host).patch(
+            f'/api/battles/rooms/{room.id}/status/', {'status': battle_status.id}, format='json'
+        )
+
+    def test_one_waiting_room_per_host(self):
+        self.assertEqual(self.create_room().status_code, 201)
+        room = BattleRoom.objects.get(host=self.host)
+        self.assertTrue(room.is_waiting)
+
+        response = self.create_room()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['existing_room_id'], room.id)
+        self.assertEqual(BattleRoom.objects.filter(host=self.host).count(), 1)
+
+        # '진행' 으로 바꾸면 새로 만들 수 있고, 이전 방을 다시 '대기' 로 되돌릴 수는 없음
+        self.assertEqual(self.set_status(room, self.playing).status_code, 200)
+        room.refresh_from_db()
+        self.assertFalse(room.is_waiting)
+        self.assertEqual(self.create_room().status_code, 201)
+        new_room = BattleRoom.objects.get(host=self.host, is_waiting=True)
+        response = self.set_status(room, self.waiting)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['existing_room_id'], new_room.id)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            BattleRoom.objects.create(title='직접 생성', host=self.host, status=self.waiting)
+
+    def test_duplicate_submit(self):
+        room = BattleRoom.objects.create(title='방', host=self.host, guest=self.guest, status=self.playing)
+        client = self.client_for(self.host)
+        url = f'/api/battles/rooms/{room.id}/submit-result/'
+        data = {'remaining_time_percent': 50, 'accuracy_percent': 70}
+        self.assertEqual(client.post(url, data, format='json').status_code, 200)
+        response = client.post(url, data, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['error'], '이미 결과를 제출했습니다.')
+        self.assertEqual(
+            list(BattleResult.objects.filter(room=room).values_list('total_score', 'result')),
+            [(120, 'win')]
+        )
+
+    def test_result_score_checks(self):
+        room = BattleRoom.objects.create(title='방', host=self.host, guest=self.guest, status=self.playing)
+        for remaining, accuracy, total in ((101, 0, 101), (-1, 50, 49), (50, 50, 90)):
+            with self.subTest(values=(remaining, accuracy, total)):
+                with self.assertRaises(IntegrityError), transaction.atomic():
+                    BattleResult.objects.create(
+                        room=room, user=self.host, remaining_time_percent=remaining,
+                        accuracy_percent=accuracy, total_score=total,
+                    )
+
+
+class AsyncPollingViewTests(TestCase):
+    """ASGI 모드 비동기 폴링 뷰가 기존 DRF 뷰와 같은 응답을 내는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        waiting = BattleStatus.objects.create(name='대기')
+        cls.host = User.objects.create_user(email='host@korea.ac.kr', password='pw')
+        cls.guest = User.objects.create_user(email='guest@korea.ac.kr', password='pw')
+        problem_type = Type.objects.create(name='미니')
+        subject = Subject.objects.create(name='자료구조')
+        problem = Problem.objects.create(
+            title='문제', description='설명', type=problem_type,
+            subject=subject, correct_answer='1'
+        )
+        cls.room = BattleRoom.objects.create(
+            title='방', host=cls.host, guest=cls.guest, status=waiting
+        )
+        cls.room.problems.add(problem)
+        BattleResult.objects.create(
+            room=cls.room, user=cls.guest,
+            remaining_time_percent=40, accuracy_percent=60, total_score=100
+        )
+        cls.group_room = BattleRoom.objects.create(
+            title='다인 방', host=cls.guest, status=waiting, capacity=4
+        )
+        BattleParticipant.objects.bulk_create([
+            BattleParticipant(room=cls.group_room, user=user) for user in (cls.host, cls.guest)
+        ])
+
+    def auth_headers(self, user):
+        return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+    def assertSameResponse(self, async_view, sync_view, path, user=None, **kwargs):
+        headers = self.auth_headers(user) if user else {}
+        sync_response = sync_view(RequestFactory().get(path, **headers), **kwargs)
+        sync_response.render()
+        async_response = async_to_sync(async_view)(RequestFactory().get(path, **headers), **kwargs)
+        # DRF 뷰로 넘긴 응답은 핸들러 대신 여기서 렌더링
+        if hasattr(async_response, 'render'):
+            async_response.render()
+
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.content, sync_response.content)
+
+    def test_room_list(self):
+        self.assertSameResponse(
+            async_views.room_list_create, views.BattleRoomListCreateView.as_view(),
+            '/api/battles/rooms/',
+        )
+
+    @override_settings(CACHE_SHARED=True)
+    def test_room_list_etag(self):
+        cache.clear()
+        response = async_to_sync(async_views.room_list_create)(RequestFactory().get('/api/battles/rooms/'))
+        response.render()
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        with self.assertNumQueries(0):
+            response = async_to_sync(async_views.room_list_create)(
+                RequestFactory().get('/api/battles/rooms/', HTTP_IF_NONE_MATCH=response['ETag'])
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_room_detail(self):
+        for room_id in (self.room.id, self.group_room.id, 0):
+            with self.subTest(room_id=room_id):
+                self.assertSameResponse(
+                    async_views.room_retrieve_destroy, views.BattleRoomRetrieveDestroyView.as_view(),
+                    f'/api/battles/rooms/{room_id}/', id=room_id,
+                )
+
+    def test_result(self):
+        for room in (self.room, self.group_room):
+            for user in (self.host, self.guest, None):
+                with self.subTest(room=room.id, user=user):
+                    self.assertSameResponse(
+                        async_views.get_battle_result, views.get_battle_result,
+                        f'/api/battles/rooms/{room.id}/result/', user=user, room_id=room.id,
+                    )
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class GroupBattleTests(QueryBudgetMixin, TestCase):
+    """다인 대결방 참가/순위 확정 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        BattleStatus.objects.create(name='대기')
+        BattleStatus.objects.create(name='진행')
+        BattleStatus.objects.create(name='종료')
+        cls.host = User.objects.create_user(email='host@korea.ac.kr', password='pw')
+
+    def create_group_room(self, capacity):
+        """정원 capacity 방을 만들고 가득 채움, (방, 참가자 목록) 반환"""
+        response = self.client_for(self.host).post(
+            '/api/battles/rooms/', {'title': '다인 방', 'capacity': capacity}, format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        room = BattleRoom.objects.get(host=self.host, status__name='대기')
+        players = User.objects.bulk_create([
+            User(email=f'p{capacity}_{i}@korea.ac.kr') for i in range(capacity - 1)
+        ])
+        for player in players:
+            response = self.client_for(player).post(f'/api/battles/rooms/{room.id}/join/')
+            self.assertEqual(response.status_code, 200)
+        room.refresh_from_db()
+        return room, [self.host, *players]
+
+    def submit(self, room, user, score):
+        return self.client_for(user).post(
+            f'/api/battles/rooms/{room.id}/submit-result/',
+            {'remaining_time_percent': score, 'accuracy_percent': score}, format='json'
+        )
+
+    def test_capacity_validation(self):
+        response = self.client_for(self.host).post(
+            '/api/battles/rooms/', {'title': '방', 'capacity': 17}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('capacity', response.data)
+
+    def test_join_until_full(self):
+        room, players = self.create_group_room(4)
+        self.assertEqual(room.status.name, '진행')
+        self.assertIsNotNone(room.deadline)
+        self.assertEqual(room.participants.count(), 4)
+
+        late = User.objects.create(email='late@korea.ac.kr')
+        response = self.client_for(late).post(f'/api/battles/rooms/{room.id}/join/')
+        self.assertEqual(response.status_code, 400)
+        # 이미 참가한 사용자의 재입장은 성공
+        response = self.client_for(players[1]).post(f'/api/battles/rooms/{room.id}/join/')
+        self.assertEqual(response.status_code, 200)
+
+        detail = self.client_for().get(f'/api/battles/rooms/{room.id}/')
+        self.assertEqual([user['id'] for user in detail.data['participants']], [user.id for user in players])
+
+    def test_join_only_waiting_room(self):
+        response = self.client_for(self.host).post(
+            '/api/battles/rooms/', {'title': '다인 방', 'capacity': 4}, format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        room = BattleRoom.objects.get(host=self.host, status__name='대기')
+        late = User.objects.create(email='late@korea.ac.kr')
+        for name in ('진행', '종료'):
+            with self.subTest(status=name):
+                # 정원 전에 시작했거나 종료된 방은 입장 불가 (다시 '진행' 으로 바뀌지 않음)
+                room.status = BattleStatus.objects.get(name=name)
+                room.save()
+                response = self.client_for(late).post(f'/api/battles/rooms/{room.id}/join/')
+                self.assertEqual(response.status_code, 400)
+                room.refresh_from_db()
+                self.assertEqual(room.status.name, name)
+                self.assertFalse(room.participants.filter(user=late).exists())
+
+    def test_expired_room_closed_once(self):
+        room, players = self.create_group_room(3)
+        BattleRoom.objects.filter(pk=room.pk).update(deadline=timezone.now() - timedelta(seconds=1))
+        self.assertTrue(finalize_room(room.id))
+        self.assertEqual(BattleRoom.objects.get(pk=room.pk).status.name, '종료')
+        # 제출 없이 종료된 방을 다시 조회해도 상태 변경/로비 무효화 없음
+        with mock.patch('battles.standings.close_room') as close_room:
+            self.assertTrue(finalize_room(room.id))
+        close_room.assert_not_called()
+
+    def test_rank_when_all_submitted(self):
+        room, players = self.create_group_room(5)
+        scores = [30, 50, 50, 10, 40]
+        for player, score in zip(players[:-1], scores):
+            response = self.submit(room, player, score)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(response.data['is_complete'])
+        self.assertEqual(self.submit(room, players[0], 20).status_code, 400)
+
+        response = self.submit(room, players[-1], scores[-1])
+        self.assertTrue(response.data['is_complete'])
+        self.assertEqual(
+            [(row['user']['id'], row['rank'], row['result']) for row in response.data['standings']],
+            [
+                (players[1].id, 1, 'win'), (players[2].id, 1, 'win'),
+                (players[4].id, 3, 'lose'), (players[0].id, 4, 'lose'), (players[3].id, 5, 'lose'),
+            ]
+        )
+        room.refresh_from_db()
+        self.assertEqual(room.status.name, '종료')
+
+        outsider = User.objects.create(email='outsider@korea.ac.kr')
+        self.assertEqual(self.client_for(outsider).get(f'/api/battles/rooms/{room.id}/result/').status_code, 403)
+
+    def test_rank_after_deadline(self):
+        room, players = self.create_group_room(4)
+        self.submit(room, players[0], 40)
+        self.submit(room, players[1], 80)
+
+        BattleRoom.objects.filter(pk=room.pk).update(deadline=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(self.submit(room, players[2], 100).status_code, 400)
+        response = self.client_for(players[3]).get(f'/api/battles/rooms/{room.id}/result/')
+        self.assertTrue(response.data['is_complete'])
+        self.assertIsNone(response.data['my_result'])
+        self.assertEqual(
+            [(row['user']['id'], row['rank']) for row in response.data['standings']],
+            [(players[1].id, 1), (players[0].id, 2)]
+        )
+
+    def test_finalize_query_count_is_constant(self):
+        def last_submit_queries(capacity):
+            # 이전 규모의 방은 종료 처리 (호스트당 '대기' 방 1개)
+            BattleRoom.objects.filter(host=self.host).update(
+                status=BattleStatus.objects.get(name='종료'), is_waiting=False
+            )
+            room, players = self.create_group_room(capacity)
+            for player in players[:-1]:
+                self.submit(room, player, 50)
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.submit(room, players[-1], 70)
+            self.assertTrue(response.data['is_complete'])
+            self.assertEqual(len(response.data['standings']), capacity)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(last_submit_queries(4), last_submit_queries(16))
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class BattleEventLogTests(QueryBudgetMixin, TestCase):
+    """대결 이벤트 로그 버퍼/묶음 저장/재생 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        playing = BattleStatus.objects.create(name='진행')
+        cls.host = User.objects.create_user(email='host@korea.ac.kr', password='pw')
+        cls.guest = User.objects.create_user(email='guest@korea.ac.kr', password='pw')
+        cls.room = BattleRoom.objects.create(title='방', host=cls.host, guest=cls.guest, status=playing)
+        cls.other_room = BattleRoom.objects.create(title='다른 방', host=cls.guest, guest=cls.host, status=playing)
+
+    def setUp(self):
+        super().setUp()
+        event_buffer.clear()
+
+    def post_events(self, user, events, room=None):
+        room = room or self.room
+        return self.client_for(user).post(
+            f'/api/battles/rooms/{room.id}/events/', {'events': events}, format='json'
+        )
+
+    def test_encode_decode(self):
+        records = [(0, 1, 2, 10, 1, 5230), (1500, 2, 3, 0, 0, -1)]
+        data = eventlog.encode(records)
+        self.assertLess(len(data), eventlog.RECORD.size * len(records) + 20)
+        chunk = BattleEventChunk(started_at=timezone.now(), data=data)
+        events = list(eventlog.decode(chunk))
+        self.assertEqual(
+            [(e.user_id, e.kind, e.problem_id, e.correct, e.value) for e in events],
+            [(1, 'answer', 10, True, 5230), (2, 'disconnect', None, False, -1)]
+        )
+        self.assertEqual(events[1].at - events[0].at, timedelta(milliseconds=1500))
+
+    def test_post_is_buffered(self):
+        response = self.post_events(self.host, [
+            {'kind': 'answer', 'problem': 3, 'correct': True, 'value': 4200},
+            {'kind': 'disconnect'},
+        ])
+        self.assertEqual((response.status_code, response.data), (202, {'accepted': 2}))
+        self.assertFalse(BattleEventChunk.objects.exists())
+
+        self.assertEqual(self.post_events(self.host, [{'kind': 'cheat'}]).status_code, 400)
+        self.assertEqual(self.post_events(self.host, []).status_code, 400)
+        outsider = User.objects.create(email='outsider@korea.ac.kr')
+        self.assertEqual(self.post_events(outsider, [{'kind': 'disconnect'}]).status_code, 403)
+
+    @override_settings(EVENT_LOG_FLUSH_EVENTS=5)
+    def test_flush_on_threshold(self):
+        self.post_events(self.guest, [{'kind': 'reconnect'}], room=self.other_room)
+        self.post_events(self.host, [{'kind': 'answer', 'problem': 1, 'value': i} for i in range(4)])
+        self.assertFalse(BattleEventChunk.objects.exists())
+
+        # 한 방이 한도에 닿으면 버퍼의 모든 방을 INSERT 한 번으로 저장
+        with CaptureQueriesContext(connection) as ctx:
+            event_buffer.append(self.room.id, self.host.id, 'answer', problem_id=2, value=9)
+        self.assertEqual(sum(q['sql'].startswith('INSERT') for q in ctx.captured_queries), 1)
+        self.assertEqual(
+            dict(BattleEventChunk.objects.values_list('room_id', 'event_count')),
+            {self.room.id: 5, self.other_room.id: 1}
+        )
+        self.assertEqual(event_buffer.rooms, {})
+
+    def test_flush_on_battle_end_and_replay(self):
+        self.post_events(self.host, [{'kind': 'answer', 'problem': 1, 'correct': True, 'value': 3000}])
+        self.post_events(self.guest, [{'kind': 'answer', 'problem': 1, 'value': 4000}])
+        for user, score in ((self.host, 90), (self.guest, 40)):
+            self.client_for(user).post(
+                f'/api/battles/rooms/{self.room.id}/submit-result/',
+                {'remaining_time_percent': score, 'accuracy_percent': score}, format='json'
+            )
+        chunk = BattleEventChunk.objects.get(room=self.room)
+        self.assertEqual(chunk.event_count, 4)
+
+        response = self.client_for(self.guest).get(f'/api/battles/rooms/{self.room.id}/events/')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        events = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(
+            [(e['user_id'], e['kind'], e['value']) for e in events],
+            [(self.host.id, 'answer', 3000), (self.guest.id, 'answer', 4000),
+             (self.host.id, 'submit', 180), (self.guest.id, 'submit', 80)]
+        )
+
+    @mock.patch('config.middleware.replica_enabled', new=lambda: True)
+    def test_replay_reads_from_primary(self):
+        # 방금 저장한 버퍼가 복제 지연으로 빠지지 않도록 GET 이어도 primary 에서 조회
+        routes = []
+
+        def record_route(room_id):
+            routes.append(reads_from_replica())
+            return iter(())
+
+        with mock.patch('battles.views.iter_events', side_effect=record_route):
+            response = self.client_for(self.guest).get(f'/api/battles/rooms/{self.room.id}/events/')
+            b''.join(response.streaming_content)
+        self.assertEqual(routes, [False])
+
+    def test_replay_merges_overlapping_chunks(self):
+        # 워커 두 개가 같은 시간대의 이벤트를 따로 저장한 경우
+        start = timezone.now()
+        BattleEventChunk.objects.bulk_create([
+            BattleEventChunk(room=self.room, started_at=start, event_count=2,
+                             data=eventlog.encode([(0, 1, 2, 1, 0, 0), (200, 1, 2, 2, 0, 0)])),
+            BattleEventChunk(room=self.room, started_at=start + timedelta(milliseconds=100), event_count=2,
+                             data=eventlog.encode([(0, 2, 2, 1, 0, 0), (200, 2, 2, 2, 0, 0)])),
+        ])
+        events = eventlog.iter_events(self.room.id)
+        self.assertIsInstance(events, Iterator)
+        self.assertEqual([(e.user_id, e.problem_id) for e in events], [(1, 1), (2, 1), (1, 2), (2, 2)])
+
+
+@override_settings(SPECTATE_INTERVAL=0.01, SPECTATE_HEARTBEAT=1)
+class SpectateTests(QuietRequestLogMixin, TestCase):
+    """관전 스냅숏 공유/팬아웃/관전자 한도 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.playing = BattleStatus.objects.create(name='진행')
+        cls.finished = BattleStatus.objects.create(name='종료')
+        cls.host = User.objects.create_user(email='host@korea.ac.kr', password='pw')
+        cls.guest = User.objects.create_user(email='guest@korea.ac.kr', password='pw')
+        cls.room = BattleRoom.objects.create(title='결승', host=cls.host, guest=cls.guest, status=cls.playing)
+        cls.private_room = BattleRoom.objects.create(
+            title='비공개', host=cls.guest, status=cls.playing, is_private=True, private_password='1234'
+        )
+
+    def snapshot_count(self):
+        return REGISTRY.get_sample_value('battle_spectate_snapshots_total') or 0
+
+    def test_snapshot_query_count(self):
+        with self.assertNumQueries(2):
+            snapshot = spectate.room_snapshot(self.room.id)
+        self.assertEqual([player['id'] for player in snapshot['players']], [self.host.id, self.guest.id])
+        self.assertNotIn('private_password', snapshot)
+        self.assertIsNone(spectate.room_snapshot(self.private_room.id))
+
+        group = BattleRoom.objects.create(title='다인', host=self.host, status=self.playing, capacity=16)
+        users = User.objects.bulk_create([User(email=f'w{i}@korea.ac.kr') for i in range(16)])
+        BattleParticipant.objects.bulk_create([BattleParticipant(room=group, user=user) for user in users])
+        with self.assertNumQueries(3):
+            self.assertEqual(len(spectate.room_snapshot(group.id)['players']), 16)
+
+    def test_polling_shares_snapshot(self):
+        first = self.client.get(f'/api/battles/rooms/{self.room.id}/watch/')
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(json.loads(first.content)['status'], '진행')
+        with self.settings(SPECTATE_INTERVAL=60), CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(f'/api/battles/rooms/{self.room.id}/watch/')
+        self.assertEqual((len(ctx.captured_queries), second.content), (0, first.content))
+        self.assertEqual(self.client.get(f'/api/battles/rooms/{self.private_room.id}/watch/').status_code, 404)
+
+    def test_slow_subscriber_keeps_latest(self):
+        async def offer():
+            subscriber = spectate.Subscriber()
+            for message in (b'1', b'2', b'3'):
+                subscriber.offer(message)
+            return subscriber.queue.qsize(), subscriber.queue.get_nowait()
+
+        skipped = REGISTRY.get_sample_value('battle_spectate_skipped_total') or 0
+        self.assertEqual(async_to_sync(offer)(), (1, b'3'))
+        self.assertEqual(REGISTRY.get_sample_value('battle_spectate_skipped_total') - skipped, 2)
+
+    async def test_fan_out_same_bytes(self):
+        before = self.snapshot_count()
+        subscriptions = [spectate.hub.subscribe(self.room.id) for _ in range(3)]
+        streams = [spectate.hub.stream(feed, subscriber) for feed, subscriber in subscriptions]
+        messages = [await anext(stream) for stream in streams]
+        # 관전자 수와 무관하게 한 번 조회, 한 번 직렬화한 같은 bytes 객체
+        self.assertEqual(self.snapshot_count() - before, 1)
+        self.assertTrue(all(message is messages[0] for message in messages))
+        self.assertTrue(messages[0].startswith(b'event: state\n'))
+
+        await BattleRoom.objects.filter(pk=self.room.pk).aupdate(status=self.finished)
+        for stream in streams:
+            rest = [message async for message in stream if message != spectate.HEARTBEAT_MESSAGE]
+            # 마지막 상태와 end 가 한 메시지
+            self.assertEqual(len(rest), 1)
+            self.assertIn('"종료"', rest[0].decode())
+            self.assertTrue(rest[0].endswith(spectate.END_MESSAGE))
+        self.assertEqual((spectate.hub.viewers, spectate.hub.feeds), (0, {}))
+
+    async def test_viewer_limit(self):
+        with self.settings(SPECTATE_MAX_VIEWERS=2):
+            responses = [
+                await async_views.watch_room(RequestFactory().get('/watch/'), room_id=self.room.id)
+                for _ in range(3)
+            ]
+            self.assertEqual([response.status_code for response in responses], [200, 200, 503])
+            self.assertEqual(responses[0]['Content-Type'], 'text/event-stream')
+            # 연결이 끊기면 Django 가 response.close() 를 호출하고 관전자 수에서 빠짐
+            for response in responses[:2]:
+                await anext(aiter(response.streaming_content))
+                response.close()
+            self.assertEqual(spectate.hub.viewers, 0)
+            response = await async_views.watch_room(RequestFactory().get('/watch/'), room_id=self.room.id)
+            self.assertEqual(response.status_code, 200)
+            response.close()
+        response = await async_views.watch_room(RequestFactory().get('/watch/'), room_id=self.private_room.id)
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+    THROTTLE_BUCKETS={
+        'verify-password': {'ip': (3, 1), 'room': (5, 1)},
+        'join-room': {'user': (2, 1)},
+    },
+)
+class ThrottleTests(QuietRequestLogMixin, TestCase):
+    """비밀번호 확인/입장 요청 제한 (토큰 버킷)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        waiting = BattleStatus.objects.create(name='대기')
+        cls.host = User.objects.create_user(email='host@korea.ac.kr', password='pw')
+        cls.guest = User.objects.create_user(email='guest@korea.ac.kr', password='pw')
+        cls.room = BattleRoom.objects.create(
+            title='방', host=cls.host, status=waiting,
+            is_private=True, private_password='1234'
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def verify(self, ip):
+        return self.client.post(
+            f'/api/battles/rooms/{self.room.id}/verify-password/',
+            {'password': '0000'}, content_type='application/json', REMOTE_ADDR=ip
+        )
+
+    def test_rejected_before_db_access(self):
+        for _ in range(3):
+            self.assertEqual(self.verify('10.0.0.1').status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.verify('10.0.0.1')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+
+    @override_settings(THROTTLE_EXEMPT_NETWORKS=['10.0.1.0/24'])
+    def test_exempt_networks(self):
+        statuses = [self.verify('10.0.1.7').status_code for _ in range(6)]
+        self.assertEqual(statuses, [200] * 6)
+        self.assertEqual(self.verify('10.0.0.1').status_code, 200)
+
+    def test_room_bucket_shared_across_ips(self):
+        statuses = [self.verify(f'10.0.0.{i}').status_code for i in range(6)]
+        self.assertEqual(statuses, [200] * 5 + [429])
+
+    def test_join_room_per_user(self):
+        token = RefreshToken.for_user(self.guest).access_token
+        url = f'/api/battles/rooms/{self.room.id}/join/'
+        statuses = [
+            self.client.post(
+                url, {'password': '0000'}, content_type='application/json',
+                HTTP_AUTHORIZATION=f'Bearer {token}'
+            ).status_code
+            for _ in range(3)
+        ]
+        self.assertEqual(statuses, [200, 200, 429])
+
+
+class WaitingRoomMigrationTests(TestCase):
+    """0009 마이그레이션의 is_waiting 채우기 (호스트별 중복 '대기' 방 정리)"""
+
+    def test_duplicate_waiting_rooms_closed(self):
+        waiting = BattleStatus.objects.create(name='대기')
+        host = User.objects.create(email='host@korea.ac.kr')
+        rooms = BattleRoom.objects.bulk_create([
+            BattleRoom(title=f'방 {i}', host=host, status=waiting) for i in range(3)
+        ])
+        migration = importlib.import_module('battles.migrations.0009_db_invariants')
+        migration.fill_is_waiting(apps, None)
+
+        self.assertEqual(
+            [(room.status.name, room.is_waiting) for room in BattleRoom.objects.order_by('id')],
+            [('종료', False), ('종료', False), ('대기', True)]
+        )
+        # 정리된 방은 저장해도 유니크 제약 위반 없음
+        room = BattleRoom.objects.get(pk=rooms[0].pk)
+        room.title = '수정'
+        room.save()
+
+
+class ExplainHotQueriesTests(TestCase):
+    """주요 뷰 쿼리가 인덱스를 타는지 확인 (explain_hot_queries)"""
+
+    def test_no_full_scans(self):
+        out = StringIO()
+        call_command('explain_hot_queries', '--fail-on-scan', stdout=out)
+        self.assertIn('0/', out.getvalue())
+
+
+class SeedScaleTests(TestCase):
+    """대규모 합성 데이터 생성 (seed_scale)"""
+
+    def test_seed_scale(self):
+        call_command('seed_scale', users=50, problems=30, battles=300, batch_size=40, stdout=StringIO())
+
+        self.assertEqual(User.objects.count(), 50)
+        self.assertEqual(Problem.objects.count(), 30)
+        self.assertEqual(BattleRoom.objects.count(), 300)
+        self.assertEqual(Profile.objects.filter(tech_stacks__isnull=True).count(), 0)
+        self.assertFalse(BattleRoom.objects.annotate(n=Count('problems')).filter(n__lt=3).exists())
+        # '대기' 방은 호스트마다 최대 1개, '종료' 방은 결과 2개
+        self.assertFalse(
+            BattleRoom.objects.filter(status__name='대기').values('host')
+            .annotate(n=Count('id')).filter(n__gt=1).exists()
+        )
+        self.assertEqual(
+            BattleRoom.objects.filter(is_waiting=True).count(),
+            BattleRoom.objects.filter(status__name='대기').count(),
+        )
+        finished = BattleRoom.objects.filter(status__name='종료')
+        self.assertEqual(BattleResult.objects.count(), finished.count() * 2)
+        self.assertEqual(
+            BattleResult.objects.filter(result='win').count(),
+            BattleResult.objects.filter(result='lose').count(),
+        )
+        self.assertTrue(User.objects.get(email='seed0@korea.ac.kr').check_password('seed-password'))
+
+        with self.assertRaises(CommandError):
+            call_command('seed_scale', users=5, stdout=StringIO())
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class AdminScaleTests(QuietRequestLogMixin, TestCase):
+    """대결방/결과 admin 이 데이터 규모와 무관한 쿼리로 동작하는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(email='admin@korea.ac.kr', password='pw')
+        cls.finished = BattleStatus.objects.create(name='종료')
+        problem_type = Type.objects.create(name='미니')
+        subject = Subject.objects.create(name='자료구조')
+        cls.problems = Problem.objects.bulk_create([
+            Problem(title=f'문제 {i}', description='설명', type=problem_type,
+                    subject=subject, correct_answer='1')
+            for i in range(5)
+        ])
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def seed_results(self, rows):
+        for i in range(BattleRoom.objects.count(), rows):
+            host = User.objects.create(email=f'host{i}@korea.ac.kr')
+            guest = User.objects.create(email=f'guest{i}@korea.ac.kr')
+            room = BattleRoom.objects.create(
+                title=f'방 {i}', host=host, guest=guest, status=self.finished
+            )
+            BattleResult.objects.bulk_create([
+                BattleResult(room=room, user=user, remaining_time_percent=50,
+                             accuracy_percent=50, total_score=100, result='draw')
+                for user in (host, guest)
+            ])
+
+    def test_changelist_queries_constant(self):
+        for url in ('/admin/battles/battleroom/', '/admin/battles/battleresult/'):
+            counts = []
+            for rows in (1, 20):
+                self.seed_results(rows)
+                with CaptureQueriesContext(connection) as queries:
+                    self.assertEqual(self.client.get(url).status_code, 200)
+                counts.append(len(queries))
+            self.assertEqual(counts[0], counts[1], url)
+
+    def test_search_by_id_and_email_prefix(self):
+        self.seed_results(3)
+        room = BattleRoom.objects.get(title='방 1')
+        for term in (str(room.id), 'host1@', 'guest1@korea'):
+            response = self.client.get('/admin/battles/battleroom/', {'q': term})
+            self.assertEqual(list(response.context['cl'].result_list), [room], term)
+        # 결과 번호 또는 방 번호 일치
+        response = self.client.get('/admin/battles/battleresult/', {'q': str(room.id)})
+        self.assertEqual(
+            {result.pk for result in response.context['cl'].result_list},
+            set(BattleResult.objects.filter(Q(pk=room.id) | Q(room=room)).values_list('pk', flat=True)),
+        )
+
+    def test_search_by_title_prefix(self):
+        self.seed_results(12)
+        rooms = set(BattleRoom.objects.filter(title__in=['방 1', '방 10', '방 11']))
+        response = self.client.get('/admin/battles/battleroom/', {'q': '방 1'})
+        self.assertEqual(set(response.context['cl'].result_list), rooms)
+        response = self.client.get('/admin/battles/battleresult/', {'q': '방 1'})
+        self.assertEqual(
+            {result.room for result in response.context['cl'].result_list}, rooms,
+        )
+        # 제목/이메일 모두 부분 일치는 인덱스를 못 타므로 찾지 않음
+        response = self.client.get('/admin/battles/battleroom/', {'q': 'korea'})
+        self.assertEqual(len(response.context['cl'].result_list), 0)
+
+    def test_change_form_does_not_render_all_problems(self):
+        self.seed_results(1)
+        room = BattleRoom.objects.get()
+        room.problems.set(self.problems[:1])
+        response = self.client.get(f'/admin/battles/battleroom/{room.id}/change/')
+        self.assertContains(response, '문제 0')
+        self.assertNotContains(response, '문제 4')
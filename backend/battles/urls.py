@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     BattleStatusListView,
@@ -8,8 +9,24 @@ from .views import (
     BattleRoomStatusUpdateView,
     submit_battle_result,
     get_battle_result,
+    battle_events,
+    watch_room,
 )
 
+if settings.ASYNC_VIEWS:
+    # ASGI 모드: 폴링이 많은 GET 엔드포인트를 비동기 뷰로 처리
+    from . import async_views
+    room_list_create = async_views.room_list_create
+    room_retrieve_destroy = async_views.room_retrieve_destroy
+    battle_result = async_views.get_battle_result
+    # 관전: SSE 스트림 (WSGI 모드는 공유 스냅숏 JSON 폴링)
+    watch = async_views.watch_room
+else:
+    room_list_create = BattleRoomListCreateView.as_view()
+    room_retrieve_destroy = BattleRoomRetrieveDestroyView.as_view()
+    battle_result = get_battle_result
+    watch = watch_room
+
 urlpatterns = [
     # ---------- Reference Data ----------
     # GET /api/battles/statuses/ - 대결상태 목록
@@ -18,10 +35,10 @@ urlpatterns = [
     # ---------- BattleRoom ----------
     # GET /api/battles/rooms/ - 대결방 목록 조회 ('대기' 상태만)
     # POST /api/battles/rooms/ - 대결방 생성
-    path('rooms/', BattleRoomListCreateView.as_view(), name='battle-room-list-create'),
+    path('rooms/', room_list_create, name='battle-room-list-create'),
     # GET /api/battles/rooms/{id}/ - 대결방 상세 조회
     # DELETE /api/battles/rooms/{id}/ - 대결방 삭제
-    path('rooms/<int:id>/', BattleRoomRetrieveDestroyView.as_view(), name='battle-room-retrieve-destroy'),
+    path('rooms/<int:id>/', room_retrieve_destroy, name='battle-room-retrieve-destroy'),
     # POST /api/battles/rooms/{id}/verify-password/ - 비공개 방 비밀번호 확인
     path('rooms/<int:room_id>/verify-password/', verify_password, name='verify-password'),
     # POST /api/battles/rooms/{id}/join/ - 대결방 입장
@@ -31,6 +48,11 @@ urlpatterns = [
     # POST /api/battles/rooms/{room_id}/submit-result/ - 대결 결과 제출
     path('rooms/<int:room_id>/submit-result/', submit_battle_result, name='submit-battle-result'),
     # GET /api/battles/rooms/{room_id}/result/ - 대결 결과 조회
-    path('rooms/<int:room_id>/result/', get_battle_result, name='get-battle-result'),
+    path('rooms/<int:room_id>/result/', battle_result, name='get-battle-result'),
+    # POST /api/battles/rooms/{id}/events/ - 대결 이벤트 일괄 전송 (답안, 연결 끊김 등)
+    # GET /api/battles/rooms/{id}/events/ - 이벤트 로그 재생 (JSON Lines)
+    path('rooms/<int:room_id>/events/', battle_events, name='battle-events'),
+    # GET /api/battles/rooms/{id}/watch/ - 관전 (공개 방만, 읽기 전용)
+    path('rooms/<int:room_id>/watch/', watch, name='battle-watch'),
 ]
 
@@ -3,10 +3,32 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.decorators import method_decorator
 from urllib.parse import unquote
 
-from .models import BattleStatus, BattleRoom
+import json
+from collections import defaultdict
+
+from config.caching import cached_view, conditional_view
+from config.db_router import use_primary
+from config.fastpath import FastListMixin
+from config.throttling import throttle
+from config.metrics import (
+    BATTLE_ROOMS_CREATED, BATTLE_JOINS, BATTLE_RESULTS_SUBMITTED, BATTLE_POLLS,
+)
+
+from .cache import LOBBY_CACHE, LOBBY_CACHE_TIMEOUT, invalidate_lobby
+from .eventlog import event_buffer, iter_events
+from .signals import battle_finished
+from .spectate import snapshot_cache
+from .standings import finalize_room, join_group_room, result_deadline, standings
+from .models import BattleStatus, BattleRoom, BattleParticipant
 from .serializers import (
     BattleStatusSerializer,
     BattleRoomListSerializer,
@@ -16,22 +38,28 @@ from .serializers import (
     PasswordVerifySerializer,
     BattleResultSubmitSerializer,
     BattleResultSerializer,
+    BattleEventBatchSerializer,
 )
 from .models import BattleResult
+from problems.models import Problem
 
 
 # ---------- Reference Data Views ----------
 
-class BattleStatusListView(generics.ListAPIView):
+class BattleStatusListView(FastListMixin, generics.ListAPIView):
     """대결상태 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = BattleStatusSerializer
     queryset = BattleStatus.objects.all()
+    fast_fields = ('id', 'name')
 
 
 # ---------- BattleRoom Views ----------
 
-class BattleRoomListCreateView(generics.ListCreateAPIView):
+# 로비는 2~3초마다 폴링하므로 ETag 로 변경이 없으면 304 응답
+@method_decorator(conditional_view(LOBBY_CACHE), name='list')
+@method_decorator(cached_view(LOBBY_CACHE, ttl=LOBBY_CACHE_TIMEOUT), name='list')
+class BattleRoomListCreateView(FastListMixin, generics.ListCreateAPIView):
     """대결방 목록 조회 및 생성"""
     serializer_class = BattleRoomListSerializer
     
@@ -48,38 +76,58 @@ class BattleRoomListCreateView(generics.ListCreateAPIView):
         return BattleRoomListSerializer
     
     def get_queryset(self):
-        """'대기' 상태인 대결방만 조회"""
+        """'대기' 상태인 대결방만 조회 (문제는 fast_rows 와 같은 id 순)"""
         queryset = BattleRoom.objects.select_related(
             'host', 'status'
-        ).prefetch_related('problems').filter(
+        ).prefetch_related(
+            Prefetch('problems', queryset=Problem.objects.order_by('id'))
+        ).filter(
             status__name='대기'
         )
         
         return queryset
     
-    def create(self, request, *args, **kwargs):
-        """대결방 생성 전 검증: 이미 '대기' 상태인 대결방이 있는지 확인"""
-        user = request.user
-        
-        # 현재 사용자가 호스트인 대결방 조회
-        existing_rooms = BattleRoom.objects.filter(host=user).select_related('status')
-        
-        # '대기' 상태인 대결방이 있는지 확인
-        # '진행' 상태인 방이 있어도 새로 생성 가능
-        waiting_rooms = existing_rooms.filter(
-            status__name='대기'
-        )
+    def fast_rows(self, queryset):
+        """BattleRoomListSerializer 와 같은 구조의 dict 목록 (문제는 방 id 기준으로 조립)"""
+        rows = list(queryset.prefetch_related(None).values(
+            'id', 'title', 'is_cote', 'host_id', 'host__email',
+            'status_id', 'status__name', 'is_private', 'capacity'
+        ))
         
-        if waiting_rooms.exists():
-            return Response(
-                {
-                    'error': '이미 대기 중인 대결방이 있습니다. 대결방을 삭제하거나 종료 상태로 변경한 후 새로 생성할 수 있습니다.',
-                    'existing_room_id': waiting_rooms.first().id
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        problems = defaultdict(list)
+        for problem in Problem.objects.filter(
+            battle_rooms__in=[row['id'] for row in rows]
+        ).order_by('battle_rooms', 'id').values('battle_rooms', 'id', 'title', 'description'):
+            room_id = problem.pop('battle_rooms')
+            problems[room_id].append(problem)
         
-        return super().create(request, *args, **kwargs)
+        return [
+            {
+                'id': row['id'],
+                'title': row['title'],
+                'is_cote': row['is_cote'],
+                'host': {'id': row['host_id'], 'email': row['host__email']},
+                'status': {'id': row['status_id'], 'name': row['status__name']},
+                'is_private': row['is_private'],
+                'capacity': row['capacity'],
+                'problems': problems[row['id']],
+            }
+            for row in rows
+        ]
+    
+    def create(self, request, *args, **kwargs):
+        """
+        대결방 생성
+        '대기' 방은 호스트당 하나 (미리 조회하지 않고 DB 유니크 제약으로 확인, '진행' 방이 있어도 생성 가능)
+        """
+        try:
+            with transaction.atomic():
+                return super().create(request, *args, **kwargs)
+        except IntegrityError:
+            conflict = waiting_room_conflict(request.user)
+            if conflict is None:
+                raise
+            return conflict
     
     def perform_create(self, serializer):
         """호스트를 현재 로그인한 사용자로 설정하고 상태를 '대기'로 고정"""
@@ -89,7 +137,43 @@ class BattleRoomListCreateView(generics.ListCreateAPIView):
             raise ValidationError({
                 'error': "'대기' 상태가 데이터베이스에 존재하지 않습니다."
             })
-        serializer.save(host=self.request.user, status=waiting_status)
+        room = serializer.save(host=self.request.user, status=waiting_status)
+        if room.is_group:
+            # 다인 방은 호스트도 참가자 목록에 포함
+            BattleParticipant.objects.create(room=room, user=self.request.user)
+        # 문제 연결까지 끝난 뒤 로비 캐시 무효화 (방 저장 시점은 signals.py 에서 처리)
+        invalidate_lobby()
+        BATTLE_ROOMS_CREATED.inc()
+
+
+def waiting_room_conflict(user):
+    """
+    '대기' 방 중복으로 저장이 실패했을 때의 응답 (battleroom_one_waiting_per_host 제약)
+    기존 '대기' 방이 없으면 다른 제약 위반이므로 None
+    """
+    room_id = BattleRoom.objects.filter(host=user, is_waiting=True).values_list('id', flat=True).first()
+    if room_id is None:
+        return None
+    return Response(
+        {
+            'error': '이미 대기 중인 대결방이 있습니다. 대결방을 삭제하거나 종료 상태로 변경한 후 새로 생성할 수 있습니다.',
+            'existing_room_id': room_id
+        },
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+def tournament_room_forbidden(room):
+    """
+    토너먼트 경기방이면 403 응답 (대진표가 방을 관리하므로 호스트도 삭제/상태 변경 불가)
+    room 은 select_related('tournament_match') 로 조회해야 추가 쿼리가 없음
+    """
+    if not hasattr(room, 'tournament_match'):
+        return None
+    return Response(
+        {'error': '토너먼트 경기방은 삭제하거나 상태를 변경할 수 없습니다.'},
+        status=status.HTTP_403_FORBIDDEN
+    )
 
 
 class BattleRoomRetrieveDestroyView(generics.RetrieveDestroyAPIView):
@@ -106,10 +190,15 @@ class BattleRoomRetrieveDestroyView(generics.RetrieveDestroyAPIView):
             return [AllowAny()]
         return [IsAuthenticated()]
     
+    def retrieve(self, request, *args, **kwargs):
+        """대결 화면 폴링 요청"""
+        BATTLE_POLLS.labels('room-detail').inc()
+        return super().retrieve(request, *args, **kwargs)
+    
     def get_queryset(self):
         """DELETE는 호스트만 자신의 방을 삭제할 수 있음"""
         if self.request.method == 'DELETE':
-            return BattleRoom.objects.filter(host=self.request.user)
+            return BattleRoom.objects.filter(host=self.request.user).select_related('tournament_match')
         return BattleRoom.objects.select_related(
             'host', 'status'
         ).prefetch_related('problems').all()
@@ -122,9 +211,13 @@ class BattleRoomRetrieveDestroyView(generics.RetrieveDestroyAPIView):
                 {'error': '호스트만 방을 삭제할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
+        forbidden = tournament_room_forbidden(room)
+        if forbidden:
+            return forbidden
         return super().destroy(request, *args, **kwargs)
 
 
+@throttle('verify-password')  # 비밀번호 대입 방지, DB 조회 전에 거절
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def verify_password(request, room_id):
@@ -147,6 +240,7 @@ def verify_password(request, room_id):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@throttle('join-room')  # 비밀번호 대입 방지, DB 조회 전에 거절
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def join_room(request, room_id):
@@ -177,6 +271,18 @@ def join_room(request, room_id):
                 status=status.HTTP_200_OK
             )
     
+    # 다인 방: 정원 안에서 참가자 추가 (정원이 차면 '진행')
+    if room.is_group:
+        joined, error = join_group_room(room.id, user)
+        if not joined:
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+        BATTLE_JOINS.inc()
+        event_buffer.append(room.id, user.id, 'join')
+        return Response(
+            {'success': True, 'message': '대결방에 입장했습니다.'},
+            status=status.HTTP_200_OK
+        )
+    
     # 이미 게스트가 있는지 확인
     if room.guest and room.guest != user:
         return Response(
@@ -192,6 +298,8 @@ def join_room(request, room_id):
             room.status = playing_status
 
         room.save()
+        BATTLE_JOINS.inc()
+        event_buffer.append(room.id, user.id, 'join')
 
     return Response(
         {'success': True, 'message': '대결방에 입장했습니다.'},
@@ -208,7 +316,7 @@ class BattleRoomStatusUpdateView(generics.UpdateAPIView):
     
     def get_queryset(self):
         """호스트만 자신의 방 상태를 변경할 수 있음"""
-        return BattleRoom.objects.filter(host=self.request.user)
+        return BattleRoom.objects.filter(host=self.request.user).select_related('tournament_match')
     
     def update(self, request, *args, **kwargs):
         room = self.get_object()
@@ -217,7 +325,27 @@ class BattleRoomStatusUpdateView(generics.UpdateAPIView):
                 {'error': '호스트만 상태를 변경할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
-        return super().update(request, *args, **kwargs)
+        forbidden = tournament_room_forbidden(room)
+        if forbidden:
+            return forbidden
+        try:
+            with transaction.atomic():
+                return super().update(request, *args, **kwargs)
+        except IntegrityError:
+            # 다른 방을 '대기' 로 되돌리는 경우
+            conflict = waiting_room_conflict(request.user)
+            if conflict is None:
+                raise
+            return conflict
+    
+    def perform_update(self, serializer):
+        """다인 방을 정원이 차기 전에 '진행' 으로 바꾸면 그때부터 제출 기한 적용"""
+        room = serializer.instance
+        new_status = serializer.validated_data.get('status')
+        if room.is_group and room.deadline is None and new_status and new_status.name == '진행':
+            serializer.save(deadline=result_deadline())
+        else:
+            serializer.save()
 
 
 class BattleRoomDeleteView(generics.DestroyAPIView):
@@ -228,7 +356,7 @@ class BattleRoomDeleteView(generics.DestroyAPIView):
     
     def get_queryset(self):
         """호스트만 자신의 방을 삭제할 수 있음"""
-        return BattleRoom.objects.filter(host=self.request.user)
+        return BattleRoom.objects.filter(host=self.request.user).select_related('tournament_match')
     
     def destroy(self, request, *args, **kwargs):
         room = self.get_object()
@@ -237,84 +365,104 @@ class BattleRoomDeleteView(generics.DestroyAPIView):
                 {'error': '호스트만 방을 삭제할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
+        forbidden = tournament_room_forbidden(room)
+        if forbidden:
+            return forbidden
         return super().destroy(request, *args, **kwargs)
 
 
+def create_result(room, user, validated_data):
+    """
+    검증된 제출 데이터로 결과 저장 (점수 범위/합산은 DB 체크 제약으로도 보장)
+    이미 제출한 경우 None (미리 조회하지 않고 유니크 제약 위반으로 판단)
+    """
+    remaining_time_percent = validated_data['remaining_time_percent']
+    accuracy_percent = validated_data['accuracy_percent']
+    total_score = remaining_time_percent + accuracy_percent
+    try:
+        with transaction.atomic():
+            result = BattleResult.objects.create(
+                room=room,
+                user=user,
+                remaining_time_percent=remaining_time_percent,
+                accuracy_percent=accuracy_percent,
+                total_score=total_score
+            )
+    except IntegrityError:
+        return None
+    BATTLE_RESULTS_SUBMITTED.inc()
+    event_buffer.append(room.id, user.id, 'submit', value=total_score)
+    return result
+
+
+def decide_result(result, other):
+    """1대1 두 결과의 승패를 점수로 결정 (저장은 호출하는 쪽에서, async_views 와 공유)"""
+    if result.total_score > other.total_score:
+        result.result, other.result = 'win', 'lose'
+    elif result.total_score < other.total_score:
+        result.result, other.result = 'lose', 'win'
+    else:
+        # 동점 (무승부)
+        result.result, other.result = 'draw', 'draw'
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@transaction.atomic
 def submit_battle_result(request, room_id):
-    """대결 결과 제출 및 승패 판단"""
-    room = get_object_or_404(BattleRoom, id=room_id)
+    """
+    대결 결과 제출 및 승패 판단
+    같은 방의 두 제출이 서로의 결과를 못 보고 둘 다 '상대 대기' 로 끝나지 않도록
+    방 행을 잠그고 차례로 처리 (그래야 두 번째 제출에서 battle_finished 가 항상 발생)
+    """
+    room = get_object_or_404(BattleRoom.objects.select_for_update(), id=room_id)
     user = request.user
     
-    # 참가자 확인 (host 또는 guest만 제출 가능)
-    if room.host != user and room.guest != user:
+    if room.is_group:
+        return submit_group_result(request, room)
+    
+    # 참가자 확인 (host 또는 guest만 제출 가능, 사용자 조회 없이 id 로 비교)
+    if user.id not in (room.host_id, room.guest_id):
         return Response(
             {'error': '이 대결방의 참가자가 아닙니다.'},
             status=status.HTTP_403_FORBIDDEN
         )
     
-    # 이미 제출했는지 확인
-    existing_result = BattleResult.objects.filter(room=room, user=user).first()
-    if existing_result:
-        return Response(
-            {'error': '이미 결과를 제출했습니다.'},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-    
     # 결과 데이터 검증
     serializer = BattleResultSubmitSerializer(data=request.data)
     if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    remaining_time_percent = serializer.validated_data['remaining_time_percent']
-    accuracy_percent = serializer.validated_data['accuracy_percent']
-    total_score = remaining_time_percent + accuracy_percent
-    
-    # 결과 저장
-    battle_result = BattleResult.objects.create(
-        room=room,
-        user=user,
-        remaining_time_percent=remaining_time_percent,
-        accuracy_percent=accuracy_percent,
-        total_score=total_score
-    )
+    # 결과 저장 (이미 제출했으면 room+user 유니크 제약으로 INSERT 실패)
+    battle_result = create_result(room, user, serializer.validated_data)
+    if battle_result is None:
+        return Response(
+            {'error': '이미 결과를 제출했습니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
     # 상대방 확인
-    opponent = room.guest if user == room.host else room.host
+    opponent_id = room.guest_id if user.id == room.host_id else room.host_id
     
     # 상대방이 없는 경우 (1대1 대결이므로 이 경우는 없어야 하지만 안전장치)
-    if not opponent:
+    if not opponent_id:
         battle_result.result = 'win'  # 상대방이 없으면 승리
-        battle_result.save()
+        battle_result.save(update_fields=['result'])
         return Response({
             'message': '결과가 제출되었습니다. (상대방 없음)',
             'my_result': BattleResultSerializer(battle_result).data,
             'is_complete': True
         }, status=status.HTTP_200_OK)
     
-    opponent_result = BattleResult.objects.filter(room=room, user=opponent).first()
+    opponent_result = BattleResult.objects.select_related('user').filter(room=room, user_id=opponent_id).first()
     
     # 승패 판단
     if opponent_result:
         # 둘 다 제출한 경우
-        opponent_score = opponent_result.total_score
-        
-        if total_score > opponent_score:
-            # 현재 사용자 승리
-            battle_result.result = 'win'
-            opponent_result.result = 'lose'
-        elif total_score < opponent_score:
-            # 현재 사용자 패배
-            battle_result.result = 'lose'
-            opponent_result.result = 'win'
-        else:
-            # 동점 (무승부)
-            battle_result.result = 'draw'
-            opponent_result.result = 'draw'
-        
-        battle_result.save()
-        opponent_result.save()
+        decide_result(battle_result, opponent_result)
+        battle_result.save(update_fields=['result'])
+        opponent_result.save(update_fields=['result'])
+        battle_finished.send(sender=BattleRoom, room=room)
         
         # 결과 반환 (둘 다 제출 완료)
         return Response({
@@ -331,7 +479,7 @@ def submit_battle_result(request, room_id):
         # (시간 제한이 다 되면 클라이언트에서 자동으로 0을 보내므로 결국 둘 다 제출하게 됨)
         # 하지만 네트워크 오류 등으로 한 사람만 제출한 경우를 대비
         battle_result.result = 'win'  # 제출한 사람이 승리
-        battle_result.save()
+        battle_result.save(update_fields=['result'])
         
         return Response({
             'message': '결과가 제출되었습니다. 상대방의 결과를 기다리는 중입니다. (현재 승리 상태)',
@@ -340,13 +488,18 @@ def submit_battle_result(request, room_id):
         }, status=status.HTTP_200_OK)
 
 
+@use_primary  # 조회 중 승패를 저장하므로 복제본이 아닌 primary 에서 읽음
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_battle_result(request, room_id):
     """대결 결과 조회"""
+    BATTLE_POLLS.labels('result').inc()
     room = get_object_or_404(BattleRoom, id=room_id)
     user = request.user
     
+    if room.is_group:
+        return get_group_result(request, room)
+    
     # 참가자 확인
     if room.host != user and room.guest != user:
         return Response(
@@ -392,22 +545,7 @@ def get_battle_result(request, room_id):
     if my_result and opponent_result:
         # 아직 승패가 결정되지 않은 경우 판단
         if not my_result.result or not opponent_result.result:
-            my_score = my_result.total_score
-            opponent_score = opponent_result.total_score
-            
-            if my_score > opponent_score:
-                # 현재 사용자 승리
-                my_result.result = 'win'
-                opponent_result.result = 'lose'
-            elif my_score < opponent_score:
-                # 현재 사용자 패배
-                my_result.result = 'lose'
-                opponent_result.result = 'win'
-            else:
-                # 동점 (무승부)
-                my_result.result = 'draw'
-                opponent_result.result = 'draw'
-            
+            decide_result(my_result, opponent_result)
             my_result.save()
             opponent_result.save()
         
@@ -417,3 +555,118 @@ def get_battle_result(request, room_id):
     return Response(response_data, status=status.HTTP_200_OK)
 
 
+def is_participant(room, user):
+    """1대1 방은 host/guest, 다인 방은 참가자 목록 기준"""
+    if room.is_group:
+        return BattleParticipant.objects.filter(room=room, user=user).exists()
+    return user.id in (room.host_id, room.guest_id)
+
+
+@use_primary  # 재생 전에 버퍼를 primary 에 저장하므로 묶음 조회도 primary 에서 (복제 지연 시 누락 방지)
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def battle_events(request, room_id):
+    """
+    POST: 대결 중 이벤트 일괄 전송 (메모리에 모았다가 묶음으로 저장, battles/eventlog.py)
+    GET: 방의 이벤트 로그를 시각순 JSON Lines 로 재생 (묶음 조회는 응답을 반환하기 전에 실행됨)
+    """
+    room = get_object_or_404(BattleRoom.objects.only('id', 'host_id', 'guest_id', 'capacity'), id=room_id)
+    user = request.user
+    if not is_participant(room, user):
+        return Response(
+            {'error': '이 대결방의 참가자가 아닙니다.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    if request.method == 'GET':
+        # 이 프로세스에 남은 이벤트도 재생에 포함
+        event_buffer.flush(room.id)
+        lines = (
+            json.dumps(event._asdict(), cls=DjangoJSONEncoder) + '\n'
+            for event in iter_events(room.id)
+        )
+        return StreamingHttpResponse(lines, content_type='application/x-ndjson')
+    
+    serializer = BattleEventBatchSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    for event in serializer.validated_data['events']:
+        event_buffer.append(
+            room.id, user.id, event['kind'],
+            problem_id=event.get('problem'), correct=event['correct'], value=event['value'],
+        )
+    return Response({'accepted': len(serializer.validated_data['events'])}, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def watch_room(request, room_id):
+    """
+    관전 (WSGI 모드): 방 상태 JSON, SPECTATE_INTERVAL 초 동안 같은 스냅숏을 모든 관전자가 공유
+    ASGI 모드에서는 async_views.watch_room 이 같은 내용을 SSE 스트림으로 보냄
+    """
+    data = snapshot_cache.get(room_id)
+    if data is None:
+        return Response(
+            {'error': '관전할 수 있는 대결방이 없습니다.'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return HttpResponse(data, content_type='application/json')
+
+
+# ---------- Group Battle (capacity > 2) ----------
+
+def submit_group_result(request, room):
+    """다인 방 결과 제출 (마지막 제출이면 순위 확정)"""
+    user = request.user
+    if not BattleParticipant.objects.filter(room=room, user=user).exists():
+        return Response(
+            {'error': '이 대결방의 참가자가 아닙니다.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    if room.deadline is None:
+        return Response(
+            {'error': '아직 시작하지 않은 대결방입니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if room.deadline <= timezone.now():
+        finalize_room(room.id)
+        return Response(
+            {'error': '결과 제출 기한이 지났습니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    serializer = BattleResultSubmitSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    if create_result(room, user, serializer.validated_data) is None:
+        return Response(
+            {'error': '이미 결과를 제출했습니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    is_complete = finalize_room(room.id)
+    return group_result_response(room, user, is_complete)
+
+
+def get_group_result(request, room):
+    """다인 방 결과 조회 (기한이 지났으면 제출한 사람끼리 순위 확정)"""
+    user = request.user
+    if not BattleParticipant.objects.filter(room=room, user=user).exists():
+        return Response(
+            {'error': '이 대결방의 참가자가 아닙니다.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    is_complete = room.deadline is not None and finalize_room(room.id)
+    return group_result_response(room, user, is_complete)
+
+
+def group_result_response(room, user, is_complete):
+    results = list(standings(room.id))
+    my_result = next((result for result in results if result.user_id == user.id), None)
+    return Response({
+        'my_result': BattleResultSerializer(my_result).data if my_result else None,
+        'standings': BattleResultSerializer(results, many=True).data,
+        'is_complete': is_complete,
+        'deadline': room.deadline,
+    }, status=status.HTTP_200_OK)
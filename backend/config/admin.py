@@ -0,0 +1,98 @@
+"""
+대용량 테이블 admin 공통 도구
+
+    @admin.register(BattleResult)
+    class BattleResultAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+        search_id_fields = ('id', 'room_id')
+        search_user_fields = ('user',)
+
+- 목록 건수: 필터/검색이 없으면 COUNT(*) 대신 PostgreSQL 통계 추정값(pg_class.reltuples),
+  있으면 MAX_EXACT_COUNT 건까지만 셈 (show_full_result_count 도 끔)
+- 검색: 검색어 형태에 따라 인덱스가 있는 컬럼만 조회
+  (기본 search_fields 는 모든 필드를 icontains 로 OR 해서 큰 테이블에서는 전체 스캔)
+  - 숫자: search_id_fields 정확 일치
+  - 문자열: search_text_fields 의 조회 (@ 가 있으면 이메일로 봄)
+  - 이메일이거나 search_text_fields 가 비어 있으면: search_user_fields 의 사용자 이메일 접두사
+    (email 유니크 인덱스, 대소문자 구분)
+  - search_text_fields 가 None 이고 사용자 필드도 없으면 기본 search_fields 검색
+"""
+from django.contrib.auth import get_user_model
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+# 이보다 작은 테이블은 추정값 대신 실제로 셈
+ESTIMATE_MIN_ROWS = 10000
+# 필터/검색 결과는 이 건수까지만 셈 (그 이상은 페이지 이동이 의미 없음)
+MAX_EXACT_COUNT = 10000
+
+
+def estimated_count(model, using):
+    """PostgreSQL 통계의 테이블 행 수 추정값 (그 밖의 DB 이거나 ANALYZE 전이면 None)"""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    return row[0] if row and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """전체 목록은 통계 추정값, 필터/검색 결과는 상한까지만 세는 paginator"""
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= ESTIMATE_MIN_ROWS:
+                return estimate
+        return queryset.order_by()[:MAX_EXACT_COUNT].count()
+
+
+class LargeTableAdminMixin:
+    """대용량 테이블 ModelAdmin 용 (ModelAdmin 보다 앞에 상속)"""
+    paginator = EstimatedCountPaginator
+    # '전체 N건' 표시용 COUNT(*) 생략
+    show_full_result_count = False
+    search_id_fields = ('id',)
+    search_user_fields = ()
+    search_text_fields = None
+
+    def normalize_search_text(self, term):
+        return term
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        # bigint 범위를 넘는 숫자는 id 가 아님
+        if term.isdigit() and len(term) < 19:
+            condition = Q.create(
+                [(f'{field}__exact', int(term)) for field in self.search_id_fields],
+                connector=Q.OR,
+            )
+        elif self.search_text_fields and '@' not in term:
+            term = self.normalize_search_text(term)
+            condition = Q.create(
+                [(field, term) for field in self.search_text_fields],
+                connector=Q.OR,
+            )
+        elif self.search_user_fields:
+            # 조인 후 OR 대신 이메일 인덱스로 찾은 id 로 각 FK 인덱스 조회
+            users = get_user_model().objects.filter(email__startswith=term).values('pk')
+            condition = Q.create(
+                [(f'{field}__in', users) for field in self.search_user_fields],
+                connector=Q.OR,
+            )
+        elif self.search_text_fields is None:
+            return super().get_search_results(request, queryset, search_term)
+        else:
+            return queryset.none(), False
+        return queryset.filter(condition), False
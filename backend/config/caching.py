@@ -0,0 +1,228 @@
+"""
+공통 캐시 도구 (settings.CACHES 의 default 캐시 사용)
+
+- 버전 키: namespace 마다 버전 번호를 두고 키에 포함, bump_version 한 번으로
+  해당 namespace 의 모든 키를 무효화 (키를 일일이 찾아 지울 필요 없음)
+- TTL 지터: 같은 시각에 만든 키들이 한꺼번에 만료되지 않도록 TTL 을 ±10% 흔듦
+- single-flight: 만료된 키는 잠금을 얻은 워커 하나만 다시 계산하고,
+  나머지는 직전 값(stale)을 바로 반환하거나 (처음 계산 중이면) 잠시 기다림
+
+    rooms = cached_query('battles:lobby', 'list', compute_rooms, ttl=2)
+
+    @method_decorator(conditional_view('problems:list'), name='list')
+    @method_decorator(cached_view('problems:list', ttl=60), name='list')
+    class ProblemListView(...): ...
+
+conditional_view 의 ETag 는 본문 해시가 아니라 namespace 버전으로 만들기 때문에,
+If-None-Match 가 맞으면 DB 조회와 직렬화 없이 304 를 반환합니다.
+(namespace 의 데이터가 바뀌는 모든 경로에서 bump_version 을 호출해야 함 - 각 앱 signals.py)
+
+settings.CACHE_SHARED 가 False 이면 (워커별 locmem 캐시) 한 워커의 bump_version 이
+다른 워커에 보이지 않으므로 cached_query 는 매번 계산하고 conditional_view 는 ETag 를 붙이지 않습니다.
+"""
+import random
+import time
+import zlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from rest_framework import status
+from rest_framework.response import Response
+
+
+# TTL 지터 비율
+TTL_JITTER = 0.1
+# 만료 후에도 stale 값을 보관하는 시간 (TTL 배수), 이 동안은 재계산 중에도 즉시 응답
+STALE_FACTOR = 2
+# 재계산 잠금 유지 시간 (초), 계산이 이보다 오래 걸리면 다른 워커도 계산을 시작
+LOCK_TIMEOUT = 10
+# 처음 계산 중인 키를 다른 워커가 기다리는 최대 시간 (초)
+LOCK_WAIT = 2.0
+LOCK_POLL_INTERVAL = 0.05
+
+_missing = object()
+
+
+def jittered(ttl, jitter=TTL_JITTER):
+    """ttl 을 ±jitter 비율만큼 무작위로 조정"""
+    return max(1, round(ttl * random.uniform(1 - jitter, 1 + jitter)))
+
+
+def cache_shared():
+    """모든 워커가 같은 캐시를 보는지 (아니면 버전 키 기반 캐시/ETag 를 쓰지 않음)"""
+    return settings.CACHE_SHARED
+
+
+def initial_version():
+    """
+    버전 키가 없을 때의 시작 값
+    캐시가 비워지거나 재시작돼도 이전 버전(과 ETag)을 다시 쓰지 않도록 1 대신 임의의 큰 수
+    """
+    return random.getrandbits(48)
+
+
+def version_key(namespace):
+    return f'{namespace}:version'
+
+
+def get_version(namespace):
+    version = cache.get(version_key(namespace))
+    if version is None:
+        # 버전 키는 만료되지 않도록 저장 (동시에 만든 워커끼리는 add 로 한 값만 남김)
+        initial = initial_version()
+        cache.add(version_key(namespace), initial, None)
+        version = cache.get(version_key(namespace), initial)
+    return version
+
+
+def bump_version(namespace):
+    """namespace 의 모든 캐시 키 무효화"""
+    try:
+        cache.incr(version_key(namespace))
+    except ValueError:
+        # 버전 키가 없으면 기존 키와 겹치지 않는 새 시작 값
+        cache.set(version_key(namespace), initial_version(), None)
+
+
+def versioned_key(namespace, key):
+    return f'{namespace}:v{get_version(namespace)}:{key}'
+
+
+def cached_query(namespace, key, compute, ttl):
+    """
+    compute() 결과를 ttl 초 동안 캐시 (single-flight)
+    - 저장 형식: (만료 시각, 값), 실제 캐시 TTL 은 ttl * STALE_FACTOR
+    - 공유 캐시가 아니면 캐시하지 않고 바로 계산
+    """
+    if not cache_shared():
+        return compute()
+    cache_key = versioned_key(namespace, key)
+    lock_key = f'{cache_key}:lock'
+    entry = cache.get(cache_key)
+    if entry is not None:
+        expires_at, value = entry
+        if time.time() < expires_at:
+            return value
+        # 만료: 잠금을 얻은 워커만 다시 계산, 나머지는 stale 값 반환
+        if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+            return value
+    elif not cache.add(lock_key, 1, LOCK_TIMEOUT):
+        # 처음 계산 중: 다른 워커의 결과를 잠시 기다림 (시간 초과 시 직접 계산)
+        value = _wait_for(cache_key)
+        if value is not _missing:
+            return value
+        return compute()
+
+    try:
+        value = compute()
+        timeout = jittered(ttl)
+        cache.set(cache_key, (time.time() + timeout, value), timeout * STALE_FACTOR)
+        return value
+    finally:
+        cache.delete(lock_key)
+
+
+def _wait_for(cache_key):
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            return entry[1]
+    return _missing
+
+
+def cached_view(namespace, ttl, per_user=False):
+    """
+    GET 응답 데이터를 cached_query 로 캐시하는 뷰 데코레이터
+    - 키: 요청 경로 + 쿼리스트링 (per_user=True 면 사용자 id 포함)
+    - 200 응답만 캐시, 다른 응답은 그대로 반환
+    - 클래스 뷰는 method_decorator(cached_view(...), name='list') 로 사용
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view(request, *args, **kwargs)
+
+            key = request.get_full_path()
+            if per_user:
+                key = f'{request.user.pk}:{key}'
+
+            uncached = []
+
+            def compute():
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    # 캐시하지 않도록 예외 대신 응답을 바깥으로 전달
+                    uncached.append(response)
+                    raise _Uncached
+                return response.data
+
+            try:
+                return Response(cached_query(namespace, key, compute, ttl))
+            except _Uncached:
+                return uncached[0]
+        return wrapper
+    return decorator
+
+
+class _Uncached(Exception):
+    pass
+
+
+def etag_for(request, namespace, per_user=False):
+    """namespace 버전 + 요청 경로(+ 사용자)로 만든 약한 ETag"""
+    parts = [
+        namespace,
+        str(get_version(namespace)),
+        f'{zlib.crc32(request.get_full_path().encode()):08x}',
+    ]
+    if per_user:
+        parts.append(str(request.user.pk))
+    return 'W/"%s"' % '-'.join(parts)
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 약한 비교 (W/ 접두사 무시)"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix('W/')
+    return any(
+        tag == '*' or tag.removeprefix('W/') == opaque
+        for tag in (tag.strip() for tag in if_none_match.split(','))
+    )
+
+
+def conditional_view(namespace, cache_control='no-cache', per_user=False):
+    """
+    GET 응답에 ETag / Cache-Control / Vary 를 붙이고, ETag 가 같으면 뷰를 실행하지 않고 304
+    - cache_control: 기본 no-cache (브라우저가 매번 ETag 로 재검증)
+    - per_user=True 면 ETag 에 사용자 id 포함, Vary: Authorization
+    - 공유 캐시가 아니면 ETag 없이 Cache-Control / Vary 만 붙임
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            # 뷰 실행 전의 버전 (실행 중 데이터가 바뀌면 다음 요청에서 새 ETag 로 갱신됨)
+            etag = etag_for(request, namespace, per_user) if cache_shared() else None
+            if etag and etag_matches(request.headers.get('If-None-Match'), etag):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            if etag:
+                response['ETag'] = etag
+            response['Cache-Control'] = cache_control
+            if per_user:
+                patch_vary_headers(response, ('Authorization',))
+            return response
+        return wrapper
+    return decorator
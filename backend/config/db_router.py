@@ -0,0 +1,89 @@
+"""
+읽기 복제본(replica) DB 라우팅
+
+settings.REPLICA_DATABASE_URL 이 있으면 DATABASES['replica'] 가 추가되고,
+ReplicaRoutingMiddleware 가 요청마다 읽기 대상을 정합니다.
+
+- GET/HEAD/OPTIONS 요청의 읽기 -> replica
+- 쓰기, 안전하지 않은 요청, 요청 밖(관리 명령 등)의 읽기 -> default (primary)
+- 쓰기 직후 REPLICA_PIN_SECONDS 동안은 같은 사용자의 읽기도 primary (복제 지연 대비)
+- GET 에서도 쓰기가 일어나는 뷰는 @use_primary 로 primary 고정
+"""
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+REPLICA_ALIAS = 'replica'
+
+# 현재 요청의 읽기를 replica 로 보낼지 여부 (sync_to_async 스레드로도 전달됨)
+_read_replica = ContextVar('read_replica', default=False)
+
+
+def replica_enabled():
+    """replica 가 설정되어 있고 primary 와 다른 DB 인지 (테스트에서는 MIRROR 로 같은 DB)"""
+    if REPLICA_ALIAS not in settings.DATABASES:
+        return False
+    return (
+        connections[REPLICA_ALIAS].settings_dict['NAME']
+        != connections[DEFAULT_DB_ALIAS].settings_dict['NAME']
+    )
+
+
+def reads_from_replica():
+    return _read_replica.get()
+
+
+def route_reads_to_replica(enabled):
+    """읽기 대상 설정, ContextVar.reset 에 쓸 토큰 반환"""
+    return _read_replica.set(enabled)
+
+
+def reset_read_route(token):
+    _read_replica.reset(token)
+
+
+def use_primary(view):
+    """
+    GET 에서도 쓰기가 일어나는 뷰의 읽기를 primary 로 고정
+    (복제 지연으로 오래된 값을 읽고 그 값으로 쓰는 것을 방지)
+    """
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(*args, **kwargs):
+            token = _read_replica.set(False)
+            try:
+                return await view(*args, **kwargs)
+            finally:
+                _read_replica.reset(token)
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = _read_replica.set(False)
+        try:
+            return view(*args, **kwargs)
+        finally:
+            _read_replica.reset(token)
+    return wrapper
+
+
+class ReplicaRouter:
+    """settings.DATABASE_ROUTERS 에 등록 (REPLICA_DATABASE_URL 이 있을 때만)"""
+
+    def db_for_read(self, model, **hints):
+        return REPLICA_ALIAS if _read_replica.get() else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # replica 에서 읽은 인스턴스도 저장은 항상 primary 로
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica 는 primary 의 복제본이므로 두 DB 의 객체는 같은 데이터
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db != REPLICA_ALIAS
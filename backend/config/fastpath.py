@@ -0,0 +1,37 @@
+"""
+읽기 전용 목록 API의 빠른 직렬화 경로
+
+DRF ModelSerializer 는 행마다 모델 인스턴스와 필드 객체를 거치므로 큰 목록에서는
+CPU 대부분을 차지합니다. FastListMixin 을 쓰는 뷰는 values() 로 dict 를 바로 가져오고,
+중첩 관계는 id 기준 map 으로 한 번에 조립합니다.
+
+- 출력은 기존 serializer_class 결과와 바이트 단위로 동일해야 함 (각 앱 tests.py 에서 확인)
+- 뷰의 fast_path = False 로 기존 serializer 경로로 되돌릴 수 있음
+"""
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+
+from .renderers import FastJSONRenderer
+
+
+class FastListMixin:
+    """
+    ListAPIView 용 빠른 목록 직렬화
+
+    class TitleListView(FastListMixin, generics.ListAPIView):
+        fast_fields = ('id', 'name')            # 단순 필드만 있을 때
+        def fast_rows(self, queryset): ...       # 중첩 관계가 있을 때 재정의
+    """
+    fast_path = True
+    fast_fields = None
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def fast_rows(self, queryset):
+        return list(queryset.values(*self.fast_fields))
+
+    def list(self, request, *args, **kwargs):
+        if not self.fast_path or self.paginator is not None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(self.fast_rows(queryset))
+
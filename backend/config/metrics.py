@@ -0,0 +1,190 @@
+"""
+Prometheus 메트릭 정의 및 /metrics 뷰
+
+gunicorn 워커 여러 개의 값을 합치려면 PROMETHEUS_MULTIPROC_DIR 환경 변수에
+쓰기 가능한 디렉터리를 지정합니다. (gunicorn.conf.py 에서 시작 시 비우고
+종료된 워커를 정리합니다.)
+"""
+import hmac
+import os
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry,
+    Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+
+# ---------- HTTP ----------
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    '요청 처리 시간 (초)',
+    ['method', 'route'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUEST_COUNT = Counter(
+    'http_requests_total',
+    '응답 상태별 요청 수',
+    ['method', 'route', 'status'],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    '처리 중인 요청 수',
+    ['method'],
+    multiprocess_mode='livesum',
+)
+
+# ---------- Battles ----------
+
+BATTLE_ROOMS_CREATED = Counter(
+    'battle_rooms_created_total',
+    '생성된 대결방 수',
+)
+BATTLE_JOINS = Counter(
+    'battle_joins_total',
+    '게스트 대결방 입장 수',
+)
+BATTLE_RESULTS_SUBMITTED = Counter(
+    'battle_results_submitted_total',
+    '제출된 대결 결과 수',
+)
+BATTLE_POLLS = Counter(
+    'battle_poll_hits_total',
+    '대결 화면 폴링 요청 수',
+    ['endpoint'],
+)
+
+SPECTATORS = Gauge(
+    'battle_spectators',
+    '관전 스트림 연결 수',
+    multiprocess_mode='livesum',
+)
+SPECTATE_SNAPSHOTS = Counter(
+    'battle_spectate_snapshots_total',
+    '관전용 방 상태 조회 수 (관전자 수와 무관하게 방/프로세스마다 주기적으로 1회)',
+)
+SPECTATE_SKIPPED = Counter(
+    'battle_spectate_skipped_total',
+    '느린 관전자에게 보내지 않고 건너뛴 중간 상태 수',
+)
+
+# ---------- Throttling ----------
+
+THROTTLED_REQUESTS = Counter(
+    'throttled_requests_total',
+    '요청 제한으로 거절된 요청 수 (bucket=거절한 버킷 종류 ip/user/room)',
+    ['scope', 'bucket'],
+)
+
+# ---------- Background Jobs ----------
+# 워커 프로세스(run_worker)에서 기록, PROMETHEUS_MULTIPROC_DIR 를 웹 프로세스와 같이 쓰면 /metrics 에 합쳐짐
+
+JOB_RUNS = Counter(
+    'job_runs_total',
+    '실행한 백그라운드 작업 수 (outcome=done 성공, retry 재시도 예약, failed 최종 실패)',
+    ['task', 'outcome'],
+)
+JOB_DURATION = Histogram(
+    'job_duration_seconds',
+    '백그라운드 작업 실행 시간 (초)',
+    ['task'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0),
+)
+
+# ---------- Slow Log ----------
+
+SLOW_LOG_DROPPED = Counter(
+    'slow_log_dropped_total',
+    '로그 큐가 가득 차서 버린 느린 요청/쿼리 로그 수',
+)
+
+# ---------- DB Connection Pool ----------
+
+DB_POOL_SIZE = Gauge(
+    'db_pool_connections',
+    '풀의 연결 수 (state=size 전체, available 유휴)',
+    ['alias', 'state'],
+    multiprocess_mode='livesum',
+)
+DB_POOL_WAITING = Gauge(
+    'db_pool_requests_waiting',
+    '연결을 기다리는 요청 수',
+    ['alias'],
+    multiprocess_mode='livesum',
+)
+DB_POOL_WAIT_SECONDS = Counter(
+    'db_pool_wait_seconds',
+    '풀에서 연결을 기다린 누적 시간 (초)',
+    ['alias'],
+)
+DB_POOL_REQUESTS = Counter(
+    'db_pool_requests',
+    '풀에 연결을 요청한 횟수 (outcome=waited 대기 후 획득, error 시간 초과 등)',
+    ['alias', 'outcome'],
+)
+
+
+def pooled_aliases():
+    return [
+        alias for alias in connections
+        if connections.settings[alias].get('OPTIONS', {}).get('pool')
+    ]
+
+
+def record_pool_stats():
+    """
+    이 프로세스의 연결 풀 통계를 메트릭에 반영 (MetricsMiddleware 에서 요청마다 호출)
+    pop_stats() 는 마지막 호출 이후의 누적값을 돌려주고 초기화함
+    """
+    for alias in POOLED_ALIASES:
+        pool = connections[alias].pool
+        if pool is None:
+            continue
+        stats = pool.pop_stats()
+        DB_POOL_SIZE.labels(alias, 'size').set(stats.get('pool_size', 0))
+        DB_POOL_SIZE.labels(alias, 'available').set(stats.get('pool_available', 0))
+        DB_POOL_WAITING.labels(alias).set(stats.get('requests_waiting', 0))
+        if stats.get('requests_wait_ms'):
+            DB_POOL_WAIT_SECONDS.labels(alias).inc(stats['requests_wait_ms'] / 1000)
+        for key, outcome in (
+            ('requests_num', 'total'),
+            ('requests_queued', 'waited'),
+            ('requests_errors', 'error'),
+        ):
+            if stats.get(key):
+                DB_POOL_REQUESTS.labels(alias, outcome).inc(stats[key])
+
+
+POOLED_ALIASES = pooled_aliases()
+
+
+def metrics_allowed(request):
+    """토큰이 맞거나 클라이언트 IP 가 허용 네트워크 안이면 True (둘 다 설정이 없으면 항상 거부)"""
+    from .middleware import client_ip, ip_in_networks  # middleware 가 이 모듈을 import 하므로 지연 import
+
+    token = settings.METRICS_TOKEN
+    if token and hmac.compare_digest(
+        request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode(),
+    ):
+        return True
+    return ip_in_networks(client_ip(request), settings.METRICS_ALLOWED_NETWORKS)
+
+
+def metrics_view(request):
+    """
+    Prometheus 텍스트 형식 메트릭
+    GET /metrics
+    - settings.METRICS_TOKEN 의 Bearer 토큰 또는 METRICS_ALLOWED_NETWORKS 안의 IP 만 허용
+    """
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,424 @@
+import ipaddress
+import json
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .db_router import replica_enabled, route_reads_to_replica, reset_read_route
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 의존성 (없으면 gzip 만 사용)
+    brotli = None
+
+from .metrics import REQUEST_COUNT, REQUEST_LATENCY, REQUESTS_IN_PROGRESS, record_pool_stats
+from .slowlog import MAX_QUERIES, query_entry
+
+
+logger = logging.getLogger('config.db')
+slow_logger = logging.getLogger('config.slow')
+
+
+class QueryCollector:
+    """
+    요청 동안 실행된 쿼리를 집계 (collect_queries 참고)
+    - slow_query_ms 이상 걸린 쿼리는 SQL / 파라미터 / 호출 위치까지 기록 (config/slowlog.py)
+    - capture_all=True 면 모든 쿼리를 기록 (표본 요청)
+    """
+
+    def __init__(self, slow_query_ms=None, capture_all=False):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self.slow_query_ms = slow_query_ms
+        self.capture_all = capture_all
+        self.slow_count = 0
+        self.entries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.duration += elapsed
+            self.count += 1
+            self.statements[sql] += 1
+            if self.slow_query_ms is not None:
+                slow = elapsed * 1000 >= self.slow_query_ms
+                self.slow_count += slow
+                if (slow or self.capture_all) and len(self.entries) < MAX_QUERIES:
+                    # 스택 확인은 기록할 쿼리에서만 (예외 발생 시에도 기록)
+                    self.entries.append(query_entry(sql, params, many, elapsed))
+
+    @property
+    def duplicates(self):
+        """같은 SQL이 반복 실행된 횟수 (N+1 징후)"""
+        return sum(count - 1 for count in self.statements.values() if count > 1)
+
+
+# 현재 요청의 QueryCollector (sync_to_async 스레드로도 전달됨)
+_current_collector = ContextVar('query_collector', default=None)
+
+
+def _dispatch_to_collector(execute, sql, params, many, context):
+    collector = _current_collector.get()
+    if collector is None:
+        return execute(sql, params, many, context)
+    return collector(execute, sql, params, many, context)
+
+
+def _install_wrapper(connection):
+    if _dispatch_to_collector not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_dispatch_to_collector)
+
+
+@receiver(connection_created)
+def _on_connection_created(sender, connection, **kwargs):
+    _install_wrapper(connection)
+
+
+@contextmanager
+def collect_queries(collector):
+    """
+    요청 동안 실행되는 쿼리를 collector로 집계
+    - DB 연결은 스레드마다 따로 있으므로 연결마다 execute_wrapper를 상시 등록해 두고,
+      어느 요청의 쿼리인지는 ContextVar로 구분 (ASGI 모드의 비동기 ORM 쿼리도 집계됨)
+    """
+    for alias in connections:
+        _install_wrapper(connections[alias])
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+class HybridMiddleware:
+    """
+    WSGI(동기)와 ASGI(비동기) 양쪽에서 동작하는 미들웨어 기반 클래스
+    - 비동기 체인에서 동기 미들웨어가 끼면 뷰가 스레드로 밀려나므로 양쪽을 모두 지원
+    - 하위 클래스는 __call__(동기)과 __acall__(비동기)을 구현
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+class QueryCountMiddleware(HybridMiddleware):
+    """
+    요청별 쿼리 수 / DB 시간 / 중복 SQL 계측
+    - Server-Timing 헤더와 JSON 로그로 출력
+    - settings.QUERY_BUDGETS 에 URL 이름별 예산을 지정하면 초과 시 경고 로그
+    - 느린 요청/쿼리와 표본 요청은 config.slow 로거에 쿼리 상세까지 기록 (config/slowlog.py)
+
+    QUERY_BUDGETS = {
+        'battle-room-list-create': {'queries': 5, 'db_ms': 50},
+    }
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.budgets = getattr(settings, 'QUERY_BUDGETS', {})
+        self.slow_request_ms = getattr(settings, 'SLOW_REQUEST_MS', 500)
+        self.slow_query_ms = getattr(settings, 'SLOW_QUERY_MS', 100)
+        self.sample_rate = getattr(settings, 'SLOW_LOG_SAMPLE_RATE', 0)
+
+    def new_collector(self):
+        if not slow_logger.isEnabledFor(logging.INFO):
+            return QueryCollector()
+        return QueryCollector(
+            slow_query_ms=self.slow_query_ms,
+            capture_all=random.random() < self.sample_rate,
+        )
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        start = time.perf_counter()
+        with collect_queries(self.new_collector()) as collector:
+            response = self.get_response(request)
+        return self.finish(request, response, collector, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        with collect_queries(self.new_collector()) as collector:
+            response = await self.get_response(request)
+        return self.finish(request, response, collector, time.perf_counter() - start)
+
+    def finish(self, request, response, collector, total):
+        db_ms = collector.duration * 1000
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={db_ms:.2f};desc="{collector.count} queries, {collector.duplicates} dup"',
+            f'app;dur={total * 1000:.2f}',
+        ])
+
+        match = request.resolver_match
+        route = match.url_name if match and match.url_name else request.path
+        record = {
+            'route': route,
+            'method': request.method,
+            'status': response.status_code,
+            'queries': collector.count,
+            'duplicates': collector.duplicates,
+            'db_ms': round(db_ms, 2),
+            'total_ms': round(total * 1000, 2),
+        }
+        logger.info(json.dumps(record, ensure_ascii=False))
+
+        budget = self.budgets.get(route)
+        if budget:
+            exceeded = [
+                key for key, actual in (('queries', collector.count), ('db_ms', db_ms))
+                if key in budget and actual > budget[key]
+            ]
+            if exceeded:
+                logger.warning(json.dumps(
+                    {**record, 'budget': budget, 'exceeded': exceeded},
+                    ensure_ascii=False
+                ))
+
+        if collector.slow_query_ms is not None:
+            self.log_slow(request, record, collector)
+        return response
+
+    def log_slow(self, request, record, collector):
+        """느린 요청/쿼리는 WARNING, 표본 요청은 INFO 로 config.slow 에 기록"""
+        slow = record['total_ms'] >= self.slow_request_ms or collector.slow_count
+        if not slow and not collector.capture_all:
+            return
+        match = request.resolver_match
+        slow_logger.log(logging.WARNING if slow else logging.INFO, {
+            'kind': 'slow_request' if slow else 'sampled_request',
+            **record,
+            'pattern': match.route if match else None,
+            'slow_queries': collector.slow_count,
+            # 같은 SQL 반복 (N+1 징후) 상위 3개
+            'repeated': [
+                {'sql': sql, 'count': count}
+                for sql, count in collector.statements.most_common(3) if count > 1
+            ],
+            'query_log': collector.entries,
+        })
+
+
+class MetricsMiddleware(HybridMiddleware):
+    """
+    라우트별 지연 시간 히스토그램 / 상태 코드 카운터 / 처리 중 요청 게이지 기록
+    (DB 연결 풀을 쓰면 풀 통계도 함께 반영)
+    - 라우트 라벨은 URL 패턴(예: api/battles/rooms/<int:id>/)을 사용해 라벨 수를 제한
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        in_progress = REQUESTS_IN_PROGRESS.labels(request.method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            in_progress.dec()
+        return self.finish(request, response, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        in_progress = REQUESTS_IN_PROGRESS.labels(request.method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            in_progress.dec()
+        return self.finish(request, response, time.perf_counter() - start)
+
+    def finish(self, request, response, duration):
+        match = request.resolver_match
+        route = match.route if match else 'unmatched'
+        REQUEST_LATENCY.labels(request.method, route).observe(duration)
+        REQUEST_COUNT.labels(request.method, route, str(response.status_code)).inc()
+        record_pool_stats()
+        return response
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_jwt_authentication = JWTAuthentication()
+
+
+def client_ip(request):
+    """
+    프록시(X-Forwarded-For) 뒤에서도 클라이언트 IP
+    - settings.NUM_PROXIES: 앞단 프록시 수, 프록시가 덧붙인 값만 사용 (클라이언트가 보낸 값은 무시)
+    - 0 이면 REMOTE_ADDR 만 사용
+    """
+    num_proxies = settings.NUM_PROXIES
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if forwarded and num_proxies:
+        addresses = [address.strip() for address in forwarded.split(',')]
+        return addresses[-min(num_proxies, len(addresses))]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def ip_in_networks(ip, networks):
+    """ip 가 CIDR 목록 중 하나에 속하면 True (잘못된 주소는 False)"""
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(network, strict=False) for network in networks)
+
+
+def token_user_id(request):
+    """Authorization 헤더의 access 토큰에서 사용자 id (DB 조회 없음, 없거나 잘못되면 None)"""
+    header = _jwt_authentication.get_header(request)
+    if header is None:
+        return None
+    try:
+        raw_token = _jwt_authentication.get_raw_token(header)
+        if raw_token is None:
+            return None
+        token = _jwt_authentication.get_validated_token(raw_token)
+    except AuthenticationFailed:
+        return None
+    return token.get(jwt_settings.USER_ID_CLAIM)
+
+
+class ReplicaRoutingMiddleware(HybridMiddleware):
+    """
+    안전한 메서드 요청의 읽기를 replica 로 보냄 (config/db_router.py)
+    - 쓰기 요청이 성공하면 그 사용자(JWT 의 user_id, 비로그인이면 IP)를
+      REPLICA_PIN_SECONDS 동안 캐시에 표시하고, 그동안의 읽기는 primary 로 보냄
+    - replica 가 없거나 primary 와 같은 DB 이면 사용하지 않음 (테스트의 MIRROR 포함)
+    """
+
+    def __init__(self, get_response):
+        if not replica_enabled():
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        self.pin_seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+    def pin_keys(self, request):
+        """읽기 시 확인할 표시 키 (사용자, IP)"""
+        keys = [f'db:pin:ip:{client_ip(request)}']
+        user_id = token_user_id(request)
+        if user_id is not None:
+            keys.append(f'db:pin:user:{user_id}')
+        return keys
+
+    def written_keys(self, request, response):
+        """쓰기 요청 성공 시 표시할 키 (로그인 사용자는 사용자만, 비로그인은 IP)"""
+        if request.method in SAFE_METHODS or response.status_code >= 400:
+            return []
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return [f'db:pin:user:{user.pk}']
+        return [f'db:pin:ip:{client_ip(request)}']
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        replica = request.method in SAFE_METHODS and not any(
+            cache.get_many(self.pin_keys(request)).values()
+        )
+        token = route_reads_to_replica(replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            reset_read_route(token)
+        keys = self.written_keys(request, response)
+        if keys:
+            cache.set_many(dict.fromkeys(keys, True), self.pin_seconds)
+        return response
+
+    async def __acall__(self, request):
+        replica = request.method in SAFE_METHODS and not any(
+            (await cache.aget_many(self.pin_keys(request))).values()
+        )
+        token = route_reads_to_replica(replica)
+        try:
+            response = await self.get_response(request)
+        finally:
+            reset_read_route(token)
+        keys = self.written_keys(request, response)
+        if keys:
+            await cache.aset_many(dict.fromkeys(keys, True), self.pin_seconds)
+        return response
+
+
+_accepts_br = re.compile(r'\bbr\b')
+_accepts_gzip = re.compile(r'\bgzip\b')
+_compressible_types = ('application/json', 'text/')
+
+
+class CompressionMiddleware(HybridMiddleware):
+    """
+    응답 본문 압축
+    - COMPRESS_MIN_SIZE 바이트 이상인 JSON/텍스트 응답만 압축 (작은 응답은 압축 이득보다 비용이 큼)
+    - 클라이언트가 지원하면 brotli(설치된 경우), 아니면 gzip
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_size = getattr(settings, 'COMPRESS_MIN_SIZE', 1024)
+        self.brotli_quality = getattr(settings, 'BROTLI_QUALITY', 5)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        if (
+            response.streaming
+            or response.has_header('Content-Encoding')
+            or not response.get('Content-Type', '').startswith(_compressible_types)
+            or len(response.content) < self.min_size
+        ):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        if brotli is not None and _accepts_br.search(accept_encoding):
+            encoding = 'br'
+            content = brotli.compress(response.content, quality=self.brotli_quality)
+        elif _accepts_gzip.search(accept_encoding):
+            encoding = 'gzip'
+            content = compress_string(response.content)
+        else:
+            return response
+
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response['Content-Length'] = str(len(content))
+        response['Content-Encoding'] = encoding
+        # 압축 후 본문이 달라지므로 강한 ETag 는 약한 ETag 로 (Django GZipMiddleware 와 동일)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
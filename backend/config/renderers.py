@@ -0,0 +1,44 @@
+"""
+빠른 JSON 렌더러
+
+orjson 이 설치되어 있으면 orjson 으로, 없으면 DRF JSONRenderer 로 렌더링합니다.
+출력 바이트는 DRF JSONRenderer 와 동일합니다.
+(압축 구분자, ensure_ascii=False, \\u2028/\\u2029 이스케이프, datetime 'Z' 표기)
+"""
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 은 선택 의존성
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson 기반 JSONRenderer (들여쓰기 요청 등 특수한 경우는 기본 렌더러로 처리)"""
+
+    if orjson is not None:
+        options = (
+            orjson.OPT_NON_STR_KEYS
+            # datetime/date/time 은 DRF 인코더 규칙(UTC 는 'Z')을 따르도록 default 로 넘김
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default, option=self.options)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # DRF JSONRenderer 와 동일하게 \u2028, \u2029 이스케이프
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
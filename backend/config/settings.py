@@ -49,12 +49,22 @@ INSTALLED_APPS = [
     'users',
     'problems',
     'battles',
+    'tournaments',
+    'jobs',
     "corsheaders",
     'rest_framework',
     'rest_framework_simplejwt',
 ]
 
 MIDDLEWARE = [
+    # 라우트별 지연 시간/상태 코드 메트릭 (/metrics)
+    'config.middleware.MetricsMiddleware',
+    # 요청별 쿼리 수/DB 시간 계측 (다른 미들웨어의 쿼리도 포함되도록 가장 바깥에 위치)
+    'config.middleware.QueryCountMiddleware',
+    # 읽기 복제본 라우팅 (REPLICA_DATABASE_URL 이 있을 때만 동작)
+    'config.middleware.ReplicaRoutingMiddleware',
+    # 응답 압축 (COMPRESS_MIN_SIZE 이상, brotli 또는 gzip)
+    'config.middleware.CompressionMiddleware',
     "corsheaders.middleware.CorsMiddleware", 
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -86,6 +96,12 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# ASGI 모드 (DJANGO_ASYNC_VIEWS=1, 기본 꺼짐): 폴링 엔드포인트를 비동기 뷰로 제공
+# gunicorn config.asgi:application 과 함께 사용 (gunicorn.conf.py 참고)
+# 주의: 측정 결과 WSGI 보다 느림 (동시 100 에서 45 req/s vs 168 req/s, p99 6.4초)
+# 기본 배포는 WSGI 를 유지하고, 비동기 뷰가 필요한 경우에만 명시적으로 켤 것
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -94,10 +110,93 @@ DATABASES = {
     'default': dj_database_url.config(
         # Render에서 DATABASE_URL 환경 변수를 넣어주면 자동 인식됩니다.
         default='sqlite:///db.sqlite3', 
-        conn_max_age=600 
+        # ASGI 모드는 요청마다 스레드가 달라 영구 연결이 재사용되지 않고 쌓이기만 하므로 0
+        conn_max_age=0 if ASYNC_VIEWS else 600,
+        # 재사용 전 연결이 살아 있는지 확인 (DB 재시작/유휴 연결 끊김 대비)
+        conn_health_checks=True
     )
 }
 
+# 읽기 복제본 (선택)
+# REPLICA_DATABASE_URL 이 있으면 GET 등 안전한 요청의 읽기를 replica 로 보냄 (config/db_router.py)
+# 로컬에서는 두 번째 SQLite 파일(예: sqlite:///replica.sqlite3, db.sqlite3 복사본)로 확인
+REPLICA_DATABASE_URL = os.environ.get('REPLICA_DATABASE_URL')
+if REPLICA_DATABASE_URL:
+    DATABASES['replica'] = dj_database_url.parse(
+        REPLICA_DATABASE_URL,
+        conn_max_age=0 if ASYNC_VIEWS else 600,
+        conn_health_checks=True
+    )
+    # 테스트에서는 별도 DB를 만들지 않고 default 를 그대로 사용
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_ROUTERS = ['config.db_router.ReplicaRouter']
+
+# 쓰기 후 이 시간(초) 동안 같은 사용자의 읽기는 primary 로 (복제 지연보다 길게)
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 5))
+
+# PostgreSQL 연결 풀 (DB_POOL=1, psycopg 3 + psycopg_pool 필요)
+# 워커/스레드가 요청마다 새 연결을 맺지 않고 프로세스별 풀에서 빌려 씀
+# - ASGI 모드처럼 요청 스레드가 계속 바뀌어 영구 연결을 재사용할 수 없는 경우에 효과적
+# - 풀은 영구 연결(CONN_MAX_AGE)과 함께 쓸 수 없어 0으로 설정
+# - CONN_HEALTH_CHECKS 가 켜져 있으면 풀이 빌려줄 때 연결 상태를 확인
+# - 대기 시간/크기 메트릭은 /metrics 의 db_pool_* (config/metrics.py)
+DB_POOL = os.environ.get('DB_POOL') == '1'
+DB_POOL_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', 2))
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 10))
+# 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초), 초과하면 요청 실패
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))
+if DB_POOL:
+    for alias, database in DATABASES.items():
+        if database['ENGINE'] != 'django.db.backends.postgresql':
+            continue
+        database['CONN_MAX_AGE'] = 0
+        database.setdefault('OPTIONS', {})['pool'] = {
+            'name': alias,
+            'min_size': DB_POOL_MIN_SIZE,
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': DB_POOL_TIMEOUT,
+            # 오래된 연결은 주기적으로 교체 (초)
+            'max_lifetime': 1800,
+            'max_idle': 300,
+        }
+
+
+# Cache
+# CACHE_URL 로 백엔드 선택 (없으면 프로세스별 로컬 메모리)
+# - redis://host:6379/0 : 모든 워커/서버가 공유 (redis 패키지 필요)
+# - file:///tmp/inthon-cache : 한 서버의 여러 워커가 공유하는 로컬 대체용
+# - locmem:// : 프로세스별 (기본값)
+# 공통 캐시 도구(버전 키, TTL 지터, single-flight)는 config/caching.py
+
+CACHE_URL = os.environ.get('CACHE_URL', 'locmem://')
+if CACHE_URL.startswith(('redis://', 'rediss://')):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+elif CACHE_URL.startswith('file://'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_URL[len('file://'):],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'inthon',
+        }
+    }
+CACHES['default']['KEY_PREFIX'] = os.environ.get('CACHE_KEY_PREFIX', 'inthon')
+# 모든 워커가 default 캐시를 공유하는지 (redis, 한 서버의 file)
+# locmem 은 워커마다 따로라서 버전 키 무효화가 다른 워커에 보이지 않으므로
+# 응답 캐시/ETag(config/caching.py)를 끔, 워커 1개로 실행할 때만 CACHE_SHARED=1 로 켬
+CACHE_SHARED = os.environ.get(
+    'CACHE_SHARED', '0' if CACHES['default']['BACKEND'].endswith('LocMemCache') else '1'
+) == '1'
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -148,6 +247,74 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'users.User'
 
+# 이 크기(바이트) 이상의 JSON/텍스트 응답만 압축 (config.middleware.CompressionMiddleware)
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+# brotli 압축 수준 (0~11), 요청마다 압축하므로 속도 위주의 중간값
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', 5))
+
+# 앞단 리버스 프록시 수, X-Forwarded-For 에서 클라이언트 IP 를 고를 때 사용
+# 기본 0 (REMOTE_ADDR 만 사용): 프록시 없이 노출되면 클라이언트가 X-Forwarded-For 를 위조할 수 있으므로
+# 리버스 프록시 뒤에 배포할 때만 그 수로 설정 (Render 는 NUM_PROXIES=1)
+NUM_PROXIES = int(os.environ.get('NUM_PROXIES', 0))
+
+# /metrics 접근 제한 (config/metrics.py)
+# Authorization: Bearer {METRICS_TOKEN} 이거나 클라이언트 IP 가 허용 네트워크(쉼표 구분 CIDR) 안이어야 함
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_ALLOWED_NETWORKS = [
+    network.strip()
+    for network in os.environ.get('METRICS_ALLOWED_NETWORKS', '127.0.0.0/8,::1/128').split(',')
+    if network.strip()
+]
+
+# 토큰 버킷 요청 제한 (config/throttling.py)
+# 라우트별, 키 종류(ip/user/room)별 (버킷 크기, 분당 충전 토큰 수)
+# 비공개 방 비밀번호(4자리) 대입을 막기 위해 room 버킷은 IP 를 바꿔도 공유됨
+THROTTLE_BUCKETS = {
+    'verify-password': {'ip': (10, 10), 'room': (20, 20)},
+    'join-room': {'ip': (20, 20), 'user': (10, 10), 'room': (20, 20)},
+}
+# 요청 제한을 건너뛸 클라이언트 네트워크 (쉼표 구분 CIDR)
+# loadtest 는 모든 가상 사용자가 한 IP 에서 접속하므로 대상 서버에 부하 발생기 IP 를 지정
+# 예) THROTTLE_EXEMPT_NETWORKS=127.0.0.1/32
+THROTTLE_EXEMPT_NETWORKS = [
+    network.strip()
+    for network in os.environ.get('THROTTLE_EXEMPT_NETWORKS', '').split(',')
+    if network.strip()
+]
+
+# 다인 대결방 (battles/standings.py)
+# 최대 정원, 정원이 차서 시작한 뒤 결과 제출 기한 (초)
+GROUP_BATTLE_MAX_CAPACITY = 16
+GROUP_BATTLE_SECONDS = int(os.environ.get('GROUP_BATTLE_SECONDS', 1800))
+
+# 대결 이벤트 로그 (battles/eventlog.py)
+# 방 하나의 이벤트가 이만큼 쌓이거나 가장 오래된 이벤트가 이 시간(초)을 넘으면 버퍼 전체를 저장
+EVENT_LOG_FLUSH_EVENTS = int(os.environ.get('EVENT_LOG_FLUSH_EVENTS', 500))
+EVENT_LOG_FLUSH_SECONDS = int(os.environ.get('EVENT_LOG_FLUSH_SECONDS', 60))
+# 요청 하나로 보낼 수 있는 이벤트 수
+EVENT_LOG_MAX_BATCH = 100
+
+# 대결 관전 (battles/spectate.py)
+# 방 상태 조회 주기 (초), 하트비트 주기 (초), 관전자별 대기 메시지 수
+SPECTATE_INTERVAL = float(os.environ.get('SPECTATE_INTERVAL', 1.0))
+SPECTATE_HEARTBEAT = 15
+SPECTATE_QUEUE_SIZE = 1
+# 관전자 수 한도 (방당, 워커 프로세스당)
+SPECTATE_MAX_VIEWERS = int(os.environ.get('SPECTATE_MAX_VIEWERS', 500))
+SPECTATE_MAX_TOTAL = int(os.environ.get('SPECTATE_MAX_TOTAL', 5000))
+
+# 백그라운드 작업 (jobs/, python manage.py run_worker)
+# TASKS_EAGER=1 이면 워커 없이 delay() 에서 바로 실행 (개발용)
+TASKS_EAGER = os.environ.get('TASKS_EAGER') == '1'
+# 워커가 한 번에 가져오는 작업 수, 대기 작업이 없을 때 조회 간격 (초)
+TASKS_BATCH_SIZE = 10
+TASKS_POLL_SECONDS = float(os.environ.get('TASKS_POLL_SECONDS', 1.0))
+# 이 시간(초) 넘게 실행 중인 작업은 워커가 죽은 것으로 보고 다시 실행
+TASKS_LOCK_TIMEOUT = 300
+# 재시도 간격 상한 (초), 완료된 작업 보관 기간 (일)
+TASKS_MAX_RETRY_DELAY = 3600
+TASKS_KEEP_DONE_DAYS = 7
+
 # DRF가 JWT를 기본 인증 방식으로 사용하도록 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -169,6 +336,59 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
+# 요청별 쿼리 예산 (URL 이름 기준, 초과 시 config.db 로거에 경고)
+# - queries: 쿼리 수 (JWT 인증 사용자 조회 1회 포함)
+# - db_ms: DB 누적 시간 (ms)
+QUERY_BUDGETS = {
+    'battle-room-list-create': {'queries': 4, 'db_ms': 100},
+    'battle-room-retrieve-destroy': {'queries': 4, 'db_ms': 50},
+    'get-battle-result': {'queries': 10, 'db_ms': 50},
+    # 토너먼트 경기방은 다음 경기 작업 추가 1회 포함
+    'submit-battle-result': {'queries': 9, 'db_ms': 100},
+    'battle-events': {'queries': 3, 'db_ms': 50},
+    'tournament-detail': {'queries': 4, 'db_ms': 50},
+    'tournament-start': {'queries': 30, 'db_ms': 200},
+    'problem-list': {'queries': 4, 'db_ms': 100},
+    'profile-detail': {'queries': 8, 'db_ms': 50},
+    'profile-batch': {'queries': 3, 'db_ms': 50},
+}
+
+# 느린 요청/쿼리 로그 (config.slow 로거, JSON 한 줄씩, config/slowlog.py)
+# - 요청이 SLOW_REQUEST_MS 이상이거나 SLOW_QUERY_MS 이상인 쿼리가 있으면 쿼리 상세까지 기록
+# - 그 밖의 요청은 SLOW_LOG_SAMPLE_RATE 비율만 기록
+# - SLOW_LOG_FILE 이 없으면 stderr
+SLOW_REQUEST_MS = float(os.environ.get('SLOW_REQUEST_MS', 500))
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 100))
+SLOW_LOG_SAMPLE_RATE = float(os.environ.get('SLOW_LOG_SAMPLE_RATE', 0.01))
+SLOW_LOG_FILE = os.environ.get('SLOW_LOG_FILE')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+        # 요청 스레드는 큐에 넣기만 하고 쓰기는 별도 스레드에서
+        'slow': {
+            'class': 'config.slowlog.QueueJSONHandler',
+            'filename': SLOW_LOG_FILE,
+        },
+    },
+    'loggers': {
+        'config': {
+            'handlers': ['console'],
+            'level': os.environ.get('APP_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+        # 레벨은 config 로거를 따름
+        'config.slow': {
+            'handlers': ['slow'],
+            'propagate': False,
+        },
+    },
+}
+
 DEBUG = True
 
 ALLOWED_HOSTS = ['*', '.pythonanywhere.com']
@@ -0,0 +1,148 @@
+"""
+느린 요청 / 느린 쿼리 로그 (config.slow 로거, JSON 한 줄씩)
+
+QueryCountMiddleware 가 요청마다 판단해서 기록합니다.
+- 요청 시간이 SLOW_REQUEST_MS 이상이거나 SLOW_QUERY_MS 이상인 쿼리가 있으면 WARNING
+- 그 밖의 요청은 SLOW_LOG_SAMPLE_RATE 비율만 INFO (평소 분포 확인용)
+- 쿼리마다 SQL / 파라미터 / 시간 / 호출 위치(battles, problems, tournaments, users 코드의 파일:줄)
+- 비밀번호/방 PIN/토큰 컬럼을 쓰거나 조건에 쓰는 쿼리는 파라미터 값 대신 타입만 기록 ("<str>")
+
+    {"kind": "slow_request", "route": "get-battle-result", "total_ms": 812.4,
+     "query_log": [{"sql": "SELECT ...", "params": ["3"], "ms": 640.2,
+                  "origin": "battles/views.py:301 in get_battle_result"}], ...}
+
+QueueJSONHandler 는 요청 스레드에서 큐에 넣기만 하고, 직렬화와 파일/콘솔 쓰기는
+별도 스레드(QueueListener)에서 합니다. 큐가 가득 차면 기다리지 않고 버립니다.
+"""
+import atexit
+import json
+import logging
+import queue
+import re
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+from django.conf import settings
+
+from .metrics import SLOW_LOG_DROPPED
+
+
+# 호출 위치로 인정하는 앱 (이 디렉터리의 코드 중 가장 안쪽 프레임)
+ORIGIN_APPS = ('battles', 'jobs', 'problems', 'tournaments', 'users')
+# 쿼리 파라미터 기록 한도 (개수, 값 하나의 길이)
+MAX_PARAMS = 20
+MAX_PARAM_LENGTH = 100
+# 요청 하나에서 기록하는 쿼리 수 한도
+MAX_QUERIES = 50
+# 값이 로그에 남으면 안 되는 컬럼/테이블 (password, private_password, simplejwt 토큰 테이블)
+SENSITIVE_SQL = re.compile(r'password|token', re.IGNORECASE)
+
+_base_dir = Path(settings.BASE_DIR)
+_origin_prefixes = tuple(f'{_base_dir / app}/' for app in ORIGIN_APPS)
+
+
+def query_origin():
+    """현재 스택에서 앱 코드 중 가장 안쪽 프레임 (없으면 None)"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_origin_prefixes) and '/migrations/' not in filename:
+            return (
+                f'{Path(filename).relative_to(_base_dir)}:{frame.f_lineno} '
+                f'in {frame.f_code.co_name}'
+            )
+        frame = frame.f_back
+    return None
+
+
+def _short(value):
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) > MAX_PARAM_LENGTH:
+        return text[:MAX_PARAM_LENGTH] + '...'
+    return text
+
+
+def is_sensitive(sql):
+    """
+    파라미터에 민감한 값이 들어갈 수 있는 쿼리인지
+    - INSERT/UPDATE: 민감한 컬럼/테이블이 어디든 나오면
+    - 그 밖 (SELECT 등): WHERE 이후에 나오면 (SELECT 목록의 password 컬럼은 값이 파라미터가 아님)
+    """
+    if sql.lstrip()[:6].upper() in ('INSERT', 'UPDATE'):
+        return bool(SENSITIVE_SQL.search(sql))
+    return bool(SENSITIVE_SQL.search(sql.partition(' WHERE ')[2]))
+
+
+def query_entry(sql, params, many, duration):
+    """쿼리 하나의 로그 항목 (executemany 는 파라미터 대신 건수만)"""
+    if many:
+        params = {'executemany': len(params) if hasattr(params, '__len__') else None}
+    elif params is not None:
+        items = params.items() if isinstance(params, dict) else enumerate(params)
+        values = [value for _, value in list(items)[:MAX_PARAMS]]
+        if is_sensitive(sql):
+            params = [f'<{type(value).__name__}>' for value in values]
+        else:
+            params = [_short(value) for value in values]
+    return {
+        'sql': sql,
+        'params': params,
+        'ms': round(duration * 1000, 2),
+        'origin': query_origin(),
+    }
+
+
+class JSONLineFormatter(logging.Formatter):
+    """dict 메시지는 그대로, 문자열 메시지는 message 키로 JSON 한 줄"""
+
+    def format(self, record):
+        payload = record.msg if isinstance(record.msg, dict) else {'message': record.getMessage()}
+        return json.dumps({
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            **payload,
+        }, ensure_ascii=False, default=str)
+
+
+class QueueJSONHandler(QueueHandler):
+    """
+    요청 스레드를 막지 않는 JSON 로그 핸들러 (settings.LOGGING 에서 사용)
+    - filename 이 있으면 파일, 없으면 stderr
+    - maxsize: 큐 크기, 가득 차면 버리고 slow_log_dropped_total 증가
+    """
+
+    def __init__(self, filename=None, maxsize=10000):
+        super().__init__(queue.Queue(maxsize))
+        if filename:
+            target = logging.FileHandler(filename, encoding='utf-8', delay=True)
+        else:
+            target = logging.StreamHandler()
+        target.setFormatter(JSONLineFormatter())
+        self.target = target
+        self.listener = QueueListener(self.queue, target)
+        self.listener.start()
+        # 종료 시 큐에 남은 기록까지 쓰고 닫음
+        atexit.register(self.close)
+
+    def prepare(self, record):
+        # 직렬화는 리스너 스레드의 JSONLineFormatter 에서 (기본 구현은 여기서 format 함)
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            SLOW_LOG_DROPPED.inc()
+
+    def close(self):
+        if self.listener is not None:
+            try:
+                self.listener.stop()
+            except queue.Full:
+                pass
+            self.listener = None
+            self.target.close()
+        super().close()
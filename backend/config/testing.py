@@ -0,0 +1,129 @@
+"""
+API 성능 회귀 테스트용 공통 도구
+
+각 엔드포인트를 데이터 1/10/100건 규모에서 호출하여
+- 쿼리 수가 데이터 수와 무관하게 예산 이하인지 (N+1 방지)
+- 응답 크기가 상한 이하인지
+확인합니다.
+
+FastListMixin 을 쓰는 목록 뷰는 assertFastPathParity 로 기존 serializer 경로와
+응답 바이트가 같은지 확인합니다.
+"""
+import logging
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+# TestCase 가 테스트마다 트랜잭션을 열어 두므로 뷰의 transaction.atomic() 은 SAVEPOINT 가 됨
+# (운영에서는 BEGIN/COMMIT 이라 쿼리로 세지 않으므로 예산에서 제외)
+SAVEPOINT_PREFIXES = ('SAVEPOINT ', 'RELEASE SAVEPOINT ', 'ROLLBACK TO SAVEPOINT ')
+
+
+def count_queries(captured):
+    return sum(1 for query in captured if not query['sql'].startswith(SAVEPOINT_PREFIXES))
+
+
+class QuietRequestLogMixin:
+    """요청마다 남는 계측 로그(config.db)가 테스트 출력에 섞이지 않도록 함"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._config_logger = logging.getLogger('config')
+        cls._config_log_level = cls._config_logger.level
+        cls._config_logger.setLevel(logging.ERROR)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._config_logger.setLevel(cls._config_log_level)
+        super().tearDownClass()
+
+
+class QueryBudgetMixin(QuietRequestLogMixin):
+    """
+    TestCase와 함께 사용
+
+    class MyTests(QueryBudgetMixin, TestCase):
+        def test_list(self):
+            self.assertQueryBudget(
+                'get', '/api/things/', seed=self.seed_things,
+                max_queries=2, max_bytes=lambda rows: 200 + 100 * rows,
+            )
+    """
+    ROW_COUNTS = (1, 10, 100)
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def client_for(self, user=None):
+        """JWT 인증까지 실제와 같이 거치는 클라이언트"""
+        client = APIClient()
+        if user is not None:
+            token = RefreshToken.for_user(user).access_token
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        return client
+
+    def measure(self, method, url, user=None, data=None, expected_status=200):
+        """요청 1회의 (응답, 쿼리 수) 반환"""
+        client = self.client_for(user)
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(client, method)(url, data=data, format='json')
+        self.assertEqual(
+            response.status_code, expected_status,
+            f'{method.upper()} {url}: {response.content[:300]!r}'
+        )
+        return response, count_queries(queries.captured_queries)
+
+    def assertQueryBudget(self, method, url, *, seed, max_queries, max_bytes,
+                          user=None, data=None, expected_status=200):
+        """
+        데이터 1/10/100건 규모마다 같은 쿼리 예산을 만족하는지 확인
+        - seed(rows): 해당 규모의 데이터를 준비하고, 필요하면 요청 정보를 dict로 반환
+          (url / user / data / expected_status 를 덮어씀)
+        - max_bytes: 정수 또는 rows를 받아 상한을 돌려주는 함수
+        """
+        counts = {}
+        for rows in self.ROW_COUNTS:
+            with self.subTest(rows=rows):
+                overrides = seed(rows) or {}
+                target = overrides.get('url', url)
+                response, count = self.measure(
+                    method,
+                    target,
+                    user=overrides.get('user', user),
+                    data=overrides.get('data', data),
+                    expected_status=overrides.get('expected_status', expected_status),
+                )
+                counts[rows] = count
+                self.assertLessEqual(
+                    count, max_queries,
+                    f'{method.upper()} {target} ({rows}건): 쿼리 {count}회 > 예산 {max_queries}회'
+                )
+                limit = max_bytes(rows) if callable(max_bytes) else max_bytes
+                self.assertLessEqual(
+                    len(response.content), limit,
+                    f'{method.upper()} {target} ({rows}건): 응답 {len(response.content)}B > 상한 {limit}B'
+                )
+        # 데이터 규모에 따라 쿼리 수가 달라지면 N+1
+        self.assertEqual(
+            len(set(counts.values())), 1,
+            f'{method.upper()} {url}: 데이터 규모별 쿼리 수가 다름 {counts}'
+        )
+
+    def assertFastPathParity(self, view_class, path):
+        """FastListMixin 뷰의 빠른 경로와 serializer 경로 응답이 바이트 단위로 같은지 확인"""
+        responses = []
+        for fast_path in (True, False):
+            cache.clear()
+            response = view_class.as_view(fast_path=fast_path)(RequestFactory().get(path))
+            response.render()
+            self.assertEqual(response.status_code, 200)
+            responses.append(response.content)
+        self.assertEqual(responses[0], responses[1], f'GET {path}: 빠른 경로 응답이 다름')
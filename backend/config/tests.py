@@ -0,0 +1,367 @@
+import gzip
+import json
+import logging
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.hashers import PBKDF2SHA1PasswordHasher
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.admin import EstimatedCountPaginator
+from config.caching import bump_version, cached_query, get_version, jittered, versioned_key
+from config.db_router import REPLICA_ALIAS, ReplicaRouter, reads_from_replica, use_primary
+from config.metrics import REQUEST_COUNT, SLOW_LOG_DROPPED
+from config.middleware import CompressionMiddleware, ReplicaRoutingMiddleware
+from config.slowlog import QueueJSONHandler
+from config.testing import QueryBudgetMixin, QuietRequestLogMixin
+from users.models import User
+
+
+class ConfigQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """config/urls.py 공통 엔드포인트 쿼리 수/응답 크기 회귀 테스트"""
+
+    def seed_users(self, rows):
+        User.objects.bulk_create([
+            User(email=f'user{i}@korea.ac.kr')
+            for i in range(User.objects.count(), rows)
+        ])
+
+    def test_token_refresh(self):
+        def seed(rows):
+            self.seed_users(rows)
+            refresh = RefreshToken.for_user(User.objects.first())
+            return {'data': {'refresh': str(refresh)}}
+
+        self.assertQueryBudget(
+            'post', '/api/token/refresh/', seed=seed,
+            max_queries=1, max_bytes=400,
+        )
+
+    def test_metrics(self):
+        self.assertQueryBudget(
+            'get', '/metrics', seed=self.seed_users,
+            max_queries=0, max_bytes=200_000,
+        )
+
+    def test_admin_login_page(self):
+        self.assertQueryBudget(
+            'get', '/admin/login/', seed=self.seed_users,
+            max_queries=0, max_bytes=20_000,
+        )
+
+
+@override_settings(NUM_PROXIES=1)
+class MetricsTests(QuietRequestLogMixin, TestCase):
+    """/metrics 접근 제한과 카운터 증가 (프록시 1개 뒤에 배포된 경우)"""
+
+    remote = {'HTTP_X_FORWARDED_FOR': '203.0.113.5'}
+
+    def test_forbidden_outside_allowed_networks(self):
+        self.assertEqual(self.client.get('/metrics', **self.remote).status_code, 403)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_token(self):
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong', **self.remote)
+        self.assertEqual(response.status_code, 403)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret', **self.remote)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_ALLOWED_NETWORKS=['203.0.113.0/24'])
+    def test_allowed_network(self):
+        self.assertEqual(self.client.get('/metrics', **self.remote).status_code, 200)
+
+    @override_settings(NUM_PROXIES=0)
+    def test_forwarded_for_ignored_without_proxy(self):
+        # 프록시가 없으면 클라이언트가 보낸 X-Forwarded-For 로 허용 네트워크를 흉내낼 수 없음
+        spoofed = {'HTTP_X_FORWARDED_FOR': '127.0.0.1', 'REMOTE_ADDR': '203.0.113.5'}
+        self.assertEqual(self.client.get('/metrics', **spoofed).status_code, 403)
+
+    def test_request_count_increments(self):
+        counter = REQUEST_COUNT.labels('GET', 'metrics', '200')
+        before = counter._value.get()
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(counter._value.get(), before + 1)
+
+        # 직전 요청이 집계된 값이 다음 응답 본문에 노출됨
+        line = f'http_requests_total{{method="GET",route="metrics",status="200"}} {before + 1}'
+        self.assertIn(line, self.client.get('/metrics').content.decode())
+
+
+@mock.patch('config.middleware.replica_enabled', new=lambda: True)
+class ReplicaRoutingTests(SimpleTestCase):
+    """읽기 복제본 라우팅과 쓰기 후 primary 고정"""
+
+    def setUp(self):
+        cache.clear()
+        self.routes = []
+
+    def view(self, request):
+        self.routes.append(ReplicaRouter().db_for_read(User))
+        status = 201 if request.method == 'POST' else 200
+        if request.method == 'POST' and getattr(request, 'login_user', None):
+            # DRF 가 인증 후 request.user 를 설정하는 것과 같게
+            request.user = request.login_user
+        return HttpResponse(status=status)
+
+    def request(self, method, user=None, ip='10.0.0.1', async_mode=False):
+        headers = {'REMOTE_ADDR': ip}
+        if user is not None:
+            headers['HTTP_AUTHORIZATION'] = f'Bearer {RefreshToken.for_user(user).access_token}'
+        request = getattr(RequestFactory(), method)('/api/', **headers)
+        request.login_user = user
+        if async_mode:
+            async def view(request):
+                return self.view(request)
+            async_to_sync(ReplicaRoutingMiddleware(view))(request)
+        else:
+            ReplicaRoutingMiddleware(self.view)(request)
+        return self.routes[-1]
+
+    def test_outside_request_uses_primary(self):
+        self.assertEqual(ReplicaRouter().db_for_read(User), 'default')
+        self.assertEqual(ReplicaRouter().db_for_write(User), 'default')
+
+    def test_safe_methods_use_replica(self):
+        me = User(pk=1, email='me@korea.ac.kr')
+        self.assertEqual(self.request('get', me), REPLICA_ALIAS)
+        self.assertEqual(self.request('post', me), 'default')
+
+    def test_reads_pinned_after_write(self):
+        me, other = User(pk=1, email='me@korea.ac.kr'), User(pk=2, email='o@korea.ac.kr')
+        self.request('post', me)
+        self.assertEqual(self.request('get', me, ip='10.0.0.2'), 'default')
+        # 같은 IP 의 다른 사용자는 영향 없음
+        self.assertEqual(self.request('get', other), REPLICA_ALIAS)
+        cache.clear()
+        self.assertEqual(self.request('get', me), REPLICA_ALIAS)
+
+    def test_anonymous_write_pins_ip(self):
+        self.request('post')
+        self.assertEqual(self.request('get', User(pk=1, email='me@korea.ac.kr')), 'default')
+        self.assertEqual(self.request('get', ip='10.0.0.2'), REPLICA_ALIAS)
+
+    def test_async_mode(self):
+        self.assertEqual(self.request('get', async_mode=True), REPLICA_ALIAS)
+        self.request('post', async_mode=True)
+        self.assertEqual(self.request('get', async_mode=True), 'default')
+
+    def test_use_primary(self):
+        view = use_primary(lambda request: reads_from_replica())
+        response = ReplicaRoutingMiddleware(
+            lambda request: HttpResponse(str(view(request)))
+        )(RequestFactory().get('/api/'))
+        self.assertEqual(response.content, b'False')
+
+
+@override_settings(CACHE_SHARED=True)
+class CachingTests(SimpleTestCase):
+    """버전 키 / TTL 지터 / single-flight 재계산"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_bump_version_invalidates_namespace(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(cached_query('test', 'key', compute, 60), 1)
+        self.assertEqual(cached_query('test', 'key', compute, 60), 1)
+        bump_version('test')
+        self.assertEqual(cached_query('test', 'key', compute, 60), 2)
+
+    def test_version_not_reused_after_flush(self):
+        seen = {get_version('test')}
+        bump_version('test')
+        seen.add(get_version('test'))
+        cache.clear()
+        self.assertNotIn(get_version('test'), seen)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_process_local_cache_not_used(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(cached_query('test', 'key', compute, 60), 1)
+        self.assertEqual(cached_query('test', 'key', compute, 60), 2)
+
+    def test_stale_value_while_other_worker_recomputes(self):
+        cached_query('test', 'key', lambda: 'old', 60)
+        key = versioned_key('test', 'key')
+        cache.set(key, (0, 'old'))  # 만료된 상태
+        cache.add(f'{key}:lock', 1)  # 다른 워커가 재계산 중
+        self.assertEqual(cached_query('test', 'key', lambda: 'new', 60), 'old')
+        cache.delete(f'{key}:lock')
+        self.assertEqual(cached_query('test', 'key', lambda: 'new', 60), 'new')
+
+    def test_single_flight_on_cold_key(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'value'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cached_query('test', 'cold', compute, 60)))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['value'] * 10)
+
+    def test_jittered_ttl(self):
+        values = {jittered(100) for _ in range(200)}
+        self.assertTrue(all(90 <= value <= 110 for value in values))
+        self.assertGreater(len(values), 1)
+
+
+class CompressionTests(SimpleTestCase):
+    """JSON 응답 압축"""
+
+    def respond(self, body, accept_encoding='gzip, deflate'):
+        middleware = CompressionMiddleware(
+            lambda request: HttpResponse(body, content_type='application/json')
+        )
+        return middleware(RequestFactory().get('/api/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    def test_large_json_compressed(self):
+        body = json.dumps([{'id': i, 'title': f'문제 {i}'} for i in range(200)], ensure_ascii=False)
+        response = self.respond(body)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content).decode(), body)
+        self.assertLess(len(response.content), len(body.encode()) / 4)
+
+    def test_small_or_unaccepted_not_compressed(self):
+        self.assertFalse(self.respond('{"success": true}').has_header('Content-Encoding'))
+        body = json.dumps(list(range(1000)))
+        self.assertFalse(self.respond(body, accept_encoding='identity').has_header('Content-Encoding'))
+
+
+class SlowLogTests(QuietRequestLogMixin, TestCase):
+    """느린 요청/쿼리 로그와 표본 기록"""
+
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(SLOW_QUERY_MS=0, SLOW_LOG_SAMPLE_RATE=0)
+    def test_slow_query_logged_with_origin(self):
+        with self.assertLogs('config.slow', 'INFO') as logs:
+            self.client.get('/api/battles/rooms/?status=대기')
+        record = logs.records[0]
+        self.assertEqual(record.levelno, logging.WARNING)
+        self.assertEqual(record.msg['kind'], 'slow_request')
+        self.assertEqual(record.msg['route'], 'battle-room-list-create')
+        self.assertEqual(record.msg['pattern'], 'api/battles/rooms/')
+        query = record.msg['query_log'][0]
+        self.assertIn('SELECT', query['sql'])
+        self.assertIn('대기', query['params'])
+        self.assertTrue(query['origin'].startswith('battles/views.py:'), query['origin'])
+
+    @override_settings(SLOW_REQUEST_MS=60_000, SLOW_QUERY_MS=60_000, SLOW_LOG_SAMPLE_RATE=0)
+    def test_fast_request_not_logged(self):
+        with self.assertNoLogs('config.slow', 'INFO'):
+            self.client.get('/api/battles/rooms/')
+
+    @override_settings(SLOW_REQUEST_MS=60_000, SLOW_QUERY_MS=60_000, SLOW_LOG_SAMPLE_RATE=1)
+    def test_sampled_request_logged(self):
+        with self.assertLogs('config.slow', 'INFO') as logs:
+            self.client.get('/api/battles/rooms/')
+        record = logs.records[0]
+        self.assertEqual(record.levelno, logging.INFO)
+        self.assertEqual(record.msg['kind'], 'sampled_request')
+        self.assertEqual(record.msg['slow_queries'], 0)
+        self.assertEqual(len(record.msg['query_log']), record.msg['queries'])
+
+    @override_settings(
+        SLOW_REQUEST_MS=60_000, SLOW_QUERY_MS=60_000, SLOW_LOG_SAMPLE_RATE=1,
+        # 로그인 시 PBKDF2-SHA1 해시를 MD5 로 다시 저장 (비밀번호 UPDATE 발생)
+        PASSWORD_HASHERS=[
+            'django.contrib.auth.hashers.MD5PasswordHasher',
+            'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+        ],
+    )
+    def test_password_hash_not_logged(self):
+        with self.assertLogs('config.slow', 'INFO') as logs:
+            response = self.client.post('/api/users/signup/', {
+                'email': 'new@korea.ac.kr', 'password': 'Zx9!long-password', 'nickname': '새 사용자',
+            }, content_type='application/json')
+            self.assertEqual(response.status_code, 201)
+            signup_hash = User.objects.get(email='new@korea.ac.kr').password
+
+            user = User.objects.create(email='old@korea.ac.kr')
+            User.objects.filter(pk=user.pk).update(
+                password=PBKDF2SHA1PasswordHasher().encode('Zx9!long-password', 'salt', iterations=1000)
+            )
+            response = self.client.post('/api/users/login/', {
+                'email': 'old@korea.ac.kr', 'password': 'Zx9!long-password',
+            }, content_type='application/json')
+            self.assertEqual(response.status_code, 200)
+            login_hash = User.objects.get(pk=user.pk).password
+        self.assertTrue(login_hash.startswith('md5$'))
+
+        entries = [record.msg for record in logs.records if record.name == 'config.slow']
+        self.assertEqual([entry['route'] for entry in entries], ['user-signup', 'token_obtain_pair'])
+        logged = json.dumps(entries, ensure_ascii=False, default=str)
+        for secret in (signup_hash, login_hash, 'Zx9!long-password'):
+            self.assertNotIn(secret, logged)
+        self.assertIn('"<str>"', logged)
+
+    def test_queue_handler_writes_json_lines_and_drops_when_full(self):
+        with tempfile.NamedTemporaryFile('r', suffix='.log') as file:
+            handler = QueueJSONHandler(filename=file.name, maxsize=1)
+            # 리스너를 멈춰 큐가 비워지지 않게 함
+            handler.listener.stop()
+            logger = logging.getLogger('slowlog.test')
+            logger.addHandler(handler)
+            logger.propagate = False
+            dropped = SLOW_LOG_DROPPED._value.get()
+            try:
+                logger.warning({'kind': 'slow_request', 'route': '대결'})
+                logger.warning({'kind': 'slow_request', 'route': 'dropped'})
+                self.assertEqual(SLOW_LOG_DROPPED._value.get(), dropped + 1)
+                handler.listener.start()
+            finally:
+                logger.removeHandler(handler)
+                handler.close()
+            lines = file.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        line = json.loads(lines[0])
+        self.assertEqual(line['route'], '대결')
+        self.assertEqual(line['level'], 'WARNING')
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    """admin 목록 건수: 전체는 통계 추정값, 필터 결과는 상한까지만"""
+
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.bulk_create([User(email=f'user{i}@korea.ac.kr') for i in range(30)])
+
+    @mock.patch('config.admin.estimated_count', return_value=5_000_000)
+    def test_unfiltered_uses_estimate(self, estimated_count):
+        with self.assertNumQueries(0):
+            self.assertEqual(EstimatedCountPaginator(User.objects.order_by('pk'), 100).count, 5_000_000)
+
+    @mock.patch('config.admin.MAX_EXACT_COUNT', 10)
+    def test_filtered_count_capped(self):
+        queryset = User.objects.filter(email__startswith='user').order_by('pk')
+        self.assertEqual(EstimatedCountPaginator(queryset, 5).count, 10)
+        self.assertEqual(EstimatedCountPaginator(User.objects.order_by('pk'), 5).count, 10)
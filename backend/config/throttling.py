@@ -0,0 +1,108 @@
+"""
+토큰 버킷 요청 제한
+
+settings.THROTTLE_BUCKETS 에 라우트(scope)별로 키 종류마다 버킷을 지정합니다.
+
+    THROTTLE_BUCKETS = {
+        'verify-password': {'ip': (10, 10), 'room': (30, 30)},  # (버킷 크기, 분당 충전량)
+    }
+
+- ip: 클라이언트 IP / user: JWT 의 user_id / room: URL 의 room_id
+- 모든 버킷에 토큰이 남아 있을 때만 통과하고, 각 버킷에서 1개씩 차감
+- 버킷 상태는 공유 캐시(settings.CACHES)에 저장되어 워커/서버 간에 공유
+- @throttle 은 DRF 인증(사용자 조회)보다 바깥에서 실행되므로 거절된 요청은 DB 에 닿지 않음
+- 캐시 get/set 사이의 경합으로 동시 요청이 몇 개 더 통과할 수는 있음 (엄밀한 제한이 아닌 부하 차단 목적)
+- settings.THROTTLE_EXEMPT_NETWORKS 안의 클라이언트 IP 는 제한하지 않음 (loadtest 부하 발생기 등)
+"""
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .metrics import THROTTLED_REQUESTS
+from .middleware import client_ip, ip_in_networks, token_user_id
+from .renderers import FastJSONRenderer
+
+
+_renderer = FastJSONRenderer()
+
+
+def bucket_identity(kind, request, kwargs):
+    """키 종류별 식별자 (식별할 수 없으면 None, 해당 버킷은 건너뜀)"""
+    if kind == 'ip':
+        return client_ip(request)
+    if kind == 'user':
+        return token_user_id(request)
+    if kind == 'room':
+        return kwargs.get('room_id')
+    raise ValueError(f'알 수 없는 버킷 종류: {kind}')
+
+
+def take_tokens(scope, request, kwargs, now=None):
+    """
+    scope 의 모든 버킷에서 토큰 1개씩 차감
+    반환: (통과 여부, 거절 시 다음 토큰까지 남은 초, 거절한 버킷 종류)
+    """
+    buckets = getattr(settings, 'THROTTLE_BUCKETS', {}).get(scope)
+    if not buckets:
+        return True, 0, None
+    exempt = getattr(settings, 'THROTTLE_EXEMPT_NETWORKS', ())
+    if exempt and ip_in_networks(client_ip(request), exempt):
+        return True, 0, None
+    now = time.time() if now is None else now
+
+    keys = {}
+    for kind, (capacity, per_minute) in buckets.items():
+        identity = bucket_identity(kind, request, kwargs)
+        if identity is not None:
+            keys[f'throttle:{scope}:{kind}:{identity}'] = (kind, capacity, per_minute / 60)
+
+    states = cache.get_many(list(keys))
+    updated = {}
+    for key, (kind, capacity, rate) in keys.items():
+        tokens, updated_at = states.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+        if tokens < 1:
+            return False, math.ceil((1 - tokens) / rate), kind
+        updated[key] = (tokens - 1, now)
+
+    # 버킷이 가득 찰 때까지만 보관 (그 이후는 새 버킷과 같음)
+    timeout = max(
+        math.ceil(capacity / rate) for _, capacity, rate in keys.values()
+    ) if keys else None
+    cache.set_many(updated, timeout)
+    return True, 0, None
+
+
+def throttled_response(retry_after):
+    """DRF 429 응답과 같은 형식"""
+    response = HttpResponse(
+        _renderer.render({'error': '요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.'}),
+        content_type='application/json',
+        status=429,
+    )
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def throttle(scope):
+    """
+    함수 뷰 요청 제한 데코레이터 (@api_view 보다 바깥에 적용)
+
+    @throttle('join-room')
+    @api_view(['POST'])
+    def join_room(request, room_id): ...
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            allowed, retry_after, kind = take_tokens(scope, request, kwargs)
+            if not allowed:
+                THROTTLED_REQUESTS.labels(scope, kind).inc()
+                return throttled_response(retry_after)
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -18,6 +18,8 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenRefreshView
 
+from .metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     # /api/users/ (signup, login)
@@ -28,6 +30,11 @@ urlpatterns = [
     path('api/', include('problems.urls')),
     # /api/battles/ (대결 관련)
     path('api/battles/', include('battles.urls')),
+    # /api/tournaments/ (토너먼트)
+    path('api/tournaments/', include('tournaments.urls')),
     # POST /api/token/refresh/ (Access Token 재발급)
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+
+    # GET /metrics (Prometheus 메트릭)
+    path('metrics', metrics_view, name='metrics'),
 ]
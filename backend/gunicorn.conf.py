@@ -0,0 +1,40 @@
+"""
+gunicorn 설정 (gunicorn 실행 디렉터리의 gunicorn.conf.py 를 자동으로 읽음)
+
+- WSGI (기본): gunicorn config.wsgi
+- ASGI: DJANGO_ASYNC_VIEWS=1 gunicorn config.asgi:application
+  uvicorn 워커가 이벤트 루프에서 폴링 요청을 동시에 처리하므로
+  워커 수는 적게, 연결 대기열과 keep-alive 는 길게 잡음
+"""
+import multiprocessing
+import os
+import shutil
+
+
+if os.environ.get('DJANGO_ASYNC_VIEWS') == '1':
+    worker_class = 'uvicorn_worker.UvicornWorker'
+    # 워커 하나가 많은 연결을 처리하므로 코어 수만큼만
+    workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+    # 폴링 연결 폭주에 대비해 accept 대기열을 넉넉히
+    backlog = int(os.environ.get('GUNICORN_BACKLOG', 2048))
+    # 2~3초 간격 폴링이 같은 연결을 재사용하도록 keep-alive 유지
+    keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 10))
+    # 메모리 누수 대비 주기적 워커 재시작 (동시 재시작 방지 jitter)
+    max_requests = 10000
+    max_requests_jitter = 1000
+    graceful_timeout = 30
+
+
+def on_starting(server):
+    """이전 실행에서 남은 Prometheus 멀티프로세스 파일 정리"""
+    directory = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 게이지 값을 집계에서 제외"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,24 @@
+from django.contrib import admin
+from django.utils import timezone
+from config.admin import LargeTableAdminMixin
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """작업 Admin 설정"""
+    list_display = ('id', 'name', 'status', 'attempts', 'max_attempts', 'run_at', 'created_at', 'finished_at')
+    list_filter = ('status',)
+    search_fields = ('id',)
+    # 작업 이름은 인덱스가 없어 검색하지 않음
+    search_text_fields = ()
+    search_help_text = '작업 번호'
+    readonly_fields = ('locked_at', 'created_at', 'finished_at', 'last_error')
+    actions = ('retry_jobs',)
+
+    @admin.action(description='선택한 작업 다시 실행')
+    def retry_jobs(self, request, queryset):
+        updated = queryset.exclude(status='running').update(
+            status='queued', attempts=0, run_at=timezone.now(), finished_at=None, last_error='',
+        )
+        self.message_user(request, f'작업 {updated}개를 다시 대기열에 넣었습니다.')
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from jobs.queue import registry
+from jobs.worker import Worker, run_pending
+
+
+class Command(BaseCommand):
+    """
+    백그라운드 작업 워커
+    python manage.py run_worker                  # SIGTERM 을 받을 때까지 실행
+    python manage.py run_worker --once           # 지금 실행할 수 있는 작업만 처리하고 종료 (cron 등)
+
+    여러 개를 띄워도 되지만 작업을 나눠 갖는 것은 PostgreSQL 에서만 보장 (SKIP LOCKED)
+    """
+    help = "'작업' 테이블의 백그라운드 작업을 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='대기 작업이 없을 때까지만 실행')
+        parser.add_argument('--batch-size', type=int, default=None, help='한 번에 가져오는 작업 수')
+        parser.add_argument('--sleep', type=float, default=None, help='대기 작업이 없을 때 조회 간격 (초)')
+
+    def handle(self, *args, **options):
+        if options['once']:
+            total = 0
+            while True:
+                count = run_pending(options['batch_size'])
+                if not count:
+                    break
+                total += count
+            self.stdout.write(f'작업 {total}개 실행')
+            return
+
+        self.stdout.write(f'워커 시작 (등록된 작업 {len(registry)}개)')
+        Worker(options['batch_size'], options['sleep']).run()
+        self.stdout.write('워커 종료')
@@ -0,0 +1,39 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """백그라운드 작업 모델 (@task 함수 호출 한 번, jobs/queue.py)"""
+    STATUS_CHOICES = [
+        ('queued', '대기'),
+        ('running', '실행 중'),
+        ('done', '완료'),
+        ('failed', '실패'),
+    ]
+
+    # 작업 함수 이름 (모듈.함수), 인자는 JSON 으로 저장
+    name = models.CharField(max_length=200)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    # 이 시각 이후에 실행 (재시도 대기 포함)
+    run_at = models.DateTimeField(default=timezone.now)
+    # 워커가 가져간 시각 (오래되면 워커가 죽은 것으로 보고 다시 실행)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = '작업'
+        verbose_name = '작업'
+        verbose_name_plural = '작업 목록'
+        indexes = [
+            # 워커 조회: status='queued' AND run_at <= now ORDER BY run_at
+            models.Index(fields=['status', 'run_at'], name='job_status_run_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
@@ -0,0 +1,68 @@
+"""
+DB 작업 큐 (별도 브로커 없이 '작업' 테이블 사용)
+
+    @task(max_attempts=5, retry_delay=5)
+    def advance(tournament_id):
+        ...
+
+    advance.delay(tournament.id)   # INSERT 1회, 실행은 워커가 (python manage.py run_worker)
+
+- delay() 는 현재 트랜잭션 안에서 행을 추가하므로 요청이 롤백되면 작업도 없어지고,
+  커밋된 작업은 웹 프로세스가 바로 죽어도 워커가 실행함
+- 실패하면 retry_delay * 2^(시도 횟수-1) 초 뒤 다시 실행 (TASKS_MAX_RETRY_DELAY 까지),
+  max_attempts 번 실패하면 'failed' 로 남김 (관리자 페이지에서 다시 실행)
+- 워커가 실행 도중 죽으면 같은 작업이 다시 실행될 수 있으므로 작업 함수는 여러 번 실행해도 안전해야 함
+- 인자는 JSON 으로 저장되므로 모델 객체 대신 id 를 넘김
+- TASKS_EAGER=1 이면 delay() 에서 바로 실행 (워커 없이 개발할 때)
+- 작업 함수는 각 앱의 tasks.py 에 정의 (JobsConfig.ready 에서 불러옴)
+"""
+import functools
+import random
+
+from django.conf import settings
+
+from .models import Job
+
+
+# 이름 -> Task (워커가 Job.name 으로 찾음)
+registry = {}
+
+
+def backoff_seconds(attempts, base):
+    """attempts 번째 실패 뒤 다시 실행할 때까지 기다릴 시간 (초)"""
+    delay = min(base * 2 ** (attempts - 1), settings.TASKS_MAX_RETRY_DELAY)
+    # 같이 실패한 작업들이 같은 시각에 다시 몰리지 않도록 ±10%
+    return delay * random.uniform(0.9, 1.1)
+
+
+class Task:
+    """@task 로 등록한 함수 (직접 호출하면 바로 실행, delay() 는 큐에 추가)"""
+
+    def __init__(self, func, max_attempts, retry_delay):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = f'{func.__module__}.{func.__qualname__}'
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        """작업을 큐에 추가 (TASKS_EAGER 면 바로 실행하고 None 반환)"""
+        if settings.TASKS_EAGER:
+            self.func(*args, **kwargs)
+            return None
+        return Job.objects.create(
+            name=self.name, args=list(args), kwargs=kwargs, max_attempts=self.max_attempts,
+        )
+
+
+def task(func=None, *, max_attempts=5, retry_delay=10):
+    """작업 함수 등록 (@task 또는 @task(max_attempts=..., retry_delay=...))"""
+    def register(func):
+        registered = Task(func, max_attempts, retry_delay)
+        registry[registered.name] = registered
+        return registered
+
+    return register(func) if func is not None else register
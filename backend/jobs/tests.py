@@ -0,0 +1,127 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from battles.models import BattleStatus
+from .models import Job
+from .queue import backoff_seconds, task
+from .worker import purge_finished, reclaim_stale, run_pending
+
+
+calls = []
+
+
+@task
+def record(value):
+    calls.append(value)
+
+
+@task(max_attempts=2, retry_delay=30)
+def create_then_fail(name):
+    BattleStatus.objects.create(name=name)
+    raise RuntimeError('실패')
+
+
+class JobQueueTests(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    def test_delay_runs_in_worker(self):
+        job = record.delay(1)
+        self.assertEqual((job.name, job.args, job.status), ('jobs.tests.record', [1], 'queued'))
+        self.assertEqual(calls, [])
+
+        self.assertEqual(run_pending(), 1)
+        self.assertEqual(calls, [1])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('done', 1))
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(run_pending(), 0)
+
+    def test_rolled_back_request_drops_job(self):
+        try:
+            with transaction.atomic():
+                record.delay(1)
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assertFalse(Job.objects.exists())
+
+    def test_retry_with_backoff_then_fail(self):
+        job = create_then_fail.delay(name='임시')
+        with self.assertLogs('jobs.worker', 'ERROR'):
+            run_pending()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('queued', 1))
+        self.assertIn('RuntimeError', job.last_error)
+        self.assertGreater(job.run_at, timezone.now() + timedelta(seconds=20))
+        # 작업 중에 쓴 내용은 롤백
+        self.assertFalse(BattleStatus.objects.filter(name='임시').exists())
+        # 재시도 시각 전에는 실행하지 않음
+        self.assertEqual(run_pending(), 0)
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        with self.assertLogs('jobs.worker', 'ERROR'):
+            run_pending()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_backoff_doubles_up_to_limit(self):
+        with override_settings(TASKS_MAX_RETRY_DELAY=100):
+            delays = [backoff_seconds(attempts, 10) for attempts in (1, 2, 3, 5)]
+        for delay, expected in zip(delays, (10, 20, 40, 100)):
+            self.assertAlmostEqual(delay, expected, delta=expected * 0.1)
+
+    def test_unknown_task_is_retried(self):
+        job = Job.objects.create(name='jobs.tests.removed')
+        with self.assertLogs('jobs.worker', 'ERROR'):
+            run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'queued')
+        self.assertIn('jobs.tests.removed', job.last_error)
+
+    def test_stale_running_job_is_reclaimed(self):
+        old = timezone.now() - timedelta(hours=1)
+        stale = Job.objects.create(name=record.name, args=[1], status='running', attempts=1, locked_at=old)
+        exhausted = Job.objects.create(
+            name=record.name, args=[2], status='running', attempts=5, max_attempts=5, locked_at=old,
+        )
+        fresh = Job.objects.create(name=record.name, args=[3], status='running', attempts=1, locked_at=timezone.now())
+
+        self.assertEqual(reclaim_stale(), 2)
+        statuses = dict(Job.objects.values_list('pk', 'status'))
+        self.assertEqual(
+            (statuses[stale.pk], statuses[exhausted.pk], statuses[fresh.pk]),
+            ('queued', 'failed', 'running'),
+        )
+        run_pending()
+        self.assertEqual(calls, [1])
+
+    @override_settings(TASKS_EAGER=True)
+    def test_eager_runs_immediately(self):
+        self.assertIsNone(record.delay(1))
+        self.assertEqual(calls, [1])
+        self.assertFalse(Job.objects.exists())
+
+    def test_purge_keeps_failed_jobs(self):
+        old = timezone.now() - timedelta(days=30)
+        Job.objects.create(name=record.name, status='done', finished_at=old)
+        failed = Job.objects.create(name=record.name, status='failed', finished_at=old)
+        Job.objects.create(name=record.name, status='done', finished_at=timezone.now())
+        self.assertEqual(purge_finished(), 1)
+        self.assertEqual(Job.objects.count(), 2)
+        self.assertTrue(Job.objects.filter(pk=failed.pk).exists())
+
+    def test_run_worker_once(self):
+        for value in range(15):
+            record.delay(value)
+        out = StringIO()
+        call_command('run_worker', '--once', '--batch-size', '4', stdout=out)
+        self.assertEqual(calls, list(range(15)))
+        self.assertIn('15', out.getvalue())
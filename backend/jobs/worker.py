@@ -0,0 +1,158 @@
+"""
+작업 실행 (python manage.py run_worker)
+
+- 대기 작업을 run_at 순으로 TASKS_BATCH_SIZE 개씩 가져와 실행
+  PostgreSQL 은 SELECT ... FOR UPDATE SKIP LOCKED 로 가져오므로 워커를 여러 개 띄워도 같은 작업을 나눠 갖지 않음
+- 작업 하나는 트랜잭션 하나 (실패하면 작업 중에 쓴 내용도 롤백된 뒤 재시도)
+- TASKS_LOCK_TIMEOUT 초 넘게 'running' 인 작업은 워커가 죽은 것으로 보고 다시 대기로
+- 완료된 작업은 TASKS_KEEP_DONE_DAYS 일 뒤 삭제 (실패한 작업은 확인할 수 있도록 남김)
+"""
+import logging
+import signal
+import threading
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from config.metrics import JOB_DURATION, JOB_RUNS
+from .models import Job
+from .queue import backoff_seconds, registry
+
+
+logger = logging.getLogger(__name__)
+
+# 등록되지 않은 작업(배포 중 웹/워커 버전 차이 등)의 재시도 기준 간격 (초)
+UNKNOWN_TASK_RETRY_DELAY = 60
+# 저장하는 오류 내용 길이 (traceback 끝부분)
+MAX_ERROR_LENGTH = 4000
+# 완료된 작업 정리 주기 (초)
+PURGE_INTERVAL = 3600
+
+
+def reclaim_stale():
+    """실행 중에 워커가 죽어 'running' 으로 남은 작업을 다시 대기로 (시도 횟수를 다 쓴 작업은 실패로)"""
+    now = timezone.now()
+    return Job.objects.filter(
+        status='running', locked_at__lt=now - timedelta(seconds=settings.TASKS_LOCK_TIMEOUT)
+    ).update(
+        status=Case(When(attempts__gte=F('max_attempts'), then=Value('failed')), default=Value('queued')),
+        finished_at=Case(When(attempts__gte=F('max_attempts'), then=Value(now)), default=None),
+        run_at=now,
+        locked_at=None,
+        last_error='워커가 실행을 마치지 못했습니다.',
+    )
+
+
+def claim(batch_size):
+    """실행할 작업을 가져와 'running' 으로 표시 (시도 횟수는 여기서 증가)"""
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status='queued', run_at__lte=now)
+            .order_by('run_at', 'id')[:batch_size]
+        )
+        if jobs:
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status='running', locked_at=now, attempts=F('attempts') + 1,
+            )
+    for job in jobs:
+        job.status, job.locked_at, job.attempts = 'running', now, job.attempts + 1
+    return jobs
+
+
+def run_job(job):
+    """작업 하나 실행 후 결과 기록, 반환: 'done' | 'retry' | 'failed'"""
+    task = registry.get(job.name)
+    started = time.perf_counter()
+    try:
+        if task is None:
+            raise LookupError(f'등록되지 않은 작업입니다: {job.name}')
+        with transaction.atomic():
+            task.func(*job.args, **job.kwargs)
+    except Exception:
+        logger.exception('작업 실패 (id=%s, %s, %d/%d회)', job.pk, job.name, job.attempts, job.max_attempts)
+        outcome = record_failure(job, task, traceback.format_exc()[-MAX_ERROR_LENGTH:])
+    else:
+        Job.objects.filter(pk=job.pk).update(
+            status='done', finished_at=timezone.now(), locked_at=None, last_error='',
+        )
+        outcome = 'done'
+    JOB_DURATION.labels(job.name).observe(time.perf_counter() - started)
+    JOB_RUNS.labels(job.name, outcome).inc()
+    return outcome
+
+
+def record_failure(job, task, error):
+    now = timezone.now()
+    if job.attempts >= job.max_attempts:
+        Job.objects.filter(pk=job.pk).update(
+            status='failed', finished_at=now, locked_at=None, last_error=error,
+        )
+        return 'failed'
+    base = task.retry_delay if task is not None else UNKNOWN_TASK_RETRY_DELAY
+    Job.objects.filter(pk=job.pk).update(
+        status='queued', locked_at=None, last_error=error,
+        run_at=now + timedelta(seconds=backoff_seconds(job.attempts, base)),
+    )
+    return 'retry'
+
+
+def run_pending(batch_size=None):
+    """지금 실행할 수 있는 작업을 한 묶음 실행, 반환: 실행한 작업 수"""
+    reclaim_stale()
+    jobs = claim(batch_size or settings.TASKS_BATCH_SIZE)
+    for job in jobs:
+        run_job(job)
+    return len(jobs)
+
+
+def purge_finished():
+    """보관 기간이 지난 완료 작업 삭제, 반환: 삭제한 수"""
+    cutoff = timezone.now() - timedelta(days=settings.TASKS_KEEP_DONE_DAYS)
+    deleted, _ = Job.objects.filter(status='done', finished_at__lt=cutoff).delete()
+    return deleted
+
+
+class Worker:
+    """
+    작업이 없으면 poll_seconds 마다 조회하는 실행 루프
+    SIGTERM/SIGINT 를 받으면 실행 중인 묶음을 마치고 종료
+    """
+
+    def __init__(self, batch_size=None, poll_seconds=None):
+        self.batch_size = batch_size or settings.TASKS_BATCH_SIZE
+        self.poll_seconds = settings.TASKS_POLL_SECONDS if poll_seconds is None else poll_seconds
+        self.stopping = threading.Event()
+        self.last_purge = None
+
+    def stop(self, *args):
+        self.stopping.set()
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        while not self.stopping.is_set():
+            close_old_connections()
+            try:
+                self.purge_if_due()
+                count = run_pending(self.batch_size)
+            except DatabaseError:
+                # DB 재시작 등: 연결을 버리고 잠시 뒤 다시 시도
+                logger.exception('작업 조회 실패')
+                count = 0
+            if count < self.batch_size:
+                self.stopping.wait(self.poll_seconds)
+
+    def purge_if_due(self):
+        now = time.monotonic()
+        if self.last_purge is None or now - self.last_purge >= PURGE_INTERVAL:
+            self.last_purge = now
+            deleted = purge_finished()
+            if deleted:
+                logger.info('완료된 작업 %d개 삭제', deleted)
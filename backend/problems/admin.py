@@ -1,4 +1,5 @@
 from django.contrib import admin
+from config.admin import LargeTableAdminMixin
 from .models import Type, Subject, Problem
 
 
@@ -17,10 +18,11 @@ class SubjectAdmin(admin.ModelAdmin):
 
 
 @admin.register(Problem)
-class ProblemAdmin(admin.ModelAdmin):
-    """문제 Admin 설정"""
+class ProblemAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """문제 Admin 설정 (대결방 문제 선택 자동완성에도 사용)"""
     list_display = ('id', 'title', 'type', 'subject', 'correct_answer')
     list_filter = ('type', 'subject')
+    list_select_related = ('type', 'subject')
     search_fields = ('title', 'description', 'correct_answer')
     fieldsets = (
         ('기본 정보', {
@@ -0,0 +1,16 @@
+from django.db import transaction
+
+from config.caching import bump_version
+
+
+# 문제 목록 캐시 namespace / 시간 (초)
+# 문제/종류/과목이 바뀌면 signals.py 에서 버전을 올려 즉시 무효화
+PROBLEM_LIST_CACHE = 'problems:list'
+PROBLEM_LIST_CACHE_TIMEOUT = 60
+# 문제는 관리자 페이지에서만 바뀌므로 브라우저도 1분간 재사용
+PROBLEM_LIST_CACHE_CONTROL = 'public, max-age=60'
+
+
+def invalidate_problem_list():
+    """문제 목록 캐시와 ETag 무효화 (트랜잭션 안이면 커밋 후, battles/cache.py invalidate_lobby 참고)"""
+    transaction.on_commit(lambda: bump_version(PROBLEM_LIST_CACHE))
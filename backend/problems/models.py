@@ -3,7 +3,8 @@ from django.db import models
 
 class Type(models.Model):
     """종류 모델"""
-    name = models.CharField(max_length=100)
+    # 문제 목록 필터에서 이름으로 조회
+    name = models.CharField(max_length=100, db_index=True)
     
     class Meta:
         db_table = '종류'
@@ -14,7 +15,8 @@ class Type(models.Model):
 
 class Subject(models.Model):
     """과목 모델"""
-    name = models.CharField(max_length=100)
+    # 문제 목록 필터에서 이름으로 조회
+    name = models.CharField(max_length=100, db_index=True)
     
     class Meta:
         db_table = '과목'
@@ -41,6 +43,10 @@ class Problem(models.Model):
     
     class Meta:
         db_table = '문제'
+        indexes = [
+            # 문제 목록 type + subject 동시 필터
+            models.Index(fields=['type', 'subject'], name='problem_type_subject_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_problem_list
+from .models import Type, Subject, Problem
+
+
+@receiver(post_save, sender=Problem)
+@receiver(post_delete, sender=Problem)
+@receiver(post_save, sender=Type)
+@receiver(post_delete, sender=Type)
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def on_problem_changed(sender, **kwargs):
+    invalidate_problem_list()
@@ -1,3 +1,79 @@
 from django.test import TestCase
 
-# Create your tests here.
+from config.testing import QueryBudgetMixin
+from . import views
+from .models import Type, Subject, Problem
+
+
+class ProblemQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """문제 API 쿼리 수/응답 크기 회귀 테스트"""
+
+    def seed_reference(self, rows):
+        for model in (Type, Subject):
+            model.objects.bulk_create([
+                model(name=f'{model.__name__}-{i}')
+                for i in range(model.objects.count(), rows)
+            ])
+
+    def seed_problems(self, rows):
+        problem_type, _ = Type.objects.get_or_create(name='미니')
+        subject, _ = Subject.objects.get_or_create(name='자료구조')
+        Problem.objects.bulk_create([
+            Problem(
+                title=f'문제 {i}',
+                description='다음 중 스택의 특징으로 옳은 것은?',
+                type=problem_type,
+                subject=subject,
+                correct_answer='1',
+            )
+            for i in range(Problem.objects.count(), rows)
+        ])
+
+    def test_type_list(self):
+        self.assertQueryBudget(
+            'get', '/api/types/', seed=self.seed_reference,
+            max_queries=1, max_bytes=lambda rows: 10 + 40 * rows,
+        )
+
+    def test_subject_list(self):
+        self.assertQueryBudget(
+            'get', '/api/subjects/', seed=self.seed_reference,
+            max_queries=1, max_bytes=lambda rows: 10 + 40 * rows,
+        )
+
+    def test_problem_list(self):
+        self.assertQueryBudget(
+            'get', '/api/problems/', seed=self.seed_problems,
+            max_queries=1, max_bytes=lambda rows: 10 + 200 * rows,
+        )
+
+    def test_problem_list_filtered(self):
+        self.assertQueryBudget(
+            'get', '/api/problems/?type_name=미니&subject_name=자료구조',
+            seed=self.seed_problems,
+            max_queries=3, max_bytes=lambda rows: 10 + 200 * rows,
+        )
+
+    def test_problem_list_fast_path(self):
+        self.seed_reference(5)
+        self.seed_problems(10)
+        # 따옴표, 이모지, 줄 구분자(\u2028) 등 이스케이프가 필요한 문자도 동일해야 함
+        Problem.objects.filter(title='문제 0').update(description='"인용" \\ 🙂\u2028끝')
+        for view_class, path in (
+            (views.TypeListView, '/api/types/'),
+            (views.SubjectListView, '/api/subjects/'),
+            (views.ProblemListView, '/api/problems/'),
+            (views.ProblemListView, '/api/problems/?type_name=미니'),
+        ):
+            with self.subTest(path=path):
+                self.assertFastPathParity(view_class, path)
+
+    def test_problem_detail(self):
+        def seed(rows):
+            self.seed_problems(rows)
+            return {'url': f'/api/problems/{Problem.objects.last().id}/'}
+
+        self.assertQueryBudget(
+            'get', None, seed=seed,
+            max_queries=1, max_bytes=300,
+        )
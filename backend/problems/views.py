@@ -1,7 +1,11 @@
+from django.utils.decorators import method_decorator
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
 from urllib.parse import unquote
 
+from config.caching import cached_view, conditional_view
+from config.fastpath import FastListMixin
+from .cache import PROBLEM_LIST_CACHE, PROBLEM_LIST_CACHE_TIMEOUT, PROBLEM_LIST_CACHE_CONTROL
 from .models import Type, Subject, Problem
 from .serializers import (
     TypeSerializer, SubjectSerializer,
@@ -11,27 +15,50 @@ from .serializers import (
 
 # ---------- Reference Data Views ----------
 
-class TypeListView(generics.ListAPIView):
+class TypeListView(FastListMixin, generics.ListAPIView):
     """종류 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = TypeSerializer
     queryset = Type.objects.all()
+    fast_fields = ('id', 'name')
 
 
-class SubjectListView(generics.ListAPIView):
+class SubjectListView(FastListMixin, generics.ListAPIView):
     """과목 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = SubjectSerializer
     queryset = Subject.objects.all()
+    fast_fields = ('id', 'name')
 
 
 # ---------- Problem Views ----------
 
-class ProblemListView(generics.ListAPIView):
+@method_decorator(conditional_view(
+    PROBLEM_LIST_CACHE, cache_control=PROBLEM_LIST_CACHE_CONTROL
+), name='list')
+@method_decorator(cached_view(PROBLEM_LIST_CACHE, ttl=PROBLEM_LIST_CACHE_TIMEOUT), name='list')
+class ProblemListView(FastListMixin, generics.ListAPIView):
     """문제 목록 조회 (필터링: type_name, subject_name)"""
     permission_classes = [AllowAny]
     serializer_class = ProblemListSerializer
     
+    def fast_rows(self, queryset):
+        """ProblemListSerializer 와 같은 구조의 dict 목록"""
+        rows = queryset.values(
+            'id', 'title', 'description',
+            'type_id', 'type__name', 'subject_id', 'subject__name'
+        )
+        return [
+            {
+                'id': row['id'],
+                'title': row['title'],
+                'description': row['description'],
+                'type': {'id': row['type_id'], 'name': row['type__name']},
+                'subject': {'id': row['subject_id'], 'name': row['subject__name']},
+            }
+            for row in rows
+        ]
+    
     def get_queryset(self):
         queryset = Problem.objects.select_related('type', 'subject').all()
         
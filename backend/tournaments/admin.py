@@ -0,0 +1,39 @@
+from django.contrib import admin
+from config.admin import LargeTableAdminMixin
+from .models import Tournament, TournamentEntrant, TournamentMatch
+
+
+@admin.register(Tournament)
+class TournamentAdmin(admin.ModelAdmin):
+    """토너먼트 Admin 설정"""
+    list_display = ('id', 'title', 'host', 'format', 'status', 'champion', 'created_at')
+    list_filter = ('format', 'status')
+    list_select_related = ('host', 'champion')
+    search_fields = ('title',)
+    autocomplete_fields = ('host', 'champion')
+
+
+@admin.register(TournamentEntrant)
+class TournamentEntrantAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """토너먼트 참가자 Admin 설정"""
+    list_display = ('id', 'tournament', 'user', 'seed', 'joined_at')
+    list_select_related = ('tournament', 'user')
+    search_fields = ('tournament__id', 'user__email')
+    search_id_fields = ('tournament_id',)
+    search_user_fields = ('user',)
+    search_text_fields = ()
+    search_help_text = '토너먼트 번호 또는 사용자 이메일 앞부분'
+    autocomplete_fields = ('tournament', 'user')
+
+
+@admin.register(TournamentMatch)
+class TournamentMatchAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """토너먼트 경기 Admin 설정"""
+    list_display = ('id', 'tournament', 'bracket', 'round', 'position', 'status', 'player1', 'player2', 'winner', 'room')
+    list_filter = ('bracket', 'status')
+    list_select_related = ('tournament', 'player1', 'player2', 'winner', 'room__host')
+    search_fields = ('tournament__id',)
+    search_id_fields = ('tournament_id', 'room_id')
+    search_text_fields = ()
+    search_help_text = '토너먼트 번호 또는 경기방 번호'
+    raw_id_fields = ('player1', 'player2', 'winner', 'loser', 'room', 'next_match', 'loser_next_match')
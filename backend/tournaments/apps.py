@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class TournamentsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'tournaments'
+
+    def ready(self):
+        from . import signals  # 시그널 수신기 등록
@@ -0,0 +1,89 @@
+"""
+대진표 구성 (DB 없이 경기 구조만 계산)
+
+참가자 n명을 2^k 자리에 시드 순서로 배치하고, 빈 자리는 부전승으로 처리합니다.
+
+- 싱글: 승자조 W1..Wk (라운드 r 의 경기 수 2^(k-r))
+- 더블: 승자조 + 패자조 L1..L(2k-2) + 결승 F1
+  - L 홀수 라운드: 이전 패자조 승자끼리 (L1 은 W1 패자끼리)
+  - L 짝수 라운드: 이전 패자조 승자(1번 자리) vs 승자조 W(r+1) 패자(2번 자리)
+  - 결승: 승자조 우승자(1번 자리) vs 패자조 우승자(2번 자리), 리셋 경기 없음
+"""
+import math
+
+
+def bracket_size(count):
+    """count 명이 들어가는 가장 작은 2의 거듭제곱 (최소 2)"""
+    return max(2, 1 << math.ceil(math.log2(max(count, 1))))
+
+
+def seed_order(size):
+    """
+    1라운드 자리 순서의 시드 번호 (1번과 2번 시드가 결승에서 만나도록)
+    size=8 -> [1, 8, 4, 5, 2, 7, 3, 6]
+    """
+    order = [1]
+    while len(order) < size:
+        total = len(order) * 2 + 1
+        order = [seed for s in order for seed in (s, total - s)]
+    return order
+
+
+def build_bracket(count, double=False):
+    """
+    경기 목록 반환 [{'key': (bracket, round, position), 'next': (key, slot) | None,
+                   'loser_next': (key, slot) | None, 'seeds': (시드, 시드) | None}]
+    seeds 는 1라운드만 있으며, count 보다 큰 시드는 None (부전승)
+    """
+    size = bracket_size(count)
+    rounds = int(math.log2(size))
+    matches = {}
+
+    def add(key, **fields):
+        matches[key] = {'key': key, 'next': None, 'loser_next': None, 'seeds': None, **fields}
+
+    # ---------- 승자조 ----------
+    order = [seed if seed <= count else None for seed in seed_order(size)]
+    for round_ in range(1, rounds + 1):
+        for position in range(size >> round_):
+            add(('W', round_, position))
+            if round_ == 1:
+                matches[('W', 1, position)]['seeds'] = tuple(order[position * 2:position * 2 + 2])
+            if round_ < rounds:
+                matches[('W', round_, position)]['next'] = (('W', round_ + 1, position // 2), position % 2 + 1)
+            elif double:
+                matches[('W', round_, position)]['next'] = (('F', 1, 0), 1)
+
+    if not double:
+        return list(matches.values())
+
+    # ---------- 패자조 ----------
+    loser_rounds = 2 * (rounds - 1)
+    for round_ in range(1, loser_rounds + 1):
+        count_in_round = 1 << (rounds - 1 - math.ceil(round_ / 2))
+        for position in range(count_in_round):
+            add(('L', round_, position))
+            if round_ == loser_rounds:
+                target = (('F', 1, 0), 2)
+            elif round_ % 2:
+                target = (('L', round_ + 1, position), 1)
+            else:
+                target = (('L', round_ + 1, position // 2), position % 2 + 1)
+            matches[('L', round_, position)]['next'] = target
+
+    # 승자조 패자 배치 (W1 은 L1 로, Wr 은 L(2r-2) 의 2번 자리로)
+    for round_ in range(1, rounds + 1):
+        for position in range(size >> round_):
+            if round_ == 1 and loser_rounds:
+                target = (('L', 1, position // 2), position % 2 + 1)
+            elif round_ == 1:
+                # 참가자 2명: 패자조 없이 결승에서 다시 대결
+                target = (('F', 1, 0), 2)
+            else:
+                # 같은 상대와 바로 다시 만나지 않도록 위아래를 뒤집어 배치
+                width = size >> round_
+                target = (('L', 2 * round_ - 2, width - 1 - position), 2)
+            matches[('W', round_, position)]['loser_next'] = target
+
+    add(('F', 1, 0))
+    return list(matches.values())
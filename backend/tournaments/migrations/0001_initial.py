@@ -0,0 +1,74 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('battles', '0006_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tournament',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('format', models.CharField(choices=[('single', '싱글 엘리미네이션'), ('double', '더블 엘리미네이션')], default='single', max_length=10)),
+                ('status', models.CharField(choices=[('registering', '참가 신청'), ('running', '진행'), ('finished', '종료')], default='registering', max_length=20)),
+                ('is_cote', models.BooleanField(default=False)),
+                ('problem_count', models.PositiveSmallIntegerField(default=3)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('champion', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='won_tournaments', to=settings.AUTH_USER_MODEL)),
+                ('host', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hosted_tournaments', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': '토너먼트',
+            },
+        ),
+        migrations.CreateModel(
+            name='TournamentEntrant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seed', models.PositiveIntegerField(blank=True, null=True)),
+                ('joined_at', models.DateTimeField(auto_now_add=True)),
+                ('tournament', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entrants', to='tournaments.tournament')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tournament_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': '토너먼트참가자',
+                'unique_together': {('tournament', 'user')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TournamentMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bracket', models.CharField(choices=[('W', '승자조'), ('L', '패자조'), ('F', '결승')], default='W', max_length=1)),
+                ('round', models.PositiveSmallIntegerField()),
+                ('position', models.PositiveIntegerField()),
+                ('status', models.CharField(choices=[('pending', '대기'), ('playing', '진행'), ('done', '종료')], default='pending', max_length=10)),
+                ('next_slot', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('loser_next_slot', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('loser', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('loser_next_match', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='tournaments.tournamentmatch')),
+                ('next_match', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='tournaments.tournamentmatch')),
+                ('player1', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('player2', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('room', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tournament_match', to='battles.battleroom')),
+                ('tournament', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='tournaments.tournament')),
+                ('winner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': '토너먼트경기',
+                'indexes': [models.Index(fields=['tournament', 'status'], name='tmatch_tournament_status_idx')],
+                'unique_together': {('tournament', 'bracket', 'round', 'position')},
+            },
+        ),
+    ]
@@ -0,0 +1,159 @@
+from django.db import models
+from users.models import User
+from battles.models import BattleRoom
+
+
+class Tournament(models.Model):
+    """토너먼트 모델"""
+    FORMAT_CHOICES = [
+        ('single', '싱글 엘리미네이션'),
+        ('double', '더블 엘리미네이션'),
+    ]
+    STATUS_CHOICES = [
+        ('registering', '참가 신청'),
+        ('running', '진행'),
+        ('finished', '종료'),
+    ]
+
+    title = models.CharField(max_length=200)
+    host = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='hosted_tournaments'
+    )
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES, default='single')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='registering')
+    # 경기방 설정: is_cote 는 BattleRoom 과 같음, 라운드마다 같은 문제 problem_count 개
+    is_cote = models.BooleanField(default=False)
+    problem_count = models.PositiveSmallIntegerField(default=3)
+    champion = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='won_tournaments',
+        null=True,
+        blank=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = '토너먼트'
+
+    def __str__(self):
+        return self.title
+
+
+class TournamentEntrant(models.Model):
+    """토너먼트 참가자 모델"""
+    tournament = models.ForeignKey(
+        Tournament,
+        on_delete=models.CASCADE,
+        related_name='entrants'
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='tournament_entries'
+    )
+    # 시작 시 Profile.rating 내림차순으로 1부터 부여 (무승부 시 시드가 높은 쪽이 진출)
+    seed = models.PositiveIntegerField(null=True, blank=True)
+    joined_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = '토너먼트참가자'
+        unique_together = [['tournament', 'user']]
+
+    def __str__(self):
+        return f"{self.tournament} - {self.user} (시드 {self.seed})"
+
+
+class TournamentMatch(models.Model):
+    """
+    토너먼트 경기 모델
+    - 시작 시 대진표 전체를 만들고, 선수가 정해지는 대로 player1/player2 를 채움
+    - 승자는 next_match 의 next_slot 으로, (더블 엘리미네이션) 패자는
+      loser_next_match 의 loser_next_slot 으로 진출
+    - 두 선수가 정해지면 경기방(room)을 만들고, 결과가 확정되면 winner/loser 기록
+    """
+    BRACKET_CHOICES = [
+        ('W', '승자조'),
+        ('L', '패자조'),
+        ('F', '결승'),
+    ]
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('playing', '진행'),
+        ('done', '종료'),
+    ]
+
+    tournament = models.ForeignKey(
+        Tournament,
+        on_delete=models.CASCADE,
+        related_name='matches'
+    )
+    bracket = models.CharField(max_length=1, choices=BRACKET_CHOICES, default='W')
+    round = models.PositiveSmallIntegerField()
+    position = models.PositiveIntegerField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    player1 = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True,
+        blank=True
+    )
+    player2 = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True,
+        blank=True
+    )
+    # 부전승이면 loser 없음, 두 자리가 모두 비면 winner 도 없음
+    winner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True,
+        blank=True
+    )
+    loser = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True,
+        blank=True
+    )
+    room = models.OneToOneField(
+        BattleRoom,
+        on_delete=models.SET_NULL,
+        related_name='tournament_match',
+        null=True,
+        blank=True
+    )
+    next_match = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        related_name='+',
+        null=True,
+        blank=True
+    )
+    next_slot = models.PositiveSmallIntegerField(null=True, blank=True)
+    loser_next_match = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        related_name='+',
+        null=True,
+        blank=True
+    )
+    loser_next_slot = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    class Meta:
+        db_table = '토너먼트경기'
+        unique_together = [['tournament', 'bracket', 'round', 'position']]
+        indexes = [
+            # 진행 단계마다 토너먼트의 상태별 경기 조회
+            models.Index(fields=['tournament', 'status'], name='tmatch_tournament_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.tournament} {self.bracket}{self.round}-{self.position}"
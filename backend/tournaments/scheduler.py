@@ -0,0 +1,315 @@
+"""
+토너먼트 진행 (대진표 생성, 경기방 일괄 생성, 결과 반영)
+
+모든 단계는 경기 수와 무관하게 일정한 수의 쿼리로 처리합니다.
+- start_tournament: 시드 부여 -> 대진표 전체 bulk_create (1라운드 선수 포함) -> 다음 경기 연결 UPDATE
+- advance_tournament: 결과가 확정된 경기 판정 -> 다음 경기로 승자/패자 배치 ->
+  부전승 처리 -> 두 선수가 정해진 경기의 방을 한 번에 생성
+  (부전승이 연쇄되는 경우에만 배치/부전승 단계를 라운드 수만큼 반복)
+
+경기 결과는 BattleResult 두 개가 모두 제출되면 total_score 로 확정되며, 동점이면 시드가 높은(번호가 작은) 쪽이 진출합니다.
+경기방이 삭제된 '진행' 경기는 다음 진행 때 '대기' 로 되돌려 방을 다시 만듭니다.
+한 선수가 결과를 제출하지 않는 경기는 주최자가 기권패로 처리할 수 있습니다 (forfeit_match).
+battles.signals.battle_finished 를 받으면 advance_tournament 를 백그라운드 작업으로 실행합니다 (signals.py, tasks.py).
+"""
+import random
+
+from django.db import connection, transaction
+from django.db.models import Case, Count, Exists, F, Max, Min, OuterRef, Q, Subquery, When
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import GreaterThan, LessThan, LessThanOrEqual
+
+from battles.models import BattleResult, BattleRoom, BattleStatus
+from problems.models import Problem
+from .bracket import build_bracket
+from .models import Tournament, TournamentEntrant, TournamentMatch
+
+
+BRACKET_LABELS = {'W': '승자조', 'L': '패자조', 'F': '결승'}
+# 문제 추첨 후보 수 (뽑을 문제 수의 배수, 최소값)
+PROBLEM_CANDIDATE_FACTOR = 10
+PROBLEM_CANDIDATE_MIN = 100
+
+
+class TournamentError(Exception):
+    """토너먼트를 진행할 수 없는 상태 (뷰에서 400 으로 응답)"""
+
+
+def start_tournament(tournament_id):
+    """참가 신청을 마감하고 대진표를 만든 뒤 첫 경기방들을 생성"""
+    with transaction.atomic():
+        tournament = Tournament.objects.select_for_update().get(pk=tournament_id)
+        if tournament.status != 'registering':
+            raise TournamentError('이미 시작된 토너먼트입니다.')
+
+        # 레이팅 내림차순 (프로필이 없으면 마지막), 같으면 먼저 신청한 순
+        entrants = list(
+            TournamentEntrant.objects.filter(tournament=tournament)
+            .order_by(F('user__profile__rating').desc(nulls_last=True), 'joined_at', 'id')
+        )
+        if len(entrants) < 2:
+            raise TournamentError('참가자가 2명 이상이어야 시작할 수 있습니다.')
+        for seed, entrant in enumerate(entrants, start=1):
+            entrant.seed = seed
+        TournamentEntrant.objects.bulk_update(entrants, ['seed'])
+
+        specs = build_bracket(len(entrants), double=tournament.format == 'double')
+        user_by_seed = {entrant.seed: entrant.user_id for entrant in entrants}
+        matches = TournamentMatch.objects.bulk_create([
+            TournamentMatch(
+                tournament=tournament, bracket=bracket, round=round_, position=position,
+                player1_id=user_by_seed.get(seeds[0]) if seeds else None,
+                player2_id=user_by_seed.get(seeds[1]) if seeds else None,
+            )
+            for (bracket, round_, position), seeds in ((spec['key'], spec['seeds']) for spec in specs)
+        ])
+        pk_by_key = {spec['key']: match.pk for spec, match in zip(specs, matches)}
+
+        def link(target):
+            return (pk_by_key[target[0]], target[1]) if target else (None, None)
+
+        update_links([
+            (match.pk, *link(spec['next']), *link(spec['loser_next']))
+            for spec, match in zip(specs, matches)
+            if spec['next'] or spec['loser_next']
+        ])
+
+        tournament.status = 'running'
+        tournament.save(update_fields=['status'])
+        advance_tournament(tournament.pk)
+    return tournament
+
+
+def update_links(rows):
+    """
+    (경기 id, 다음 경기 id, 자리, 패자 다음 경기 id, 자리) 행을 UPDATE ... FROM (VALUES ...) 로 저장
+    (bulk_update 는 행마다 CASE WHEN 을 만들어 1000경기 규모에서 수 초가 걸림)
+    """
+    if not rows:
+        # 2인 토너먼트처럼 연결할 경기가 없는 경우
+        return
+    quote = connection.ops.quote_name
+    columns = ('next_match', 'next_slot', 'loser_next_match', 'loser_next_slot')
+    table = quote(TournamentMatch._meta.db_table)
+    assignments = ', '.join(
+        f'{quote(TournamentMatch._meta.get_field(name).column)} = CAST(v.column{index} AS bigint)'
+        for index, name in enumerate(columns, start=2)
+    )
+    # SQLite 등 쿼리 파라미터 개수 제한 대비
+    max_params = connection.features.max_query_params
+    batch_size = max_params // 5 if max_params else len(rows)
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            chunk = rows[start:start + batch_size]
+            cursor.execute(
+                f'UPDATE {table} SET {assignments} '
+                f'FROM (VALUES {", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))}) AS v '
+                f'WHERE {table}.{quote("id")} = v.column1',
+                [value for row in chunk for value in row],
+            )
+
+
+def advance_tournament(tournament_id):
+    """
+    확정된 결과를 반영하고 다음 경기방을 생성 (여러 번 호출해도 안전)
+    반환: 새로 만든 경기방 목록
+    """
+    with transaction.atomic():
+        # 동시에 끝난 두 경기가 같은 다음 경기방을 중복 생성하지 않도록 토너먼트 단위로 잠금
+        tournament = Tournament.objects.select_for_update().get(pk=tournament_id)
+        if tournament.status != 'running':
+            return []
+        matches = TournamentMatch.objects.filter(tournament=tournament)
+
+        decide_played_matches(matches)
+        reopen_roomless_matches(matches)
+        while True:
+            propagate_players(matches)
+            if not resolve_byes(matches):
+                break
+        rooms = schedule_ready_matches(tournament, matches)
+
+        final = matches.filter(next_match__isnull=True, status='done').values('winner').first()
+        if final:
+            Tournament.objects.filter(pk=tournament.pk).update(
+                status='finished', champion=final['winner']
+            )
+    return rooms
+
+
+def random_problem_ids(count):
+    """
+    문제 count 개를 무작위로 선택
+    ORDER BY RANDOM() 은 문제 테이블 전체를 정렬하므로, 임의의 id 지점부터 pk 인덱스로
+    후보를 일정 개수만 읽고 그 안에서 뽑음 (끝에 닿으면 처음부터 이어서)
+    """
+    bounds = Problem.objects.aggregate(low=Min('id'), high=Max('id'))
+    if bounds['low'] is None:
+        return []
+    limit = max(count * PROBLEM_CANDIDATE_FACTOR, PROBLEM_CANDIDATE_MIN)
+    pivot = random.randint(bounds['low'], bounds['high'])
+    ids = Problem.objects.order_by('id').values_list('id', flat=True)
+    candidates = list(ids.filter(id__gte=pivot)[:limit])
+    if len(candidates) < limit:
+        candidates += ids.filter(id__lt=pivot)[:limit - len(candidates)]
+    return random.sample(candidates, min(count, len(candidates)))
+
+
+def decide_played_matches(matches):
+    """두 참가자의 결과가 모두 제출된 경기의 승자/패자 기록 및 경기방 '종료'"""
+    result_count = Subquery(
+        BattleResult.objects.filter(room=OuterRef('room_id'))
+        .values('room').annotate(count=Count('id')).values('count')
+    )
+    finished_ids = list(
+        matches.filter(status='playing')
+        .alias(result_count=result_count).filter(result_count__gte=2)
+        .values_list('id', flat=True)
+    )
+    if not finished_ids:
+        return 0
+
+    def seed_of(field):
+        return Subquery(
+            TournamentEntrant.objects.filter(
+                tournament=OuterRef('tournament_id'), user=OuterRef(field)
+            ).values('seed')[:1]
+        )
+
+    def score_of(field):
+        return Subquery(
+            BattleResult.objects.filter(
+                room=OuterRef('room_id'), user=OuterRef(field)
+            ).values('total_score')[:1]
+        )
+
+    # 제출 시점의 result('win' 등)는 동시 제출이면 둘 다 'win' 일 수 있으므로 점수로 판정
+    decided = TournamentMatch.objects.filter(pk__in=finished_ids)
+    decided.update(winner=Case(
+        When(GreaterThan(score_of('player1_id'), score_of('player2_id')), then=F('player1')),
+        When(LessThan(score_of('player1_id'), score_of('player2_id')), then=F('player2')),
+        # 동점: 시드가 높은 쪽
+        When(LessThanOrEqual(seed_of('player1_id'), seed_of('player2_id')), then=F('player1')),
+        default=F('player2'),
+    ))
+    decided.update(
+        loser=Case(When(winner=F('player1'), then=F('player2')), default=F('player1')),
+        status='done',
+    )
+    close_match_rooms(finished_ids)
+    return len(finished_ids)
+
+
+def close_match_rooms(match_ids):
+    """끝난 경기들의 경기방을 '종료' 로 변경"""
+    finished_status = BattleStatus.objects.filter(name='종료').first()
+    if finished_status:
+        BattleRoom.objects.filter(tournament_match__in=match_ids).update(
+            status=finished_status, is_waiting=False
+        )
+
+
+def forfeit_match(tournament_id, match_id, loser_id):
+    """
+    진행 중인 경기를 loser_id 의 기권패로 종료하고 다음 경기로 진행
+    (한 선수가 결과를 제출하지 않아 대진표가 멈춘 경우 주최자가 처리)
+    """
+    with transaction.atomic():
+        tournament = Tournament.objects.select_for_update().get(pk=tournament_id)
+        if tournament.status != 'running':
+            raise TournamentError('진행 중인 토너먼트가 아닙니다.')
+        match = TournamentMatch.objects.filter(tournament=tournament, pk=match_id).first()
+        if match is None or match.status != 'playing':
+            raise TournamentError('진행 중인 경기가 아닙니다.')
+        if loser_id not in (match.player1_id, match.player2_id):
+            raise TournamentError('해당 경기의 선수가 아닙니다.')
+
+        match.loser_id = loser_id
+        match.winner_id = match.player2_id if loser_id == match.player1_id else match.player1_id
+        match.status = 'done'
+        match.save(update_fields=['winner', 'loser', 'status'])
+        close_match_rooms([match.pk])
+        advance_tournament(tournament.pk)
+    return match
+
+
+def reopen_roomless_matches(matches):
+    """경기방이 삭제된 (room 이 SET_NULL 된) '진행' 경기를 '대기' 로 되돌림 (schedule_ready_matches 가 방을 다시 만듦)"""
+    return matches.filter(status='playing', room__isnull=True).update(status='pending')
+
+
+def propagate_players(matches):
+    """종료된 경기의 승자/패자를 다음 경기 자리에 배치 (자리마다 UPDATE 1회)"""
+    for slot in (1, 2):
+        field = f'player{slot}'
+        from_winner = TournamentMatch.objects.filter(
+            next_match=OuterRef('pk'), next_slot=slot, status='done'
+        ).values('winner')[:1]
+        from_loser = TournamentMatch.objects.filter(
+            loser_next_match=OuterRef('pk'), loser_next_slot=slot, status='done'
+        ).values('loser')[:1]
+        matches.filter(status='pending', **{f'{field}__isnull': True}).update(
+            **{field: Coalesce(Subquery(from_winner), Subquery(from_loser))}
+        )
+
+
+def resolve_byes(matches):
+    """
+    올 수 있는 선수가 모두 정해졌는데 자리가 비어 있는 경기 처리
+    - 한 명만 있으면 부전승, 아무도 없으면 승자 없이 종료
+    반환: 처리한 경기 수
+    """
+    pending_feeders = TournamentMatch.objects.filter(
+        Q(next_match=OuterRef('pk')) | Q(loser_next_match=OuterRef('pk'))
+    ).exclude(status='done')
+    bye_ids = list(
+        matches.filter(status='pending')
+        .filter(Q(player1__isnull=True) | Q(player2__isnull=True))
+        .exclude(Exists(pending_feeders))
+        .values_list('id', flat=True)
+    )
+    if bye_ids:
+        TournamentMatch.objects.filter(pk__in=bye_ids).update(
+            winner=Coalesce(F('player1'), F('player2')), status='done'
+        )
+    return len(bye_ids)
+
+
+def schedule_ready_matches(tournament, matches):
+    """
+    두 선수가 정해진 경기의 방을 한 번에 생성 (호스트/게스트 지정, '진행' 상태)
+    같은 시점에 열리는 경기는 같은 문제로 진행
+    """
+    ready = list(
+        matches.filter(
+            status='pending', room__isnull=True,
+            player1__isnull=False, player2__isnull=False,
+        ).order_by('bracket', 'round', 'position')
+    )
+    if not ready:
+        return []
+    playing_status = BattleStatus.objects.filter(name='진행').first()
+    if not playing_status:
+        raise TournamentError("'진행' 상태가 데이터베이스에 존재하지 않습니다.")
+
+    rooms = BattleRoom.objects.bulk_create([
+        BattleRoom(
+            title=f'{tournament.title} {BRACKET_LABELS[match.bracket]} {match.round}라운드 {match.position + 1}경기',
+            is_cote=tournament.is_cote,
+            host_id=match.player1_id,
+            guest_id=match.player2_id,
+            status=playing_status,
+        )
+        for match in ready
+    ])
+    problem_ids = random_problem_ids(tournament.problem_count)
+    RoomProblem = BattleRoom.problems.through
+    RoomProblem.objects.bulk_create([
+        RoomProblem(battleroom_id=room.pk, problem_id=problem_id)
+        for room in rooms for problem_id in problem_ids
+    ])
+    for match, room in zip(ready, rooms):
+        match.room = room
+        match.status = 'playing'
+    TournamentMatch.objects.bulk_update(ready, ['room', 'status'])
+    return rooms
@@ -0,0 +1,52 @@
+from rest_framework import serializers
+from battles.serializers import UserSimpleSerializer
+from .models import Tournament, TournamentEntrant, TournamentMatch
+
+
+class TournamentSerializer(serializers.ModelSerializer):
+    """토너먼트 목록 조회/생성용 Serializer"""
+    host = UserSimpleSerializer(read_only=True)
+    # 목록 queryset 의 annotate 값 (생성 응답에서는 0)
+    entrant_count = serializers.IntegerField(read_only=True, default=0)
+
+    class Meta:
+        model = Tournament
+        fields = (
+            'id', 'title', 'host', 'format', 'status', 'is_cote',
+            'problem_count', 'entrant_count', 'champion', 'created_at'
+        )
+        read_only_fields = ('status', 'champion', 'created_at')
+
+    def validate_problem_count(self, value):
+        if not 1 <= value <= 10:
+            raise serializers.ValidationError('문제 수는 1~10개여야 합니다.')
+        return value
+
+
+class TournamentEntrantSerializer(serializers.ModelSerializer):
+    """토너먼트 참가자 Serializer"""
+    user = UserSimpleSerializer(read_only=True)
+
+    class Meta:
+        model = TournamentEntrant
+        fields = ('user', 'seed')
+
+
+class TournamentMatchSerializer(serializers.ModelSerializer):
+    """대진표 경기 Serializer (선수는 id 만, 참가자 목록의 user 로 매칭)"""
+
+    class Meta:
+        model = TournamentMatch
+        fields = (
+            'id', 'bracket', 'round', 'position', 'status',
+            'player1', 'player2', 'winner', 'room'
+        )
+
+
+class TournamentDetailSerializer(TournamentSerializer):
+    """토너먼트 상세 조회용 Serializer (참가자, 대진표 포함)"""
+    entrants = TournamentEntrantSerializer(many=True, read_only=True)
+    matches = TournamentMatchSerializer(many=True, read_only=True)
+
+    class Meta(TournamentSerializer.Meta):
+        fields = TournamentSerializer.Meta.fields + ('entrants', 'matches')
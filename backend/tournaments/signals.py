@@ -0,0 +1,42 @@
+from django.db import transaction
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from battles.models import BattleRoom
+from battles.signals import battle_finished
+from .models import TournamentMatch
+from .tasks import advance
+
+
+@receiver(battle_finished)
+def on_battle_finished(sender, room, **kwargs):
+    """
+    토너먼트 경기방이면 결과 반영/다음 경기방 생성을 작업으로 넘김
+    (대진표 전체를 갱신하므로 결과 제출 응답을 기다리게 하지 않음, jobs 워커가 실행)
+    결과 제출 트랜잭션이 커밋된 뒤 추가해야 작업이 아직 커밋되지 않은 결과를 보지 않음
+    """
+    tournament_id = (
+        TournamentMatch.objects.filter(room=room)
+        .values_list('tournament_id', flat=True).first()
+    )
+    if tournament_id is not None:
+        transaction.on_commit(lambda: advance.delay(tournament_id))
+
+
+@receiver(pre_delete, sender=BattleRoom)
+def on_room_deleted(sender, instance, **kwargs):
+    """
+    진행 중인 경기방이 (admin, 사용자 삭제 등으로) 지워지면 삭제가 커밋된 뒤 진행 작업 추가
+    (advance_tournament 가 방 없는 경기를 '대기' 로 되돌리고 방을 다시 만듦)
+    """
+    if BattleRoom.tournament_match.is_cached(instance):
+        # 삭제 뷰처럼 select_related('tournament_match') 로 조회한 방은 추가 쿼리 없음
+        match = getattr(instance, 'tournament_match', None)
+        tournament_id = match.tournament_id if match and match.status == 'playing' else None
+    else:
+        tournament_id = (
+            TournamentMatch.objects.filter(room=instance, status='playing')
+            .values_list('tournament_id', flat=True).first()
+        )
+    if tournament_id is not None:
+        transaction.on_commit(lambda: advance.delay(tournament_id))
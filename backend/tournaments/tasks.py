@@ -0,0 +1,8 @@
+from jobs.queue import task
+from .scheduler import advance_tournament
+
+
+@task(max_attempts=5, retry_delay=5)
+def advance(tournament_id):
+    """경기 결과 반영 및 다음 경기방 생성 (advance_tournament 는 여러 번 실행해도 안전)"""
+    advance_tournament(tournament_id)
@@ -0,0 +1,270 @@
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from battles.models import BattleResult, BattleStatus, BattleRoom
+from config.testing import QueryBudgetMixin
+from jobs.models import Job
+from jobs.worker import run_pending
+from problems.models import Type, Subject, Problem
+from users.models import Profile, User
+from .bracket import build_bracket, seed_order
+from .models import Tournament, TournamentEntrant, TournamentMatch
+from .scheduler import advance_tournament, start_tournament
+
+
+class BracketTests(SimpleTestCase):
+    """대진표 구조 계산 테스트"""
+
+    def test_seed_order(self):
+        self.assertEqual(seed_order(8), [1, 8, 4, 5, 2, 7, 3, 6])
+
+    def test_single_match_count(self):
+        for count in (2, 5, 8, 13):
+            matches = build_bracket(count)
+            size = 1 << (count - 1).bit_length()
+            self.assertEqual(len(matches), size - 1)
+            # 1라운드에서 부전승 자리는 size - count 개
+            byes = sum(spec['seeds'].count(None) for spec in matches if spec['seeds'])
+            self.assertEqual(byes, size - count)
+
+    def test_double_links(self):
+        matches = build_bracket(8, double=True)
+        # 승자조 7 + 패자조 6 + 결승 1
+        self.assertEqual(len(matches), 2 * 8 - 2)
+        keys = {spec['key'] for spec in matches}
+        incoming = {}
+        for spec in matches:
+            for link in (spec['next'], spec['loser_next']):
+                if link:
+                    self.assertIn(link[0], keys)
+                    incoming.setdefault(link, 0)
+                    incoming[link] += 1
+        # 한 자리에는 한 경기만 연결됨
+        self.assertEqual(set(incoming.values()), {1})
+        # 1라운드가 아닌 경기는 두 자리 모두 채워짐
+        for spec in matches:
+            if not spec['seeds']:
+                self.assertIn((spec['key'], 1), incoming)
+                self.assertIn((spec['key'], 2), incoming)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class TournamentFlowTests(QueryBudgetMixin, TestCase):
+    """토너먼트 API 진행 테스트 (경기방 결과 제출까지)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        BattleStatus.objects.create(name='대기')
+        BattleStatus.objects.create(name='진행')
+        BattleStatus.objects.create(name='종료')
+        problem_type = Type.objects.create(name='미니')
+        subject = Subject.objects.create(name='자료구조')
+        Problem.objects.bulk_create([
+            Problem(title=f'문제 {i}', description='설명', type=problem_type,
+                    subject=subject, correct_answer='1')
+            for i in range(5)
+        ])
+        cls.host = User.objects.create_user(email='thost@korea.ac.kr', password='pw')
+
+    def create_players(self, count, prefix='player'):
+        """레이팅이 높은 순으로 시드 1..count 가 되는 사용자 생성"""
+        users = User.objects.bulk_create([
+            User(email=f'{prefix}{i}@korea.ac.kr') for i in range(count)
+        ])
+        Profile.objects.bulk_create([
+            Profile(user=user, nickname=f'{prefix}{i}', rating=3000 - i)
+            for i, user in enumerate(users)
+        ])
+        return users
+
+    def create_tournament(self, players, **kwargs):
+        response = self.client_for(self.host).post(
+            '/api/tournaments/', {'title': '교내 대회', **kwargs}, format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        tournament_id = response.data['id']
+        for user in players:
+            response = self.client_for(user).post(f'/api/tournaments/{tournament_id}/join/')
+            self.assertEqual(response.status_code, 201)
+        return tournament_id
+
+    def play(self, match, winner):
+        """두 선수가 결과 제출 (winner 가 높은 점수, 진행 작업은 커밋 뒤에 추가됨)"""
+        for player_id in (match.player1_id, match.player2_id):
+            score = 90 if player_id == winner else 10
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client_for(User.objects.get(pk=player_id)).post(
+                    f'/api/battles/rooms/{match.room_id}/submit-result/',
+                    {'remaining_time_percent': score, 'accuracy_percent': score}, format='json'
+                )
+            self.assertEqual(response.status_code, 200)
+
+    def play_all(self, tournament_id, pick_winner):
+        """진행 중인 경기가 없을 때까지 pick_winner(match) 가 이기도록 진행"""
+        while True:
+            playing = list(TournamentMatch.objects.filter(tournament_id=tournament_id, status='playing'))
+            if not playing:
+                return
+            for match in playing:
+                self.play(match, pick_winner(match))
+            # 결과 반영/다음 경기방 생성은 워커가 실행
+            while run_pending():
+                pass
+
+    def test_single_elimination_with_byes(self):
+        players = self.create_players(5)
+        tournament_id = self.create_tournament(players)
+
+        response = self.client_for(players[0]).post(f'/api/tournaments/{tournament_id}/start/')
+        self.assertEqual(response.status_code, 403)
+        response = self.client_for(self.host).post(f'/api/tournaments/{tournament_id}/start/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'running')
+        self.assertEqual([e['seed'] for e in response.data['entrants']], [1, 2, 3, 4, 5])
+
+        # 8자리 중 부전승 3개: 4 vs 5 와, 부전승끼리 만난 2라운드 2 vs 3 이 바로 열림
+        playing = TournamentMatch.objects.filter(tournament_id=tournament_id, status='playing')
+        self.assertEqual(
+            {(match.round, match.player1_id, match.player2_id) for match in playing},
+            {(1, players[3].id, players[4].id), (2, players[1].id, players[2].id)}
+        )
+        room = BattleRoom.objects.get(pk=playing[0].room_id)
+        self.assertEqual((room.status.name, room.problems.count()), ('진행', 3))
+
+        # 신청 마감 후 참가/재시작 불가
+        late = self.create_players(1, prefix='late')[0]
+        self.assertEqual(self.client_for(late).post(f'/api/tournaments/{tournament_id}/join/').status_code, 400)
+        self.assertEqual(self.client_for(self.host).post(f'/api/tournaments/{tournament_id}/start/').status_code, 400)
+
+        # 결과 제출 응답에서는 다음 경기를 만들지 않고 작업만 추가
+        first = playing.get(round=1)
+        self.play(first, players[4].id)
+        self.assertEqual(Job.objects.filter(name='tournaments.tasks.advance', status='queued').count(), 1)
+        self.assertEqual(TournamentMatch.objects.get(pk=first.pk).status, 'playing')
+        run_pending()
+        self.assertEqual(TournamentMatch.objects.get(pk=first.pk).winner_id, players[4].id)
+
+        # 하위 시드가 이기도록 진행: 5번 시드 우승
+        self.play_all(tournament_id, lambda m: max(m.player1_id, m.player2_id))
+        tournament = Tournament.objects.get(pk=tournament_id)
+        self.assertEqual((tournament.status, tournament.champion_id), ('finished', players[4].id))
+        self.assertFalse(BattleRoom.objects.filter(tournament_match__tournament=tournament, status__name='진행').exists())
+
+        detail = self.client_for().get(f'/api/tournaments/{tournament_id}/')
+        self.assertEqual(len(detail.data['matches']), 7)
+        self.assertEqual(detail.data['champion'], players[4].id)
+
+    def test_double_elimination(self):
+        players = self.create_players(4)
+        tournament_id = self.create_tournament(players, format='double')
+        self.client_for(self.host).post(f'/api/tournaments/{tournament_id}/start/')
+
+        # 상위 시드가 항상 이김: 1번 시드는 무패, 2번 시드는 패자조를 거쳐 결승
+        self.play_all(tournament_id, lambda m: min(m.player1_id, m.player2_id))
+        tournament = Tournament.objects.get(pk=tournament_id)
+        self.assertEqual((tournament.status, tournament.champion_id), ('finished', players[0].id))
+        final = TournamentMatch.objects.get(tournament=tournament, bracket='F')
+        self.assertEqual((final.player1_id, final.player2_id), (players[0].id, players[1].id))
+        # 1번 시드는 무패, 나머지는 패배 2회로 탈락
+        losses = {player.id: 0 for player in players}
+        for loser in TournamentMatch.objects.filter(tournament=tournament).values_list('loser', flat=True):
+            if loser:
+                losses[loser] += 1
+        self.assertEqual(sorted(losses.values()), [0, 2, 2, 2])
+
+    def start_final(self):
+        """2인 토너먼트를 시작하고 (선수들, 결승 경기) 반환"""
+        players = self.create_players(2)
+        tournament_id = self.create_tournament(players)
+        self.client_for(self.host).post(f'/api/tournaments/{tournament_id}/start/')
+        return players, TournamentMatch.objects.get(tournament_id=tournament_id)
+
+    def test_host_cannot_delete_or_close_match_room(self):
+        players, match = self.start_final()
+        client = self.client_for(players[0])
+        self.assertEqual(match.room.host_id, players[0].id)
+        response = client.delete(f'/api/battles/rooms/{match.room_id}/')
+        self.assertEqual(response.status_code, 403)
+        finished = BattleStatus.objects.get(name='종료')
+        response = client.patch(
+            f'/api/battles/rooms/{match.room_id}/status/', {'status': finished.id}, format='json'
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(BattleRoom.objects.get(pk=match.room_id).status.name, '진행')
+
+    def test_deleted_room_is_recreated(self):
+        players, match = self.start_final()
+        with self.captureOnCommitCallbacks(execute=True):
+            BattleRoom.objects.filter(pk=match.room_id).delete()
+        while run_pending():
+            pass
+        match.refresh_from_db()
+        self.assertEqual(match.status, 'playing')
+        self.assertIsNotNone(match.room_id)
+        self.play(match, players[1].id)
+        while run_pending():
+            pass
+        self.assertEqual(Tournament.objects.get(pk=match.tournament_id).champion_id, players[1].id)
+
+    def test_host_forfeits_absent_player(self):
+        players, match = self.start_final()
+        # 한 선수만 제출한 경기는 결과가 확정되지 않음
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client_for(players[0]).post(
+                f'/api/battles/rooms/{match.room_id}/submit-result/',
+                {'remaining_time_percent': 50, 'accuracy_percent': 50}, format='json'
+            )
+        while run_pending():
+            pass
+        self.assertEqual(TournamentMatch.objects.get(pk=match.pk).status, 'playing')
+
+        url = f'/api/tournaments/{match.tournament_id}/matches/{match.pk}/forfeit/'
+        response = self.client_for(players[0]).post(url, {'loser': players[1].id}, format='json')
+        self.assertEqual(response.status_code, 403)
+        response = self.client_for(self.host).post(url, {'loser': self.host.id}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client_for(self.host).post(url, {'loser': players[1].id}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['status'], response.data['champion']), ('finished', players[0].id))
+        match.refresh_from_db()
+        self.assertEqual((match.status, match.winner_id, match.loser_id), ('done', players[0].id, players[1].id))
+        self.assertEqual(match.room.status.name, '종료')
+        # 이미 끝난 경기는 다시 처리할 수 없음
+        response = self.client_for(self.host).post(url, {'loser': players[0].id}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_winner_decided_by_score(self):
+        # 동시 제출로 두 결과가 모두 'win' 이어도 점수로 판정, 동점이면 상위 시드
+        for scores, winner in (((30, 80), 1), ((50, 50), 0)):
+            with self.subTest(scores=scores):
+                Tournament.objects.all().delete()
+                User.objects.filter(email__startswith='player').delete()
+                players, match = self.start_final()
+                BattleResult.objects.bulk_create([
+                    BattleResult(room_id=match.room_id, user=player, remaining_time_percent=score,
+                                 accuracy_percent=0, total_score=score, result='win')
+                    for player, score in zip(players, scores)
+                ])
+                advance_tournament(match.tournament_id)
+                match.refresh_from_db()
+                self.assertEqual((match.status, match.winner_id), ('done', players[winner].id))
+
+    def test_start_query_count_is_constant(self):
+        def start_queries(count):
+            players = self.create_players(count, prefix=f's{count}_')
+            tournament = Tournament.objects.create(title=f'{count}강', host=self.host, format='double')
+            TournamentEntrant.objects.bulk_create([
+                TournamentEntrant(tournament=tournament, user=user) for user in players
+            ])
+            with CaptureQueriesContext(connection) as ctx:
+                start_tournament(tournament.id)
+            self.assertEqual(
+                TournamentMatch.objects.filter(tournament=tournament, status='playing').count(),
+                count // 2
+            )
+            return len(ctx.captured_queries)
+
+        # SQLite 는 파라미터 수 한도로 bulk 쿼리를 나누므로 한 번에 들어가는 규모에서 비교
+        self.assertEqual(start_queries(8), start_queries(32))
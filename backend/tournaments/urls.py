@@ -0,0 +1,23 @@
+from django.urls import path
+from .views import (
+    TournamentListCreateView,
+    TournamentDetailView,
+    join_tournament,
+    start_tournament,
+    forfeit_match,
+)
+
+urlpatterns = [
+    # ---------- Tournament ----------
+    # GET /api/tournaments/ - 토너먼트 목록 조회
+    # POST /api/tournaments/ - 토너먼트 생성 (format: single / double)
+    path('', TournamentListCreateView.as_view(), name='tournament-list-create'),
+    # GET /api/tournaments/{id}/ - 토너먼트 상세 조회 (참가자, 대진표)
+    path('<int:id>/', TournamentDetailView.as_view(), name='tournament-detail'),
+    # POST /api/tournaments/{id}/join/ - 참가 신청
+    path('<int:tournament_id>/join/', join_tournament, name='tournament-join'),
+    # POST /api/tournaments/{id}/start/ - 토너먼트 시작 (주최자)
+    path('<int:tournament_id>/start/', start_tournament, name='tournament-start'),
+    # POST /api/tournaments/{id}/matches/{match_id}/forfeit/ - 기권패 처리 (주최자, {"loser": 선수 id})
+    path('<int:tournament_id>/matches/<int:match_id>/forfeit/', forfeit_match, name='tournament-match-forfeit'),
+]
@@ -0,0 +1,123 @@
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.response import Response
+from rest_framework.decorators import api_view, permission_classes
+from django.db.models import Count, Prefetch
+from django.shortcuts import get_object_or_404
+
+from .models import Tournament, TournamentEntrant, TournamentMatch
+from . import scheduler
+from .serializers import TournamentSerializer, TournamentDetailSerializer
+
+
+# ---------- Tournament Views ----------
+
+class TournamentListCreateView(generics.ListCreateAPIView):
+    """토너먼트 목록 조회 및 생성"""
+    serializer_class = TournamentSerializer
+
+    def get_permissions(self):
+        """GET은 인증 불필요, POST는 인증 필요"""
+        if self.request.method == 'GET':
+            return [AllowAny()]
+        return [IsAuthenticated()]
+
+    def get_queryset(self):
+        return Tournament.objects.select_related('host').annotate(
+            entrant_count=Count('entrants')
+        ).order_by('-created_at')
+
+    def perform_create(self, serializer):
+        serializer.save(host=self.request.user)
+
+
+class TournamentDetailView(generics.RetrieveAPIView):
+    """토너먼트 상세 조회 (참가자, 대진표)"""
+    permission_classes = [AllowAny]
+    serializer_class = TournamentDetailSerializer
+    lookup_field = 'id'
+
+    def get_queryset(self):
+        return Tournament.objects.select_related('host').annotate(
+            entrant_count=Count('entrants')
+        ).prefetch_related(
+            Prefetch(
+                'entrants',
+                queryset=TournamentEntrant.objects.select_related('user').order_by('seed', 'id')
+            ),
+            Prefetch(
+                'matches',
+                queryset=TournamentMatch.objects.order_by('bracket', 'round', 'position')
+            ),
+        )
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def join_tournament(request, tournament_id):
+    """토너먼트 참가 신청 (시작 전만 가능)"""
+    tournament = get_object_or_404(Tournament, id=tournament_id)
+    if tournament.status != 'registering':
+        return Response(
+            {'error': '참가 신청이 마감된 토너먼트입니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    _, created = TournamentEntrant.objects.get_or_create(tournament=tournament, user=request.user)
+    if not created:
+        return Response(
+            {'error': '이미 참가 신청한 토너먼트입니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(
+        {'success': True, 'message': '토너먼트에 참가 신청했습니다.'},
+        status=status.HTTP_201_CREATED
+    )
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def start_tournament(request, tournament_id):
+    """토너먼트 시작 (주최자만): 시드 부여, 대진표 생성, 첫 경기방 생성"""
+    tournament = get_object_or_404(Tournament, id=tournament_id)
+    if tournament.host_id != request.user.id:
+        return Response(
+            {'error': '주최자만 토너먼트를 시작할 수 있습니다.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    try:
+        scheduler.start_tournament(tournament.id)
+    except scheduler.TournamentError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    tournament = TournamentDetailView().get_queryset().get(id=tournament.id)
+    return Response(TournamentDetailSerializer(tournament).data, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def forfeit_match(request, tournament_id, match_id):
+    """
+    진행 중인 경기를 기권패로 종료 (주최자만)
+    요청: {"loser": 기권한 선수 id}
+    """
+    tournament = get_object_or_404(Tournament, id=tournament_id)
+    if tournament.host_id != request.user.id:
+        return Response(
+            {'error': '주최자만 기권 처리할 수 있습니다.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    try:
+        loser_id = int(request.data.get('loser'))
+    except (TypeError, ValueError):
+        return Response(
+            {'error': 'loser 는 선수 id 여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    try:
+        scheduler.forfeit_match(tournament.id, match_id, loser_id)
+    except scheduler.TournamentError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    tournament = TournamentDetailView().get_queryset().get(id=tournament.id)
+    return Response(TournamentDetailSerializer(tournament).data, status=status.HTTP_200_OK)
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, Profile, Title, TechStack, Club
+from config.admin import LargeTableAdminMixin
+from .models import User, Profile, Title, TechStack, Club, normalize_nickname
 
 
 class ProfileInline(admin.StackedInline):
@@ -9,12 +10,12 @@ class ProfileInline(admin.StackedInline):
     can_delete = False
     verbose_name_plural = '프로필'
     fields = ('student_id', 'nickname', 'rating', 'tier', 'activate_title', 'titles', 'tech_stacks', 'clubs')
-    filter_horizontal = ('titles', 'tech_stacks', 'clubs')
+    autocomplete_fields = ('activate_title', 'titles', 'tech_stacks', 'clubs')
 
 
 @admin.register(User)
-class UserAdmin(BaseUserAdmin):
-    """커스텀 User 모델을 위한 Admin 설정"""
+class UserAdmin(LargeTableAdminMixin, BaseUserAdmin):
+    """커스텀 User 모델을 위한 Admin 설정 (대결방/결과/프로필 사용자 자동완성에도 사용)"""
     # username 필드 제거, email을 기본 필드로 사용
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
@@ -30,17 +31,27 @@ class UserAdmin(BaseUserAdmin):
     list_display = ('email', 'is_staff', 'is_active', 'date_joined')
     list_filter = ('is_staff', 'is_superuser', 'is_active', 'date_joined')
     search_fields = ('email',)
+    search_user_fields = ('pk',)
+    search_text_fields = ()
+    search_help_text = '사용자 번호 또는 이메일 앞부분'
     ordering = ('email',)
     inlines = [ProfileInline]
 
 
 @admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     """프로필 Admin 설정"""
     list_display = ('user', 'nickname', 'student_id', 'rating', 'tier', 'activate_title')
-    list_filter = ('tier', 'activate_title', 'rating')
+    # rating 은 값 종류가 많아 필터 목록(SELECT DISTINCT)이 전체 스캔이 되므로 tier 로 대신함
+    list_filter = ('tier', 'activate_title')
+    list_select_related = ('user', 'activate_title')
     search_fields = ('user__email', 'nickname', 'student_id')
-    filter_horizontal = ('titles', 'tech_stacks', 'clubs')
+    search_id_fields = ('student_id', 'user_id')
+    search_user_fields = ('user',)
+    # nickname_key 유니크 인덱스로 접두사 검색 (대소문자 무시)
+    search_text_fields = ('nickname_key__startswith',)
+    search_help_text = '학번/사용자 번호, 이메일 앞부분 또는 닉네임 앞부분'
+    autocomplete_fields = ('user', 'activate_title', 'titles', 'tech_stacks', 'clubs')
     fieldsets = (
         ('기본 정보', {
             'fields': ('user', 'student_id', 'nickname', 'rating', 'tier')
@@ -53,6 +64,9 @@ class ProfileAdmin(admin.ModelAdmin):
         }),
     )
 
+    def normalize_search_text(self, term):
+        return normalize_nickname(term)
+
 
 @admin.register(Title)
 class TitleAdmin(admin.ModelAdmin):
@@ -0,0 +1,52 @@
+from django.core.cache import cache
+
+from .models import Profile
+from .serializers import ProfileCardSerializer
+
+
+# 프로필 카드 캐시 시간 (초)
+PROFILE_CARD_CACHE_TIMEOUT = 60
+
+
+def profile_card_cache_key(user_id):
+    return f'users:profile-card:{user_id}'
+
+
+def get_profile_cards(user_ids):
+    """
+    사용자 ID 목록에 대한 프로필 카드 반환 ({user_id: card})
+    - 캐시를 먼저 조회하고, 없는 사용자만 한 번의 id__in 쿼리로 조회
+    - 프로필이 없는 사용자는 결과에서 제외
+    """
+    keys = {profile_card_cache_key(user_id): user_id for user_id in user_ids}
+    cards = {
+        keys[key]: card
+        for key, card in cache.get_many(list(keys)).items()
+    }
+
+    missing = [user_id for user_id in user_ids if user_id not in cards]
+    if missing:
+        profiles = Profile.objects.select_related('activate_title').filter(
+            user_id__in=missing
+        ).only(
+            'id', 'user_id', 'nickname', 'rating', 'tier',
+            'activate_title__id', 'activate_title__name'
+        )
+        fetched = {
+            profile.user_id: ProfileCardSerializer(profile).data
+            for profile in profiles
+        }
+        cache.set_many(
+            {profile_card_cache_key(user_id): card for user_id, card in fetched.items()},
+            PROFILE_CARD_CACHE_TIMEOUT
+        )
+        cards.update(fetched)
+
+    return cards
+
+
+def invalidate_profile_cards(user_ids):
+    """캐시된 카드 삭제 (users/signals.py 에서 프로필/칭호 변경 시 호출)"""
+    keys = [profile_card_cache_key(user_id) for user_id in user_ids]
+    if keys:
+        cache.delete_many(keys)
@@ -0,0 +1,246 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from users.models import User, Profile, normalize_nickname
+
+
+# __in 조회 시 한 번에 넘길 최대 값 개수 (SQLite 변수 개수 제한 대비)
+LOOKUP_CHUNK_SIZE = 900
+
+
+def _init_worker():
+    """spawn 방식 프로세스에서도 settings를 사용할 수 있도록 Django 초기화"""
+    django.setup()
+
+
+def _hash_password(raw_password):
+    return make_password(raw_password)
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class Command(BaseCommand):
+    """
+    학생 계정 일괄 생성
+    python manage.py bulk_create_users students.csv
+    python manage.py bulk_create_users students.jsonl --batch-size 1000 --workers 8
+
+    - 입력 컬럼: email, password, nickname, (선택) student_id
+    - 기존 이메일/닉네임은 한 번에 조회하여 중복 행은 건너뜀
+    - 비밀번호 해시는 프로세스 풀에서 병렬 계산
+    - User/Profile은 bulk_create로 batch 단위 저장
+    """
+    help = 'CSV 또는 JSONL 파일로 학생 계정을 일괄 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV 또는 JSONL 파일 경로')
+        parser.add_argument(
+            '--format', choices=['csv', 'jsonl'],
+            help='입력 형식 (기본값: 파일 확장자로 판단)'
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='bulk_create batch 크기 (기본값: 500)'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='비밀번호 해시 프로세스 수 (기본값: CPU 코어 수)'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='검증만 수행하고 저장하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'파일을 찾을 수 없습니다: {path}')
+
+        file_format = options['format'] or ('jsonl' if path.suffix in ('.jsonl', '.json') else 'csv')
+        rows = self.read_rows(path, file_format)
+        accounts, errors = self.validate_rows(rows)
+
+        for line, message in errors:
+            self.stderr.write(f'{line}행 건너뜀: {message}')
+
+        if not accounts:
+            self.stdout.write('생성할 계정이 없습니다.')
+            return
+        if options['dry_run']:
+            self.stdout.write(f'검증 완료: {len(accounts)}개 생성 가능, {len(errors)}개 건너뜀 (dry-run)')
+            return
+
+        passwords = [account['password'] for account in accounts]
+        workers = max(1, options['workers'])
+        if workers == 1:
+            hashed = [_hash_password(password) for password in passwords]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                chunksize = max(1, len(passwords) // (workers * 4))
+                hashed = list(executor.map(_hash_password, passwords, chunksize=chunksize))
+
+        created = self.create_accounts(accounts, hashed, options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'{created}개 계정 생성 완료, {len(errors)}개 건너뜀'
+        ))
+
+    def read_rows(self, path, file_format):
+        """(행 번호, dict) 목록 반환"""
+        with path.open(encoding='utf-8-sig', newline='') as f:
+            if file_format == 'csv':
+                # 헤더가 1행이므로 데이터는 2행부터
+                return [(line, row) for line, row in enumerate(csv.DictReader(f), start=2)]
+
+            rows = []
+            for line, text in enumerate(f, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    rows.append((line, json.loads(text)))
+                except json.JSONDecodeError as e:
+                    raise CommandError(f'{line}행 JSON 형식 오류: {e}')
+            return rows
+
+    def validate_rows(self, rows):
+        """
+        필수값/이메일 도메인/닉네임 길이/비밀번호 정책(AUTH_PASSWORD_VALIDATORS)/중복 검사
+        - 파일 내부 중복과 DB 중복을 모두 걸러냄
+        - DB 중복은 이메일/닉네임 각각 batch 조회로 확인
+        """
+        errors = []
+        candidates = []
+        seen_emails = set()
+        seen_nicknames = set()
+        nickname_max_length = Profile._meta.get_field('nickname').max_length
+
+        for line, row in rows:
+            if not isinstance(row, dict):
+                errors.append((line, 'JSON 객체가 아닙니다.'))
+                continue
+            # JSON 은 숫자/불리언도 들어올 수 있으므로 문자열만 허용 (빈 값은 아래에서 필수값 오류)
+            invalid = [
+                field for field in ('email', 'password', 'nickname')
+                if row.get(field) is not None and not isinstance(row[field], str)
+            ]
+            if invalid:
+                errors.append((line, f"{', '.join(invalid)}은(는) 문자열이어야 합니다."))
+                continue
+            email = User.objects.normalize_email((row.get('email') or '').strip())
+            password = row.get('password') or ''
+            nickname = (row.get('nickname') or '').strip()
+            # 0 도 학번으로 취급 (빈 값만 None)
+            student_id = row.get('student_id')
+            if student_id in (None, ''):
+                student_id = None
+
+            if not email or not password or not nickname:
+                errors.append((line, 'email, password, nickname은 필수입니다.'))
+                continue
+            if not email.endswith('@korea.ac.kr'):
+                errors.append((line, f'고려대학교 이메일이 아닙니다: {email}'))
+                continue
+            if student_id is not None:
+                try:
+                    student_id = int(student_id)
+                except (TypeError, ValueError):
+                    errors.append((line, f'학번은 숫자여야 합니다: {student_id}'))
+                    continue
+            if len(nickname) > nickname_max_length:
+                errors.append((line, f'닉네임은 {nickname_max_length}자 이하여야 합니다: {nickname}'))
+                continue
+            try:
+                validate_password(password, user=User(email=email))
+            except ValidationError as e:
+                errors.append((line, f"비밀번호 정책 위반: {' '.join(e.messages)}"))
+                continue
+
+            nickname_key = normalize_nickname(nickname)
+            if email in seen_emails:
+                errors.append((line, f'파일 내 중복 이메일: {email}'))
+                continue
+            if nickname_key in seen_nicknames:
+                errors.append((line, f'파일 내 중복 닉네임: {nickname}'))
+                continue
+            seen_emails.add(email)
+            seen_nicknames.add(nickname_key)
+
+            candidates.append({
+                'line': line,
+                'email': email,
+                'password': password,
+                'nickname': nickname,
+                'nickname_key': nickname_key,
+                'student_id': student_id,
+            })
+
+        existing_emails = set()
+        for chunk in _chunks(list(seen_emails), LOOKUP_CHUNK_SIZE):
+            existing_emails.update(
+                User.objects.filter(email__in=chunk).values_list('email', flat=True)
+            )
+        existing_nicknames = set()
+        for chunk in _chunks(list(seen_nicknames), LOOKUP_CHUNK_SIZE):
+            existing_nicknames.update(
+                Profile.objects.filter(nickname_key__in=chunk).values_list('nickname_key', flat=True)
+            )
+
+        accounts = []
+        for account in candidates:
+            if account['email'] in existing_emails:
+                errors.append((account['line'], f"이미 가입된 이메일: {account['email']}"))
+            elif account['nickname_key'] in existing_nicknames:
+                errors.append((account['line'], f"이미 사용 중인 닉네임: {account['nickname']}"))
+            else:
+                accounts.append(account)
+
+        errors.sort()
+        return accounts, errors
+
+    def create_accounts(self, accounts, hashed_passwords, batch_size):
+        """User와 Profile을 batch 단위로 bulk_create"""
+        created = 0
+        pairs = list(zip(accounts, hashed_passwords))
+
+        with transaction.atomic():
+            for chunk in _chunks(pairs, batch_size):
+                users = User.objects.bulk_create([
+                    User(email=account['email'], password=hashed)
+                    for account, hashed in chunk
+                ])
+
+                # bulk_create가 pk를 돌려주지 않는 DB에서는 다시 조회
+                if any(user.pk is None for user in users):
+                    ids = dict(
+                        User.objects.filter(email__in=[user.email for user in users])
+                        .values_list('email', 'id')
+                    )
+                    for user in users:
+                        user.pk = ids[user.email]
+
+                # bulk_create는 save()를 거치지 않으므로 nickname_key를 직접 설정
+                Profile.objects.bulk_create([
+                    Profile(
+                        user=user,
+                        nickname=account['nickname'],
+                        nickname_key=account['nickname_key'],
+                        student_id=account['student_id'],
+                    )
+                    for user, (account, _) in zip(users, chunk)
+                ])
+                created += len(users)
+                self.stdout.write(f'{created}/{len(pairs)} 생성')
+
+        return created
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:48
+
+from django.db import migrations, models
+
+
+def fill_nickname_key(apps, schema_editor):
+    """
+    기존 프로필의 nickname_key 채우기
+    대소문자/공백만 다른 기존 중복은 먼저 가입한 프로필만 그대로 두고,
+    나머지는 닉네임 뒤에 _{프로필 id} 를 붙여 유니크 인덱스 생성이 실패하지 않게 함
+    """
+    Profile = apps.get_model('users', 'Profile')
+    max_length = Profile._meta.get_field('nickname').max_length
+    profiles = list(Profile.objects.exclude(nickname=None).only('id', 'nickname').order_by('id'))
+    used = set()
+    for profile in profiles:
+        key = profile.nickname.strip().casefold() or None
+        number = 0
+        while key in used:
+            number += 1
+            suffix = f'_{profile.id}' if number == 1 else f'_{profile.id}_{number}'
+            profile.nickname = profile.nickname.strip()[:max_length - len(suffix)] + suffix
+            key = profile.nickname.casefold()
+        if key:
+            used.add(key)
+        profile.nickname_key = key
+    Profile.objects.bulk_update(profiles, ['nickname', 'nickname_key'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_remove_profile_friends_delete_friendship'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='nickname_key',
+            field=models.CharField(blank=True, editable=False, max_length=50, null=True),
+        ),
+        migrations.RunPython(fill_nickname_key, migrations.RunPython.noop),
+        # 값을 채운 뒤 유니크 인덱스 생성 (중복은 fill_nickname_key 에서 정리됨)
+        migrations.AlterField(
+            model_name='profile',
+            name='nickname_key',
+            field=models.CharField(blank=True, editable=False, max_length=50, null=True, unique=True),
+        ),
+    ]
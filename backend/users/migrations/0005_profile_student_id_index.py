@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_profile_nickname_key'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='student_id',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -2,6 +2,13 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 
 
+def normalize_nickname(value):
+    """닉네임 비교용 정규화 (앞뒤 공백 제거 + 대소문자 무시)"""
+    if value is None:
+        return None
+    return value.strip().casefold()
+
+
 class CustomUserManager(BaseUserManager):
     """
     [새로 추가] 커스텀 유저 매니저
@@ -102,8 +109,17 @@ class Profile(models.Model):
         related_name='profile'
     )
     # [수정됨] student_id를 User에서 Profile로 이동
-    student_id = models.IntegerField(null=True, blank=True)
+    # admin 학번 검색용 인덱스
+    student_id = models.IntegerField(null=True, blank=True, db_index=True)
     nickname = models.CharField(max_length=50, null=True, blank=True)
+    # 대소문자 무시 중복 검사 및 접두사 검색용 정규화 닉네임 (save 시 자동 설정)
+    nickname_key = models.CharField(
+        max_length=50,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False
+    )
     rating = models.IntegerField(default=0)
     tier = models.CharField(max_length=50, null=True, blank=True)
     
@@ -137,6 +153,14 @@ class Profile(models.Model):
     class Meta:
         db_table = '프로필'
     
+    def save(self, *args, **kwargs):
+        """nickname_key를 nickname과 항상 동기화"""
+        self.nickname_key = normalize_nickname(self.nickname) or None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'nickname' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'nickname_key'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         # User 모델의 __str__이 email을 반환하므로 self.user.email과 동일
         return f"{self.user}의 프로필"
\ No newline at end of file
@@ -1,5 +1,6 @@
+from django.db import transaction
 from rest_framework import serializers
-from .models import User, Profile, Title, TechStack, Club
+from .models import User, Profile, Title, TechStack, Club, normalize_nickname
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 class UserCreateSerializer(serializers.ModelSerializer):
@@ -65,8 +66,8 @@ class UserCreateSerializer(serializers.ModelSerializer):
         # 공백 제거된 닉네임
         value = value.strip()
         
-        # 닉네임 중복 검사
-        if Profile.objects.filter(nickname=value).exists():
+        # 닉네임 중복 검사 (대소문자 무시, nickname_key 유니크 인덱스 조회)
+        if Profile.objects.filter(nickname_key=normalize_nickname(value)).exists():
             raise serializers.ValidationError("이미 사용 중인 닉네임입니다.")
         
         return value
@@ -155,60 +156,156 @@ class ProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'rating')
 
 
+class BulkPrimaryKeyRelatedField(serializers.ManyRelatedField):
+    """
+    ID 리스트를 한 번의 `pk__in` 쿼리로 검증하는 M2M 필드
+    - 기본 PrimaryKeyRelatedField(many=True)는 ID마다 쿼리를 실행함
+    """
+
+    def __init__(self, queryset, **kwargs):
+        child_relation = serializers.PrimaryKeyRelatedField(queryset=queryset)
+        super().__init__(child_relation=child_relation, **kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        ids = []
+        for item in data:
+            if isinstance(item, bool):
+                self.child_relation.fail('incorrect_type', data_type=type(item).__name__)
+            try:
+                ids.append(int(item))
+            except (TypeError, ValueError):
+                self.child_relation.fail('incorrect_type', data_type=type(item).__name__)
+
+        # 한 번의 쿼리로 모든 ID 조회
+        objects = self.child_relation.get_queryset().in_bulk(ids)
+        for pk in ids:
+            if pk not in objects:
+                self.child_relation.fail('does_not_exist', pk_value=pk)
+        # 중복 ID 제거 (입력 순서 유지)
+        return [objects[pk] for pk in dict.fromkeys(ids)]
+
+
+class ProfileCardSerializer(serializers.ModelSerializer):
+    """프로필 카드 Serializer (로비/대결 화면 일괄 조회용)"""
+    user_id = serializers.IntegerField(read_only=True)
+    activate_title = TitleSerializer(read_only=True)
+
+    class Meta:
+        model = Profile
+        fields = ('id', 'user_id', 'nickname', 'rating', 'tier', 'activate_title')
+
+
+class ProfileSearchSerializer(serializers.ModelSerializer):
+    """닉네임 자동완성 결과 Serializer"""
+    class Meta:
+        model = Profile
+        fields = ('id', 'nickname', 'rating', 'tier')
+
+
 class ProfileUpdateSerializer(serializers.ModelSerializer):
     """프로필 수정용 Serializer"""
     # M2M 필드는 ID 리스트로 받음
-    title_ids = serializers.PrimaryKeyRelatedField(
-        many=True,
+    title_ids = BulkPrimaryKeyRelatedField(
         queryset=Title.objects.all(),
         source='titles',
         required=False,
         allow_null=True
     )
-    tech_stack_ids = serializers.PrimaryKeyRelatedField(
-        many=True,
+    tech_stack_ids = BulkPrimaryKeyRelatedField(
         queryset=TechStack.objects.all(),
         source='tech_stacks',
         required=False,
         allow_null=True
     )
-    club_ids = serializers.PrimaryKeyRelatedField(
-        many=True,
+    club_ids = BulkPrimaryKeyRelatedField(
         queryset=Club.objects.all(),
         source='clubs',
         required=False,
         allow_null=True
     )
-    
+
     class Meta:
         model = Profile
         fields = (
             'student_id', 'nickname', 'tier', 'activate_title',
             'title_ids', 'tech_stack_ids', 'club_ids'
         )
-    
+
+    def validate_nickname(self, value):
+        """닉네임 중복 검사 (자기 자신 제외, 대소문자 무시)"""
+        if not normalize_nickname(value):
+            return value
+        duplicates = Profile.objects.filter(nickname_key=normalize_nickname(value))
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError("이미 사용 중인 닉네임입니다.")
+        return value
+
     def update(self, instance, validated_data):
         # M2M 필드 분리
-        titles = validated_data.pop('titles', None)
-        tech_stacks = validated_data.pop('tech_stacks', None)
-        clubs = validated_data.pop('clubs', None)
-        
-        # activate_title이 빈 값으로 오면 None으로 설정
-        if 'activate_title' in validated_data and validated_data['activate_title'] is None:
-            instance.activate_title = None
-        
-        # 나머지 필드 업데이트
+        m2m_data = {
+            name: validated_data.pop(name, None)
+            for name in ('titles', 'tech_stacks', 'clubs')
+        }
+
+        # 값이 실제로 바뀐 필드만 저장 (FK는 *_id 값으로 비교)
+        update_fields = []
         for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        
-        instance.save()
-        
-        # M2M 필드 업데이트 (값이 제공된 경우에만)
-        if titles is not None:
-            instance.titles.set(titles)
-        if tech_stacks is not None:
-            instance.tech_stacks.set(tech_stacks)
-        if clubs is not None:
-            instance.clubs.set(clubs)
-        
-        return instance
\ No newline at end of file
+            field = instance._meta.get_field(attr)
+            new_value = value.pk if field.is_relation and value is not None else value
+            if getattr(instance, field.attname) != new_value:
+                setattr(instance, attr, value)
+                update_fields.append(attr)
+
+        with transaction.atomic():
+            if update_fields:
+                instance.save(update_fields=update_fields)
+
+            # M2M 필드 업데이트 (값이 제공된 경우에만)
+            for name, objs in m2m_data.items():
+                if objs is not None:
+                    self._sync_m2m(instance, name, objs)
+
+        return instance
+
+    def _sync_m2m(self, instance, name, objs):
+        """
+        M2M 관계를 현재 ID와 비교하여 차이만 반영
+        - 관계당 bulk DELETE 1회, bulk INSERT 1회
+        - prefetch 된 경우 현재 ID 조회 쿼리도 생략
+        """
+        field = instance._meta.get_field(name)
+        through = field.remote_field.through
+        source = field.m2m_field_name()
+        target = field.m2m_reverse_field_name()
+
+        prefetched = getattr(instance, '_prefetched_objects_cache', {})
+        if name in prefetched:
+            current_ids = {obj.pk for obj in prefetched[name]}
+        else:
+            current_ids = set(
+                through.objects.filter(**{source: instance.pk})
+                .values_list(f'{target}_id', flat=True)
+            )
+
+        new_ids = {obj.pk for obj in objs}
+        removed = current_ids - new_ids
+        added = new_ids - current_ids
+
+        if removed:
+            through.objects.filter(
+                **{source: instance.pk, f'{target}__in': removed}
+            ).delete()
+        if added:
+            through.objects.bulk_create([
+                through(**{f'{source}_id': instance.pk, f'{target}_id': pk})
+                for pk in added
+            ])
+        # 변경된 관계는 prefetch 캐시에서 제거
+        prefetched.pop(name, None)
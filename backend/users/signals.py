@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .cache import invalidate_profile_cards
+from .models import Profile, Title
+
+
+# 프로필 카드 캐시 무효화
+# (프로필 수정 뷰뿐 아니라 관리자 페이지 수정, 사용자 삭제에 따른 CASCADE 삭제도 포함)
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def on_profile_changed(sender, instance, **kwargs):
+    invalidate_profile_cards([instance.user_id])
+
+
+# 카드에 활성 칭호 이름이 들어가므로 칭호 수정/삭제 시 그 칭호를 단 프로필의 카드도 무효화
+# (삭제는 SET_NULL 로 연결이 끊기기 전에 조회)
+
+@receiver(post_save, sender=Title)
+@receiver(pre_delete, sender=Title)
+def on_title_changed(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    invalidate_profile_cards(
+        Profile.objects.filter(activate_title=instance).values_list('user_id', flat=True)
+    )
@@ -1,3 +1,347 @@
-from django.test import TestCase
+import hashlib
+import importlib
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from config.testing import QueryBudgetMixin, QuietRequestLogMixin
+from . import views
+from .models import User, Profile, Title, TechStack, Club
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class UserQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """사용자/프로필 API 쿼리 수/응답 크기 회귀 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(email='me@korea.ac.kr', password='pw')
+        self.profile = Profile.objects.create(user=self.user, nickname='me')
+
+    def seed_users(self, rows):
+        """닉네임이 nick 으로 시작하는 사용자/프로필을 rows명까지 생성"""
+        start = Profile.objects.filter(nickname__startswith='nick').count()
+        users = User.objects.bulk_create([
+            User(email=f'user{i}@korea.ac.kr') for i in range(start, rows)
+        ])
+        Profile.objects.bulk_create([
+            Profile(user=user, nickname=f'nick{i}', nickname_key=f'nick{i}')
+            for i, user in enumerate(users, start=start)
+        ])
+
+    def seed_reference(self, rows):
+        for model in (Title, TechStack, Club):
+            model.objects.bulk_create([
+                model(name=f'{model.__name__}-{i}')
+                for i in range(model.objects.count(), rows)
+            ])
+
+    def seed_profile_relations(self, rows):
+        """내 프로필에 칭호/기술스택/동아리를 rows개씩 연결"""
+        self.seed_reference(rows)
+        self.profile.activate_title = Title.objects.first()
+        self.profile.save()
+        self.profile.titles.set(Title.objects.all())
+        self.profile.tech_stacks.set(TechStack.objects.all())
+        self.profile.clubs.set(Club.objects.all())
+
+    # ---------- User Auth ----------
+
+    def test_signup(self):
+        def seed(rows):
+            self.seed_users(rows)
+            return {'data': {
+                'email': f'new{rows}@korea.ac.kr',
+                'password': 'pw12345!',
+                'nickname': f'new{rows}',
+            }}
+
+        self.assertQueryBudget(
+            'post', '/api/users/signup/', seed=seed,
+            max_queries=4, max_bytes=100, expected_status=201,
+        )
+
+    def test_login(self):
+        self.assertQueryBudget(
+            'post', '/api/users/login/', seed=self.seed_users,
+            data={'email': 'me@korea.ac.kr', 'password': 'pw'},
+            max_queries=2, max_bytes=800,
+        )
+
+    def test_search(self):
+        self.assertQueryBudget(
+            'get', '/api/users/search/?prefix=nick', seed=self.seed_users,
+            user=self.user, max_queries=2, max_bytes=1000,
+        )
+
+    @override_settings(CACHE_SHARED=True)
+    def test_search_cache_key(self):
+        self.seed_users(3)
+        client = self.client_for(self.user)
+        # 닉네임보다 긴 접두사는 프로필 조회 없이 빈 목록 (사용자 인증 조회만)
+        with self.assertNumQueries(1):
+            response = client.get('/api/users/search/', {'prefix': '가' * 51})
+        self.assertEqual(response.json(), [])
+        # 캐시 키는 접두사의 해시 (길이 고정)
+        prefix = '닉' * 50
+        with mock.patch.object(views, 'cached_query', wraps=views.cached_query) as cached_query:
+            client.get('/api/users/search/', {'prefix': prefix})
+        self.assertEqual(cached_query.call_args.args[1], f'{views.SEARCH_DEFAULT_LIMIT}:{hashlib.sha1(prefix.encode()).hexdigest()}')
+        self.assertEqual(len(client.get('/api/users/search/', {'prefix': 'NICK'}).json()), 3)
+
+    # ---------- Profile ----------
+
+    def test_my_profile(self):
+        self.assertQueryBudget(
+            'get', '/api/profile/', seed=self.seed_profile_relations,
+            user=self.user, max_queries=7, max_bytes=lambda rows: 300 + 100 * rows,
+        )
+
+    def test_update_profile(self):
+        def seed(rows):
+            self.seed_reference(rows)
+            return {'data': {
+                'nickname': f'me{rows}',
+                'title_ids': list(Title.objects.values_list('id', flat=True)),
+                'tech_stack_ids': list(TechStack.objects.values_list('id', flat=True)),
+                'club_ids': list(Club.objects.values_list('id', flat=True)),
+            }}
+
+        self.assertQueryBudget(
+            'patch', '/api/profile/', seed=seed,
+            user=self.user, max_queries=18, max_bytes=lambda rows: 200 + 20 * rows,
+        )
+
+    def test_profile_detail(self):
+        self.assertQueryBudget(
+            'get', f'/api/profile/{self.profile.id}/', seed=self.seed_profile_relations,
+            user=self.user, max_queries=7, max_bytes=lambda rows: 300 + 100 * rows,
+        )
+
+    def test_profile_batch(self):
+        def seed(rows):
+            self.seed_users(rows)
+            ids = Profile.objects.values_list('user_id', flat=True)[:min(rows, 50)]
+            return {'url': '/api/profile/batch/?ids=' + ','.join(map(str, ids))}
+
+        self.assertQueryBudget(
+            'get', None, seed=seed,
+            user=self.user, max_queries=2, max_bytes=lambda rows: 10 + 120 * min(rows, 50),
+        )
+
+    # ---------- Reference Data ----------
+
+    def test_title_list(self):
+        self.assertQueryBudget(
+            'get', '/api/titles/', seed=self.seed_reference,
+            max_queries=1, max_bytes=lambda rows: 10 + 40 * rows,
+        )
+
+    def test_tech_stack_list(self):
+        self.assertQueryBudget(
+            'get', '/api/tech-stacks/', seed=self.seed_reference,
+            max_queries=1, max_bytes=lambda rows: 10 + 40 * rows,
+        )
+
+    def test_club_list(self):
+        self.assertQueryBudget(
+            'get', '/api/clubs/', seed=self.seed_reference,
+            max_queries=1, max_bytes=lambda rows: 10 + 40 * rows,
+        )
+
+    def test_reference_fast_path(self):
+        self.seed_reference(10)
+        for view_class, path in (
+            (views.TitleListView, '/api/titles/'),
+            (views.TechStackListView, '/api/tech-stacks/'),
+            (views.ClubListView, '/api/clubs/'),
+        ):
+            with self.subTest(path=path):
+                self.assertFastPathParity(view_class, path)
+
+
+class ProfileCardCacheTests(QueryBudgetMixin, TestCase):
+    """프로필 카드 캐시는 뷰 밖에서 바뀌어도 무효화됨 (users/signals.py)"""
+
+    def setUp(self):
+        super().setUp()
+        self.title = Title.objects.create(name='새내기')
+        self.user = User.objects.create_user(email='kim@korea.ac.kr', password='pw')
+        self.profile = Profile.objects.create(user=self.user, nickname='Tiger', activate_title=self.title)
+        self.client = self.client_for(self.user)
+
+    def card(self):
+        response = self.client.get(f'/api/profile/batch/?ids={self.user.id}')
+        return response.data[0] if response.data else None
+
+    def test_out_of_range_ids(self):
+        for ids in ('0', '-1', str(2 ** 63), f'{self.user.id},99999999999999999999'):
+            response = self.client.get(f'/api/profile/batch/?ids={ids}')
+            self.assertEqual(response.status_code, 400, ids)
+        self.assertEqual(self.client.get(f'/api/profile/batch/?ids={2 ** 63 - 1}').data, [])
+
+    def test_invalidated_on_model_writes(self):
+        self.assertEqual(self.card()['nickname'], 'Tiger')
+        # 캐시 적중: JWT 인증 사용자 조회만
+        with self.assertNumQueries(1):
+            self.card()
+
+        self.profile.nickname = 'Lion'
+        self.profile.save()
+        self.assertEqual(self.card()['nickname'], 'Lion')
+
+        self.title.name = '고인물'
+        self.title.save()
+        self.assertEqual(self.card()['activate_title']['name'], '고인물')
+
+        self.title.delete()
+        self.assertIsNone(self.card()['activate_title'])
+
+        self.profile.delete()
+        self.assertIsNone(self.card())
+
+
+class NicknameKeyMigrationTests(TestCase):
+    """0004 마이그레이션의 nickname_key 채우기 (대소문자만 다른 기존 닉네임 정리)"""
+
+    def test_case_only_duplicates_renamed(self):
+        # bulk_create 는 save() 를 거치지 않으므로 nickname_key 가 비어 있는 기존 데이터와 같음
+        users = User.objects.bulk_create([User(email=f'dup{i}@korea.ac.kr') for i in range(5)])
+        profiles = Profile.objects.bulk_create([
+            Profile(user=user, nickname=nickname)
+            for user, nickname in zip(users, ('Tiger', 'tiger ', 'Lion', 't' * 50, 'T' * 50))
+        ])
+        migration = importlib.import_module('users.migrations.0004_profile_nickname_key')
+        migration.fill_nickname_key(apps, None)
+
+        # 먼저 가입한 프로필은 그대로, 나머지는 _{id} 를 붙여 50자 안으로
+        renamed = f'tiger_{profiles[1].id}'
+        suffix = f'_{profiles[4].id}'
+        self.assertEqual(
+            list(Profile.objects.order_by('id').values_list('nickname', 'nickname_key')),
+            [('Tiger', 'tiger'), (renamed, renamed), ('Lion', 'lion'), ('t' * 50, 't' * 50),
+             ('T' * (50 - len(suffix)) + suffix, 't' * (50 - len(suffix)) + suffix)]
+        )
+
+
+class ProfileAdminTests(QuietRequestLogMixin, TestCase):
+    """프로필 admin 인덱스 검색"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(email='admin@korea.ac.kr', password='pw')
+        cls.user = User.objects.create_user(email='kim@korea.ac.kr', password='pw')
+        cls.profile = Profile.objects.create(user=cls.user, nickname='Tiger', student_id=2021123456)
+        other = User.objects.create_user(email='lee@korea.ac.kr', password='pw')
+        Profile.objects.create(user=other, nickname='Lion', student_id=2022000001)
+
+    def search(self, term):
+        self.client.force_login(self.admin)
+        response = self.client.get('/admin/users/profile/', {'q': term})
+        self.assertEqual(response.status_code, 200)
+        return list(response.context['cl'].result_list)
+
+    def test_search(self):
+        for term in ('tig', 'TIGER', '2021123456', 'kim@', str(self.user.id)):
+            self.assertEqual(self.search(term), [self.profile], term)
+        self.assertEqual(self.search('ger'), [])
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class BulkCreateUsersTests(TestCase):
+    """학생 계정 일괄 생성 (bulk_create_users)"""
+
+    def run_import(self, rows, suffix='.jsonl'):
+        """rows 를 파일로 써서 실행, (stdout, stderr) 반환"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / f'students{suffix}'
+            path.write_text('\n'.join(
+                row if isinstance(row, str) else json.dumps(row, ensure_ascii=False) for row in rows
+            ), encoding='utf-8')
+            out, err = StringIO(), StringIO()
+            call_command('bulk_create_users', str(path), workers=1, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def account(self, index, **fields):
+        return {
+            'email': f'student{index}@korea.ac.kr', 'password': 'correct-horse-42',
+            'nickname': f'학생{index}', **fields,
+        }
+
+    def test_import(self):
+        User.objects.create_user(email='student1@korea.ac.kr', password='pw')
+        out, err = self.run_import([
+            self.account(0, student_id=2024000000),
+            self.account(1),
+            self.account(2, nickname='학생0'),
+        ])
+        self.assertIn('1개 계정 생성 완료, 2개 건너뜀', out)
+        self.assertIn('이미 가입된 이메일', err)
+        self.assertIn('파일 내 중복 닉네임', err)
+        profile = Profile.objects.get(user__email='student0@korea.ac.kr')
+        self.assertEqual((profile.nickname_key, profile.student_id), ('학생0', 2024000000))
+        self.assertTrue(profile.user.check_password('correct-horse-42'))
+
+    def test_csv(self):
+        out, _ = self.run_import([
+            'email,password,nickname,student_id',
+            'csv0@korea.ac.kr,correct-horse-42,씨에스브이,',
+        ], suffix='.csv')
+        self.assertIn('1개 계정 생성 완료', out)
+        self.assertIsNone(Profile.objects.get(nickname='씨에스브이').student_id)
+
+    def test_non_object_line(self):
+        _, err = self.run_import(['["student@korea.ac.kr"]', '42', self.account(0)])
+        self.assertIn('1행 건너뜀: JSON 객체가 아닙니다.', err)
+        self.assertIn('2행 건너뜀: JSON 객체가 아닙니다.', err)
+        self.assertTrue(User.objects.filter(email='student0@korea.ac.kr').exists())
+
+    def test_student_id_zero(self):
+        self.run_import([self.account(0, student_id=0)])
+        self.assertEqual(Profile.objects.get(nickname='학생0').student_id, 0)
+
+    def test_invalid_student_id(self):
+        _, err = self.run_import([self.account(0, student_id='20a4')])
+        self.assertIn('학번은 숫자여야 합니다', err)
+        self.assertFalse(User.objects.exists())
+
+    def test_long_nickname(self):
+        _, err = self.run_import([self.account(0, nickname='가' * 51), self.account(1, nickname='나' * 50)])
+        self.assertIn('닉네임은 50자 이하여야 합니다', err)
+        self.assertEqual(list(User.objects.values_list('email', flat=True)), ['student1@korea.ac.kr'])
+
+    def test_non_string_fields(self):
+        _, err = self.run_import([
+            self.account(0, nickname=2024),
+            self.account(1, password=0),
+            self.account(2, email=True),
+            self.account(3),
+        ])
+        self.assertIn('1행 건너뜀: nickname은(는) 문자열이어야 합니다.', err)
+        self.assertIn('2행 건너뜀: password은(는) 문자열이어야 합니다.', err)
+        self.assertIn('3행 건너뜀: email은(는) 문자열이어야 합니다.', err)
+        self.assertEqual(list(User.objects.values_list('email', flat=True)), ['student3@korea.ac.kr'])
+
+    def test_password_validators(self):
+        _, err = self.run_import([
+            self.account(0, password='1234'),
+            self.account(1, password='password'),
+            self.account(2, password='student2@korea.ac.kr'),
+        ])
+        self.assertEqual(err.count('비밀번호 정책 위반'), 3)
+        self.assertFalse(User.objects.exists())
+
+    def test_required_fields_and_domain(self):
+        _, err = self.run_import([
+            {'email': 'student0@korea.ac.kr', 'password': 'correct-horse-42'},
+            self.account(1, email='student1@gmail.com'),
+        ])
+        self.assertIn('email, password, nickname은 필수입니다.', err)
+        self.assertIn('고려대학교 이메일이 아닙니다', err)
+        self.assertFalse(User.objects.exists())
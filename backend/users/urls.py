@@ -1,7 +1,7 @@
 from django.urls import path
 from .views import (
     UserCreateView, MyTokenObtainPairView,
-    ProfileRetrieveUpdateView, ProfileDetailView,
+    ProfileRetrieveUpdateView, ProfileDetailView, ProfileBatchView, ProfileSearchView,
     TitleListView, TechStackListView, ClubListView
 )
 
@@ -11,6 +11,8 @@ urlpatterns = [
     path('users/signup/', UserCreateView.as_view(), name='user-signup'),
     # POST /api/users/login/ (JWT 토큰 발급)
     path('users/login/', MyTokenObtainPairView.as_view(), name='token_obtain_pair'),
+    # GET /api/users/search/?prefix={prefix} - 닉네임 자동완성
+    path('users/search/', ProfileSearchView.as_view(), name='user-search'),
     
     # ---------- Profile ----------
     # GET /api/profile/ - 내 프로필 조회
@@ -18,6 +20,8 @@ urlpatterns = [
     path('profile/', ProfileRetrieveUpdateView.as_view(), name='profile-retrieve-update'),
     # GET /api/profile/{id}/ - 특정 사용자 프로필 조회
     path('profile/<int:id>/', ProfileDetailView.as_view(), name='profile-detail'),
+    # GET /api/profile/batch/?ids=1,2,3 - 여러 사용자 프로필 카드 일괄 조회
+    path('profile/batch/', ProfileBatchView.as_view(), name='profile-batch'),
     
     # ---------- Reference Data ----------
     # GET /api/titles/ - 칭호 목록
@@ -1,12 +1,18 @@
-from rest_framework import generics
+import hashlib
+
+from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.response import Response
 
 from .serializers import (
     UserCreateSerializer, MyTokenObtainPairSerializer,
-    ProfileSerializer, ProfileUpdateSerializer,
+    ProfileSerializer, ProfileUpdateSerializer, ProfileSearchSerializer,
     TitleSerializer, TechStackSerializer, ClubSerializer
 )
-from .models import User, Profile, Title, TechStack, Club
+from .models import User, Profile, Title, TechStack, Club, normalize_nickname
+from .cache import get_profile_cards
+from config.caching import cached_query
+from config.fastpath import FastListMixin
 from rest_framework_simplejwt.views import TokenObtainPairView
 
 class UserCreateView(generics.CreateAPIView):
@@ -40,7 +46,11 @@ class ProfileRetrieveUpdateView(generics.RetrieveUpdateAPIView):
     
     def get_object(self):
         """현재 로그인한 사용자의 프로필 반환"""
-        profile, created = Profile.objects.get_or_create(user=self.request.user)
+        queryset = Profile.objects.all()
+        if self.request.method in ('PATCH', 'PUT'):
+            # 수정 시 M2M 차이 계산을 위해 현재 관계를 미리 조회
+            queryset = queryset.prefetch_related('titles', 'tech_stacks', 'clubs')
+        profile, created = queryset.get_or_create(user=self.request.user)
         return profile
     
     def get_serializer_class(self):
@@ -61,24 +71,115 @@ class ProfileDetailView(generics.RetrieveAPIView):
     lookup_field = 'id'
 
 
+# 프로필 일괄 조회 시 최대 사용자 수
+PROFILE_BATCH_MAX_IDS = 50
+# 사용자 ID 범위 (BigAutoField, 범위 밖 값은 DB 에서 오버플로 오류)
+USER_ID_MAX = 2 ** 63 - 1
+
+
+class ProfileBatchView(generics.GenericAPIView):
+    """
+    여러 사용자 프로필 카드 일괄 조회
+    GET /api/profile/batch/?ids=1,2,3 - ids는 사용자(User) ID
+    - 로비/대결 화면에서 사용자마다 프로필을 요청하지 않도록 한 번에 반환
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        raw_ids = request.query_params.get('ids', '')
+        try:
+            user_ids = list(dict.fromkeys(
+                int(value) for value in raw_ids.split(',') if value.strip()
+            ))
+            if any(not 1 <= user_id <= USER_ID_MAX for user_id in user_ids):
+                raise ValueError
+        except ValueError:
+            return Response(
+                {'error': 'ids는 쉼표로 구분된 숫자여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(user_ids) > PROFILE_BATCH_MAX_IDS:
+            return Response(
+                {'error': f'한 번에 최대 {PROFILE_BATCH_MAX_IDS}명까지 조회할 수 있습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        cards = get_profile_cards(user_ids)
+        # 요청한 순서대로 반환 (프로필이 없는 사용자는 제외)
+        return Response([cards[user_id] for user_id in user_ids if user_id in cards])
+
+
+# 닉네임 자동완성 결과 개수 기본값 / 최대값
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 20
+# 자동완성 결과 캐시 시간 (초)
+SEARCH_CACHE_TIMEOUT = 30
+
+
+class ProfileSearchView(generics.ListAPIView):
+    """
+    닉네임 접두사 자동완성
+    GET /api/users/search/?prefix={prefix}&limit={limit}
+    - nickname_key 유니크 인덱스를 이용한 접두사 검색
+    - 같은 접두사 요청은 짧게 캐시
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = ProfileSearchSerializer
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get('limit', SEARCH_DEFAULT_LIMIT))
+        except ValueError:
+            limit = SEARCH_DEFAULT_LIMIT
+        return max(1, min(limit, SEARCH_MAX_LIMIT))
+
+    def get_queryset(self):
+        prefix = normalize_nickname(self.request.query_params.get('prefix', ''))
+        if not prefix:
+            return Profile.objects.none()
+        return Profile.objects.filter(
+            nickname_key__startswith=prefix
+        ).order_by('nickname_key').only(
+            'id', 'nickname', 'rating', 'tier'
+        )[:self.get_limit()]
+
+    def list(self, request, *args, **kwargs):
+        prefix = normalize_nickname(request.query_params.get('prefix', ''))
+        # 닉네임보다 긴 접두사는 일치하는 프로필이 없으므로 조회/캐시하지 않음
+        if not prefix or len(prefix) > Profile._meta.get_field('nickname_key').max_length:
+            return Response([])
+
+        # 캐시 키 길이가 접두사 길이와 무관하도록 해시 사용
+        digest = hashlib.sha1(prefix.encode()).hexdigest()
+        data = cached_query(
+            'users:search', f'{self.get_limit()}:{digest}',
+            lambda: self.get_serializer(self.get_queryset(), many=True).data,
+            SEARCH_CACHE_TIMEOUT
+        )
+        return Response(data)
+
+
 # ---------- Reference Data Views ----------
 
-class TitleListView(generics.ListAPIView):
+class TitleListView(FastListMixin, generics.ListAPIView):
     """칭호 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = TitleSerializer
     queryset = Title.objects.all()
+    fast_fields = ('id', 'name')
 
 
-class TechStackListView(generics.ListAPIView):
+class TechStackListView(FastListMixin, generics.ListAPIView):
     """기술스택 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = TechStackSerializer
     queryset = TechStack.objects.all()
+    fast_fields = ('id', 'name')
 
 
-class ClubListView(generics.ListAPIView):
+class ClubListView(FastListMixin, generics.ListAPIView):
     """동아리 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = ClubSerializer
-    queryset = Club.objects.all()
\ No newline at end of file
+    queryset = Club.objects.all()
+    fast_fields = ('id', 'name')
\ No newline at end of file